@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+# Named dataset shapes used by the benchmark runner.
+DATASET_PRESETS = {
+    'small': dict(rows=10_000),
+    'medium': dict(rows=200_000),
+    'large': dict(rows=1_000_000),
+    'wide': dict(rows=20_000, numeric=200, categorical=20),
+    'high_cardinality': dict(rows=200_000, cardinality=50_000),
+    'sparse': dict(rows=200_000, null_ratio=0.5),
+    'duplicated': dict(rows=200_000, duplicate_ratio=0.3),
+}
+
+
+def generate_dataset(rows=10_000, numeric=4, categorical=2, text=1, datetime=1,
+                     boolean=1, null_ratio=0.05, cardinality=50, duplicate_ratio=0.0,
+                     seed=0):
+    """
+    Generates a deterministic synthetic dataset.
+
+    Columns are named by kind and position: num_0 (float), num_1 (int), ...,
+    cat_0, text_0, date_0 (sorted timestamps, never null) and bool_0.
+
+    Args:
+        rows (int, optional): Number of rows before duplicates are added.
+        numeric (int, optional): Number of numerical columns; even ones are floats,
+            odd ones integers.
+        categorical (int, optional): Number of low-cardinality string columns.
+        text (int, optional): Number of free-text columns with case and whitespace
+            noise (near-duplicate names).
+        datetime (int, optional): Number of timestamp columns.
+        boolean (int, optional): Number of boolean columns.
+        null_ratio (float, optional): Share of missing values in each column except
+            the timestamp columns.
+        cardinality (int, optional): Number of distinct values of categorical columns.
+        duplicate_ratio (float, optional): Share of extra rows that are exact copies
+            of existing rows.
+        seed (int, optional): Random seed; the same arguments always produce the
+            same DataFrame.
+
+    Returns:
+        pd.DataFrame: The generated dataset.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+
+    for i in range(numeric):
+        if i % 2 == 0:
+            data[f'num_{i}'] = rng.normal(100.0, 15.0, rows)
+        else:
+            data[f'num_{i}'] = rng.integers(0, 1_000, rows)
+
+    categories = np.array([f'category_{j}' for j in range(cardinality)], dtype=object)
+    for i in range(categorical):
+        # Zipf-like skew so that top-k and group sizes are realistic
+        weights = 1.0 / np.arange(1, cardinality + 1)
+        data[f'cat_{i}'] = rng.choice(categories, rows, p=weights / weights.sum())
+
+    first_names = np.array(['Anna', 'Jan', 'Maria', 'Piotr', 'Kasia', 'Tomasz',
+                            'Ewa', 'Marek', 'Zofia', 'Adam'], dtype=object)
+    for i in range(text):
+        names = first_names[rng.integers(0, len(first_names), rows)] + ' ' + \
+            pd.Series(rng.integers(0, max(rows // 10, 1), rows)).astype(str).to_numpy(dtype=object)
+        noisy = rng.random(rows) < 0.1
+        names[noisy] = [f'  {name.upper()} ' for name in names[noisy]]
+        data[f'text_{i}'] = names
+
+    start = np.datetime64('2020-01-01T00:00:00')
+    for i in range(datetime):
+        offsets = np.sort(rng.integers(0, 365 * 24 * 3600, rows))
+        data[f'date_{i}'] = start + offsets.astype('timedelta64[s]')
+
+    for i in range(boolean):
+        data[f'bool_{i}'] = rng.random(rows) < 0.5
+
+    df = pd.DataFrame(data)
+
+    if null_ratio > 0:
+        for col in df.columns:
+            if col.startswith('date_'):
+                continue
+            mask = rng.random(rows) < null_ratio
+            if mask.any():
+                if col.startswith('bool_'):
+                    df[col] = df[col].astype(object)
+                df.loc[mask, col] = None
+
+    if duplicate_ratio > 0:
+        extra = rng.integers(0, rows, int(rows * duplicate_ratio))
+        df = pd.concat([df, df.iloc[extra]], ignore_index=True)
+
+    return df
+
+
+def generate_preset(name, seed=0):
+    """
+    Generates one of the DATASET_PRESETS.
+
+    Args:
+        name (str): Preset name.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: The generated dataset.
+
+    Raises:
+        ValueError: If the preset does not exist.
+    """
+    if name not in DATASET_PRESETS:
+        raise ValueError(f"Invalid dataset preset: {name}")
+    return generate_dataset(seed=seed, **DATASET_PRESETS[name])
@@ -0,0 +1,1068 @@
+import argparse
+import gc
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Benchmarks never open windows; select the headless backend before any pyplot import.
+import matplotlib
+matplotlib.use('Agg')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import modules  # noqa: E402
+from benchmarks.datasets import DATASET_PRESETS, generate_preset  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# A case is a regression if it is this much slower than the baseline...
+DEFAULT_TOLERANCE = 0.20
+# ...and the slowdown is larger than this many seconds (filters timer noise).
+MIN_ABSOLUTE_SLOWDOWN = 0.002
+# Peak memory is compared separately: flagged if it grows by this fraction...
+DEFAULT_MEMORY_TOLERANCE = 0.20
+# ...and by more than this many MB.
+MIN_ABSOLUTE_MEMORY_GROWTH = 1.0
+# Writing large workbooks takes minutes, so the Excel cases use a prefix of the data.
+EXCEL_BENCH_ROWS = 20_000
+
+# Public functions that need user interaction and cannot be benchmarked.
+SKIPPED = {
+    'data_loader.ask_data_file_path': "opens a file dialog",
+    'data_loader.load_data_from_file': "opens a file dialog",
+    'data_loader.ask_dataset_directory': "opens a directory dialog",
+    'analysis_server.serve': "runs a server until interrupted",
+}
+
+CASES = {}
+
+
+def case(name):
+    """
+    Registers a benchmark case for the public function called name.
+
+    The decorated function receives a BenchContext and returns a zero-argument
+    callable; only that callable is timed, so setup work stays outside the timing.
+    """
+    def register(func):
+        CASES[name] = func
+        return func
+    return register
+
+
+class BenchContext:
+    """Dataset and scratch directory shared by the cases of one dataset."""
+
+    def __init__(self, df, workdir):
+        self.df = df
+        self.workdir = workdir
+        self.numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        self.cat_col = 'cat_0' if 'cat_0' in df.columns else df.columns[0]
+        self.text_col = 'text_0' if 'text_0' in df.columns else self.cat_col
+        self.date_col = 'date_0' if 'date_0' in df.columns else None
+        self._csv_path = None
+        self._xlsx_path = None
+        self._dataset_path = None
+
+    @property
+    def csv_path(self):
+        """The dataset written once as CSV, for the loader benchmarks."""
+        if self._csv_path is None:
+            self._csv_path = os.path.join(self.workdir, 'dataset.csv')
+            self.df.to_csv(self._csv_path, index=False)
+        return self._csv_path
+
+    @property
+    def xlsx_path(self):
+        """The first EXCEL_BENCH_ROWS rows written once to two sheets of a workbook."""
+        if self._xlsx_path is None:
+            import pandas as pd
+            self._xlsx_path = os.path.join(self.workdir, 'dataset.xlsx')
+            head = self.df.head(EXCEL_BENCH_ROWS)
+            with pd.ExcelWriter(self._xlsx_path) as writer:
+                head.to_excel(writer, sheet_name='first', index=False)
+                head.to_excel(writer, sheet_name='second', index=False)
+        return self._xlsx_path
+
+    @property
+    def dataset_path(self):
+        """The dataset written once as Parquet files partitioned by cat_col."""
+        if self._dataset_path is None:
+            self._dataset_path = os.path.join(self.workdir, 'dataset_parts')
+            self.df.to_parquet(self._dataset_path, partition_cols=[self.cat_col],
+                               row_group_size=20_000)
+        return self._dataset_path
+
+    def path(self, name):
+        return os.path.join(self.workdir, name)
+
+
+def _close_figure(fig):
+    import matplotlib.pyplot as plt
+    plt.close(fig)
+
+
+# data_analyzer
+
+@case('data_analyzer.get_descriptive_stats')
+def _bench_descriptive_stats(ctx):
+    from modules.data_analyzer import get_descriptive_stats
+    return lambda: get_descriptive_stats(ctx.df)
+
+
+@case('data_analyzer.calculate_correlations')
+def _bench_correlations(ctx):
+    from modules.data_analyzer import calculate_correlations
+    return lambda: calculate_correlations(ctx.df)
+
+
+@case('data_analyzer.correlation_pairs')
+def _bench_correlation_pairs(ctx):
+    from modules.data_analyzer import correlation_pairs
+    return lambda: correlation_pairs(ctx.df, threshold=0.5, top_k=3, block_size=2)
+
+
+@case('data_analyzer.cluster_order')
+def _bench_cluster_order(ctx):
+    from modules.data_analyzer import calculate_correlations, cluster_order
+    corr = calculate_correlations(ctx.df)
+    return lambda: cluster_order(corr)
+
+
+@case('data_analyzer.compact_correlation_matrix')
+def _bench_compact_correlation_matrix(ctx):
+    from modules.data_analyzer import compact_correlation_matrix
+    # Fewer kept columns than numeric ones exercises the blockwise selection
+    return lambda: compact_correlation_matrix(ctx.df, max_columns=2)
+
+
+@case('data_analyzer.group_and_aggregate')
+def _bench_group_and_aggregate(ctx):
+    from modules.data_analyzer import group_and_aggregate
+    agg = {col: 'mean' for col in ctx.numeric_cols}
+    return lambda: group_and_aggregate(ctx.df, ctx.cat_col, agg)
+
+
+def _pivot_columns(ctx):
+    return 'cat_1' if 'cat_1' in ctx.df.columns else ctx.numeric_cols[1]
+
+
+@case('data_analyzer.pivot_table')
+def _bench_pivot_table(ctx):
+    from modules.data_analyzer import pivot_table
+    return lambda: pivot_table(ctx.df, ctx.cat_col, _pivot_columns(ctx),
+                               values=ctx.numeric_cols[:2], aggfunc='mean')
+
+
+@case('data_analyzer.crosstab')
+def _bench_crosstab(ctx):
+    from modules.data_analyzer import crosstab
+    return lambda: crosstab(ctx.df, ctx.cat_col, _pivot_columns(ctx), normalize='index',
+                            margins=True)
+
+
+# data_cleaner
+
+@case('data_cleaner.clean_missing_values')
+def _bench_clean_missing_values(ctx):
+    from modules.data_cleaner import clean_missing_values
+    return lambda: clean_missing_values(ctx.df, method='mean')
+
+
+@case('data_cleaner.remove_duplicates')
+def _bench_remove_duplicates(ctx):
+    from modules.data_cleaner import remove_duplicates
+    return lambda: remove_duplicates(ctx.df)
+
+
+@case('data_cleaner.normalize_text')
+def _bench_normalize_text(ctx):
+    from modules.data_cleaner import normalize_text
+    return lambda: normalize_text(ctx.df[ctx.text_col])
+
+
+@case('data_cleaner.find_near_duplicates')
+def _bench_find_near_duplicates(ctx):
+    from modules.data_cleaner import find_near_duplicates
+    return lambda: find_near_duplicates(ctx.df, subset=ctx.text_col)
+
+
+@case('data_cleaner.remove_near_duplicates')
+def _bench_remove_near_duplicates(ctx):
+    from modules.data_cleaner import remove_near_duplicates
+    return lambda: remove_near_duplicates(ctx.df, subset=[ctx.cat_col, ctx.text_col],
+                                          block_on=ctx.cat_col)
+
+
+@case('data_cleaner.outlier_bounds')
+def _bench_outlier_bounds(ctx):
+    from modules.data_cleaner import outlier_bounds
+    return lambda: outlier_bounds(ctx.df, method='mad')
+
+
+@case('data_cleaner.outlier_bounds_from_chunks')
+def _bench_outlier_bounds_from_chunks(ctx):
+    from modules.data_cleaner import outlier_bounds_from_chunks
+    from modules.data_exporter import iter_frame_chunks
+    return lambda: outlier_bounds_from_chunks(iter_frame_chunks(ctx.df, 50_000))
+
+
+@case('data_cleaner.isolation_forest_scores')
+def _bench_isolation_forest_scores(ctx):
+    from modules.data_cleaner import isolation_forest_scores
+    return lambda: isolation_forest_scores(ctx.df, ctx.numeric_cols)
+
+
+@case('data_cleaner.outlier_mask')
+def _bench_outlier_mask(ctx):
+    from modules.data_cleaner import outlier_bounds, outlier_mask
+    bounds = outlier_bounds(ctx.df)
+    return lambda: outlier_mask(ctx.df, bounds=bounds)
+
+
+@case('data_cleaner.remove_outliers')
+def _bench_remove_outliers(ctx):
+    from modules.data_cleaner import remove_outliers
+    return lambda: remove_outliers(ctx.df, method='zscore')
+
+
+@case('data_cleaner.clip_outliers')
+def _bench_clip_outliers(ctx):
+    from modules.data_cleaner import clip_outliers
+    return lambda: clip_outliers(ctx.df)
+
+
+@case('data_cleaner.filter_data')
+def _bench_filter_data(ctx):
+    from modules.data_cleaner import filter_data
+    return lambda: filter_data(ctx.df, ctx.numeric_cols[0], '>', 100)
+
+
+@case('data_cleaner.infer_datetime_format')
+def _bench_infer_datetime_format(ctx):
+    from modules.data_cleaner import infer_datetime_format
+    dates = ctx.df[ctx.date_col].astype(str)
+    return lambda: infer_datetime_format(dates)
+
+
+@case('data_cleaner.infer_conversion_type')
+def _bench_infer_conversion_type(ctx):
+    from modules.data_cleaner import infer_conversion_type
+    return lambda: infer_conversion_type(ctx.df[ctx.cat_col])
+
+
+@case('data_cleaner.convert_series_type')
+def _bench_convert_series_type(ctx):
+    from modules.data_cleaner import convert_series_type
+    text = ctx.df[ctx.numeric_cols[0]].astype(str)
+    return lambda: convert_series_type(text, 'numeric')
+
+
+@case('data_cleaner.convert_column_types')
+def _bench_convert_column_types(ctx):
+    from modules.data_cleaner import convert_column_types
+    text_df = ctx.df[ctx.numeric_cols].astype(str)
+    text_df[ctx.date_col] = ctx.df[ctx.date_col].astype(str)
+    conversions = {col: 'numeric' for col in ctx.numeric_cols}
+    conversions[ctx.date_col] = 'datetime'
+    return lambda: convert_column_types(text_df, conversions)
+
+
+# data_loader
+
+@case('data_loader.read_data_file')
+def _bench_read_data_file(ctx):
+    from modules.data_loader import read_data_file
+    path = ctx.csv_path
+    return lambda: read_data_file(path)
+
+
+@case('data_loader.iter_data_chunks')
+def _bench_iter_data_chunks(ctx):
+    from modules.data_loader import iter_data_chunks
+    path = ctx.csv_path
+    return lambda: sum(len(chunk) for chunk in iter_data_chunks(path, 50_000))
+
+
+@case('data_loader.load_npy')
+def _bench_load_npy(ctx):
+    import numpy as np
+    from modules.data_loader import load_npy
+    path = ctx.path('dataset.npy')
+    np.save(path, ctx.df[ctx.numeric_cols].to_numpy(dtype=float))
+    return lambda: load_npy(path)
+
+
+@case('data_loader.load_arrow_ipc')
+def _bench_load_arrow_ipc(ctx):
+    from modules.data_exporter import export_dataframe
+    from modules.data_loader import load_arrow_ipc
+    path = ctx.path('dataset.arrow')
+    export_dataframe(ctx.df, path)
+    return lambda: load_arrow_ipc(path)
+
+
+@case('data_loader.sniff_csv')
+def _bench_sniff_csv(ctx):
+    from modules.data_loader import sniff_csv
+    path = ctx.csv_path
+    return lambda: sniff_csv(path)
+
+
+@case('data_loader.select_csv_engine')
+def _bench_select_csv_engine(ctx):
+    from modules.data_loader import select_csv_engine
+    return select_csv_engine
+
+
+@case('data_loader.read_csv_fast')
+def _bench_read_csv_fast(ctx):
+    from modules.data_loader import read_csv_fast
+    path = ctx.csv_path
+    usecols = ctx.numeric_cols
+    return lambda: read_csv_fast(path, usecols=usecols)
+
+
+@case('data_loader.preview_schema')
+def _bench_preview_schema(ctx):
+    from modules.data_loader import preview_schema
+    path = ctx.csv_path
+    return lambda: preview_schema(path)
+
+
+@case('data_loader.load_columns')
+def _bench_load_columns(ctx):
+    from modules.data_loader import load_columns
+    path = ctx.csv_path
+    columns = ctx.numeric_cols[:1]
+    index = ctx.df.index[::2]
+    return lambda: load_columns(path, columns, index=index)
+
+
+@case('data_loader.format_load_stats')
+def _bench_format_load_stats(ctx):
+    from modules.data_loader import format_load_stats
+    stats = {'engine': 'c', 'seconds': 1.0, 'bytes': 1, 'mb_per_sec': 1.0, 'rows_per_sec': 1.0}
+    return lambda: format_load_stats(stats)
+
+
+# data_profiler
+
+@case('data_profiler.estimate_distinct')
+def _bench_estimate_distinct(ctx):
+    from modules.data_profiler import estimate_distinct
+    return lambda: estimate_distinct(ctx.df[ctx.text_col])
+
+
+@case('data_profiler.infer_semantic_type')
+def _bench_infer_semantic_type(ctx):
+    from modules.data_profiler import infer_semantic_type
+    return lambda: infer_semantic_type(ctx.df[ctx.text_col])
+
+
+@case('data_profiler.profile_column')
+def _bench_profile_column(ctx):
+    from modules.data_profiler import profile_column
+    return lambda: profile_column(ctx.df[ctx.text_col])
+
+
+@case('data_profiler.profile_dataframe')
+def _bench_profile_dataframe(ctx):
+    from modules.data_profiler import profile_dataframe
+    return lambda: profile_dataframe(ctx.df)
+
+
+@case('data_profiler.format_profile')
+def _bench_format_profile(ctx):
+    from modules.data_profiler import format_profile, profile_column
+    profile = profile_column(ctx.df[ctx.numeric_cols[0]])
+    return lambda: format_profile(profile)
+
+
+# data_visualizer
+
+@case('data_visualizer.create_histogram')
+def _bench_histogram(ctx):
+    from modules.data_visualizer import create_histogram
+    return lambda: _close_figure(create_histogram(ctx.df, ctx.numeric_cols[0], show=False))
+
+
+@case('data_visualizer.create_scatter_plot')
+def _bench_scatter(ctx):
+    from modules.data_visualizer import create_scatter_plot
+    x_col, y_col = ctx.numeric_cols[:2]
+    return lambda: _close_figure(create_scatter_plot(ctx.df, x_col, y_col, show=False))
+
+
+@case('data_visualizer.create_bar_chart')
+def _bench_bar_chart(ctx):
+    from modules.data_visualizer import create_bar_chart
+    return lambda: _close_figure(
+        create_bar_chart(ctx.df, ctx.cat_col, ctx.numeric_cols[0], show=False))
+
+
+@case('data_visualizer.create_box_plot')
+def _bench_box_plot(ctx):
+    from modules.data_visualizer import create_box_plot
+    return lambda: _close_figure(
+        create_box_plot(ctx.df, ctx.cat_col, ctx.numeric_cols[0], show=False))
+
+
+@case('data_visualizer.create_correlation_heatmap')
+def _bench_correlation_heatmap(ctx):
+    from modules.data_visualizer import create_correlation_heatmap
+    return lambda: _close_figure(create_correlation_heatmap(ctx.df, show=False))
+
+
+@case('data_visualizer.create_time_series_plot')
+def _bench_time_series(ctx):
+    from modules.data_visualizer import create_time_series_plot
+    return lambda: _close_figure(
+        create_time_series_plot(ctx.df, ctx.date_col, ctx.numeric_cols[0], show=False))
+
+
+# downsampler
+
+def _series_arrays(ctx):
+    data = ctx.df[[ctx.date_col, ctx.numeric_cols[0]]].dropna()
+    return (data[ctx.date_col].astype('int64').to_numpy(dtype=float),
+            data[ctx.numeric_cols[0]].to_numpy(dtype=float))
+
+
+@case('downsampler.lttb_downsample')
+def _bench_lttb(ctx):
+    from modules.downsampler import lttb_downsample
+    x, y = _series_arrays(ctx)
+    return lambda: lttb_downsample(x, y, 1000)
+
+
+@case('downsampler.minmax_downsample')
+def _bench_minmax(ctx):
+    from modules.downsampler import minmax_downsample
+    x, y = _series_arrays(ctx)
+    return lambda: minmax_downsample(x, y, 1000)
+
+
+@case('downsampler.downsample')
+def _bench_downsample(ctx):
+    from modules.downsampler import downsample
+    x, y = _series_arrays(ctx)
+    return lambda: downsample(x, y, 1000)
+
+
+# plot_exporter
+
+_REPORT_CHARTS = [{'type': 'histogram', 'column': 'num_0'}, {'type': 'correlation'}]
+
+
+@case('plot_exporter.expand_chart_specs')
+def _bench_expand_chart_specs(ctx):
+    from modules.plot_exporter import expand_chart_specs
+    return lambda: expand_chart_specs(ctx.df, [{'type': 'scatter', 'x_col': '*', 'y_col': '*'}])
+
+
+@case('plot_exporter.render_chart')
+def _bench_render_chart(ctx):
+    from modules.plot_exporter import render_chart
+    return lambda: _close_figure(render_chart(ctx.df, _REPORT_CHARTS[0]))
+
+
+@case('plot_exporter.export_report')
+def _bench_export_report(ctx):
+    from modules.plot_exporter import export_report
+    return lambda: export_report(ctx.df, _REPORT_CHARTS, ctx.path('report'),
+                                 formats=('png', 'pdf'))
+
+
+@case('plot_exporter.export_reports')
+def _bench_export_reports(ctx):
+    from modules.plot_exporter import export_reports
+    jobs = [{'name': 'bench', 'data': ctx.df, 'charts': _REPORT_CHARTS}]
+    return lambda: export_reports(jobs, ctx.path('reports'))
+
+
+@case('plot_exporter.export_reports_from_config')
+def _bench_export_reports_from_config(ctx):
+    from modules.plot_exporter import export_reports_from_config
+    config_path = ctx.path('export.json')
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump({'output_dir': ctx.path('config_reports'),
+                   'jobs': [{'name': 'bench', 'data': ctx.csv_path,
+                             'charts': _REPORT_CHARTS}]}, f)
+    return lambda: export_reports_from_config(config_path)
+
+
+# cleaning_pipeline
+
+@case('cleaning_pipeline.is_row_local')
+def _bench_is_row_local(ctx):
+    from modules.cleaning_pipeline import is_row_local
+    return lambda: is_row_local('convert_column_types', {'conversions': {'a': 'numeric'}})
+
+
+@case('cleaning_pipeline.CleaningPipeline.apply')
+def _bench_pipeline_apply(ctx):
+    from modules.cleaning_pipeline import CleaningPipeline
+    pipeline = CleaningPipeline()
+    pipeline.add_step('filter_data', column=ctx.numeric_cols[0], condition='>', value=90)
+    pipeline.add_step('clean_missing_values', method='drop')
+    return lambda: pipeline.apply(ctx.df)
+
+
+# data_exporter
+
+@case('data_exporter.detect_export_format')
+def _bench_detect_export_format(ctx):
+    from modules.data_exporter import detect_export_format
+    return lambda: detect_export_format('export.csv.gz')
+
+
+@case('data_exporter.iter_frame_chunks')
+def _bench_iter_frame_chunks(ctx):
+    from modules.data_exporter import iter_frame_chunks
+    return lambda: sum(len(chunk) for chunk in iter_frame_chunks(ctx.df, 10_000))
+
+
+@case('data_exporter.export_chunks')
+def _bench_export_chunks(ctx):
+    from modules.data_exporter import export_chunks, iter_frame_chunks
+    return lambda: export_chunks(iter_frame_chunks(ctx.df), ctx.path('chunks.csv.gz'))
+
+
+@case('data_exporter.export_dataframe')
+def _bench_export_dataframe(ctx):
+    from modules.data_exporter import export_dataframe
+    return lambda: export_dataframe(ctx.df, ctx.path('export.parquet'))
+
+
+@case('data_exporter.export_pipeline')
+def _bench_export_pipeline(ctx):
+    from modules.cleaning_pipeline import CleaningPipeline
+    from modules.data_exporter import export_pipeline
+    pipeline = CleaningPipeline()
+    pipeline.add_step('clean_missing_values', method='drop')
+    path = ctx.csv_path
+    return lambda: export_pipeline(path, pipeline, ctx.path('pipeline.csv'))
+
+
+@case('data_exporter.arrow_schema')
+def _bench_arrow_schema(ctx):
+    from modules.data_exporter import arrow_schema
+    return lambda: arrow_schema(ctx.df)
+
+
+@case('data_exporter.format_export_stats')
+def _bench_format_export_stats(ctx):
+    from modules.data_exporter import format_export_stats
+    stats = {'rows': 1, 'seconds': 1.0, 'rows_per_sec': 1.0, 'bytes': 1, 'mb_per_sec': 1.0}
+    return lambda: format_export_stats(stats)
+
+
+# instrumentation
+
+@case('instrumentation.current_memory_bytes')
+def _bench_current_memory_bytes(ctx):
+    from modules.instrumentation import current_memory_bytes
+    return current_memory_bytes
+
+
+@case('instrumentation.PerformanceMonitor.span')
+def _bench_monitor_span(ctx):
+    from modules.instrumentation import PerformanceMonitor
+    monitor = PerformanceMonitor()
+
+    def run():
+        for _ in range(1000):
+            with monitor.span('bench'):
+                pass
+    return run
+
+
+# excel_loader
+
+@case('excel_loader.list_sheets')
+def _bench_list_sheets(ctx):
+    from modules.excel_loader import list_sheets
+    path = ctx.xlsx_path
+    return lambda: list_sheets(path)
+
+
+@case('excel_loader.parse_cell_range')
+def _bench_parse_cell_range(ctx):
+    from modules.excel_loader import parse_cell_range
+    return lambda: parse_cell_range('B2:F1000')
+
+
+@case('excel_loader.iter_excel_chunks')
+def _bench_iter_excel_chunks(ctx):
+    from modules.excel_loader import iter_excel_chunks
+    path = ctx.xlsx_path
+    return lambda: sum(len(chunk) for chunk in iter_excel_chunks(path, chunk_size=5_000))
+
+
+@case('excel_loader.excel_cache_path')
+def _bench_excel_cache_path(ctx):
+    from modules.excel_loader import excel_cache_path
+    path = ctx.xlsx_path
+    return lambda: excel_cache_path(path, 'first')
+
+
+@case('excel_loader.read_excel_fast')
+def _bench_read_excel_fast(ctx):
+    from modules.excel_loader import read_excel_fast
+    path, cache_dir = ctx.xlsx_path, ctx.path('excel_cache')
+    # Warm the cache: the timed call measures the cached (memory-mapped) path
+    read_excel_fast(path, cache_dir=cache_dir)
+    return lambda: read_excel_fast(path, cache_dir=cache_dir)
+
+
+@case('excel_loader.read_excel_sheets')
+def _bench_read_excel_sheets(ctx):
+    from modules.excel_loader import read_excel_sheets
+    path = ctx.xlsx_path
+    return lambda: read_excel_sheets(path, use_cache=False)
+
+
+@case('excel_loader.clear_excel_cache')
+def _bench_clear_excel_cache(ctx):
+    from modules.excel_loader import clear_excel_cache
+    return lambda: clear_excel_cache(ctx.path('excel_cache'))
+
+
+# dataset_loader
+
+@case('dataset_loader.discover_dataset')
+def _bench_discover_dataset(ctx):
+    from modules.dataset_loader import discover_dataset
+    path = ctx.dataset_path
+    return lambda: discover_dataset(path)
+
+
+@case('dataset_loader.may_match')
+def _bench_may_match(ctx):
+    from modules.dataset_loader import may_match
+    return lambda: [may_match(i, i + 10, '>=', 500) for i in range(1000)]
+
+
+def _dataset_filters(ctx):
+    # One partition column filter and one filter pruned by row-group statistics
+    value = ctx.df[ctx.cat_col].dropna().iloc[0]
+    column = ctx.numeric_cols[0]
+    return [{'column': ctx.cat_col, 'condition': '==', 'value': value},
+            {'column': column, 'condition': '>', 'value': float(ctx.df[column].quantile(0.9))}]
+
+
+@case('dataset_loader.iter_dataset_chunks')
+def _bench_iter_dataset_chunks(ctx):
+    from modules.dataset_loader import iter_dataset_chunks
+    path, filters = ctx.dataset_path, _dataset_filters(ctx)
+    return lambda: sum(len(chunk) for chunk in iter_dataset_chunks(path, filters=filters))
+
+
+@case('dataset_loader.read_dataset')
+def _bench_read_dataset(ctx):
+    from modules.dataset_loader import read_dataset
+    path = ctx.dataset_path
+    return lambda: read_dataset(path)
+
+
+@case('dataset_loader.format_dataset_stats')
+def _bench_format_dataset_stats(ctx):
+    from modules.dataset_loader import format_dataset_stats
+    stats = {'files_total': 10, 'files_read': 2, 'row_groups_total': 8,
+             'row_groups_read': 3, 'rows': 100, 'seconds': 0.1}
+    return lambda: format_dataset_stats(stats)
+
+
+# window_analyzer
+
+@case('window_analyzer.parse_window')
+def _bench_parse_window(ctx):
+    from modules.window_analyzer import parse_window
+    return lambda: (parse_window('50'), parse_window('5min'))
+
+
+@case('window_analyzer.rolling_stats')
+def _bench_rolling_stats(ctx):
+    from modules.window_analyzer import rolling_stats
+    return lambda: rolling_stats(ctx.df, ctx.numeric_cols, 100, funcs=['mean', 'max', 'std'])
+
+
+@case('window_analyzer.rolling_correlation')
+def _bench_rolling_correlation(ctx):
+    from modules.window_analyzer import rolling_correlation
+    x_col, y_col = ctx.numeric_cols[:2]
+    return lambda: rolling_correlation(ctx.df, x_col, y_col, '1D', on=ctx.date_col,
+                                       by=ctx.cat_col)
+
+
+@case('window_analyzer.resample_time')
+def _bench_resample_time(ctx):
+    from modules.window_analyzer import resample_time
+    return lambda: resample_time(ctx.df, ctx.date_col, '1h', by=ctx.cat_col)
+
+
+def _window_chunks(ctx):
+    from modules.data_exporter import iter_frame_chunks
+    return iter_frame_chunks(ctx.df, 50_000)
+
+
+@case('window_analyzer.iter_rolling_stats')
+def _bench_iter_rolling_stats(ctx):
+    from modules.window_analyzer import iter_rolling_stats
+    return lambda: sum(len(part) for part in iter_rolling_stats(
+        _window_chunks(ctx), ctx.numeric_cols, '1h', on=ctx.date_col))
+
+
+@case('window_analyzer.iter_rolling_correlation')
+def _bench_iter_rolling_correlation(ctx):
+    from modules.window_analyzer import iter_rolling_correlation
+    x_col, y_col = ctx.numeric_cols[:2]
+    return lambda: sum(len(part) for part in iter_rolling_correlation(
+        _window_chunks(ctx), x_col, y_col, 100))
+
+
+@case('window_analyzer.iter_resample')
+def _bench_iter_resample(ctx):
+    from modules.window_analyzer import iter_resample
+    return lambda: sum(len(part) for part in iter_resample(
+        _window_chunks(ctx), ctx.date_col, '1h', by=ctx.cat_col))
+
+
+# facet_dashboard
+
+@case('facet_dashboard.compute_facet_summaries')
+def _bench_compute_facet_summaries(ctx):
+    from modules.facet_dashboard import compute_facet_summaries
+    return lambda: compute_facet_summaries(ctx.df, ctx.cat_col, ctx.numeric_cols[0])
+
+
+def _facet_summaries(ctx):
+    from modules.facet_dashboard import compute_facet_summaries
+    return compute_facet_summaries(ctx.df, ctx.cat_col, ctx.numeric_cols[0])
+
+
+@case('facet_dashboard.render_facet_panels')
+def _bench_render_facet_panels(ctx):
+    from modules.facet_dashboard import render_facet_panels
+    summaries = _facet_summaries(ctx)
+    return lambda: render_facet_panels(summaries, kind='box', value_col=ctx.numeric_cols[0])
+
+
+@case('facet_dashboard.compose_panels')
+def _bench_compose_panels(ctx):
+    from modules.facet_dashboard import compose_panels, render_facet_panels
+    images = render_facet_panels(_facet_summaries(ctx), max_workers=1)
+    return lambda: compose_panels(images)
+
+
+@case('facet_dashboard.create_facet_dashboard')
+def _bench_create_facet_dashboard(ctx):
+    from modules.facet_dashboard import create_facet_dashboard
+    return lambda: _close_figure(create_facet_dashboard(
+        ctx.df, ctx.cat_col, ctx.numeric_cols[0], show=False))
+
+
+# analysis_server
+
+@case('analysis_server.frame_to_json')
+def _bench_frame_to_json(ctx):
+    from modules.analysis_server import frame_to_json
+    return lambda: frame_to_json(ctx.df.head(1000))
+
+
+@case('analysis_server.frame_from_json')
+def _bench_frame_from_json(ctx):
+    from modules.analysis_server import frame_from_json, frame_to_json
+    data = frame_to_json(ctx.df.head(1000))
+    return lambda: frame_from_json(data)
+
+
+# session_store
+
+@case('session_store.save_session')
+def _bench_save_session(ctx):
+    from modules.cleaning_pipeline import CleaningPipeline
+    from modules.session_store import save_session
+    pipeline = CleaningPipeline()
+    pipeline.add_step('clean_missing_values', method='drop')
+    return lambda: save_session(ctx.path('session'), ctx.df, ctx.df, pipeline)
+
+
+@case('session_store.load_session')
+def _bench_load_session(ctx):
+    from modules.session_store import load_session, save_session
+    save_session(ctx.path('session'), ctx.df)
+    return lambda: load_session(ctx.path('session'))
+
+
+@case('session_store.session_info')
+def _bench_session_info(ctx):
+    from modules.session_store import save_session, session_info
+    save_session(ctx.path('session'), ctx.df.head(1000))
+    return lambda: session_info(ctx.path('session'))
+
+
+# result_table
+
+@case('result_table.format_cells')
+def _bench_format_cells(ctx):
+    from modules.result_table import format_cells
+    rows = range(len(ctx.df) // 2, len(ctx.df) // 2 + 40)
+    return lambda: format_cells(ctx.df, rows, range(len(ctx.df.columns)))
+
+
+@case('result_table.sort_order')
+def _bench_sort_order(ctx):
+    from modules.result_table import sort_order
+    column = ctx.df.columns.get_loc(ctx.numeric_cols[0])
+    return lambda: sort_order(ctx.df, column, ascending=False)
+
+
+@case('result_table.search_rows')
+def _bench_search_rows(ctx):
+    from modules.result_table import search_rows
+    return lambda: search_rows(ctx.df, 'anna')
+
+
+@case('result_table.format_label')
+def _bench_format_label(ctx):
+    from modules.result_table import format_label
+    return lambda: [format_label(('category', i, None)) for i in range(1000)]
+
+
+# Run in a fresh interpreter; prints the seconds until 'import main' returns and
+# until the first window frame is drawn ('None' when no display is available).
+_STARTUP_SCRIPT = '''
+import time
+start = time.perf_counter()
+import main
+imported = time.perf_counter() - start
+shown = None
+try:
+    app = main.DataAnalysisApp()
+    app.update()
+    shown = time.perf_counter() - start
+    app.destroy()
+except Exception:
+    pass
+print(imported, shown)
+'''
+
+
+STARTUP_CASES = ('startup:import_main', 'startup:first_window')
+
+
+def measure_cold_start(repeat=3):
+    """
+    Measures application cold-start time in fresh interpreters.
+
+    Args:
+        repeat (int, optional): Number of interpreter launches. Defaults to 3.
+
+    Returns:
+        dict: Maps 'startup:import_main' and, when a display is available,
+        'startup:first_window' to timing results in the run_benchmarks format.
+    """
+    samples = {key: [] for key in STARTUP_CASES}
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _STARTUP_SCRIPT], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        imported, shown = output.split()[-2:]
+        samples['startup:import_main'].append(float(imported))
+        if shown != 'None':
+            samples['startup:first_window'].append(float(shown))
+    return {key: {'min': min(values), 'mean': sum(values) / len(values), 'peak_mb': 0.0}
+            for key, values in samples.items() if values}
+
+
+def discover_public_functions():
+    """
+    Lists the public module-level functions defined in the modules package.
+
+    Returns:
+        list of str: Names such as 'data_cleaner.filter_data'.
+    """
+    names = []
+    for info in pkgutil.iter_modules(modules.__path__):
+        module = importlib.import_module(f'modules.{info.name}')
+        for attr, obj in inspect.getmembers(module, inspect.isfunction):
+            if not attr.startswith('_') and obj.__module__ == module.__name__:
+                names.append(f'{info.name}.{attr}')
+    return sorted(names)
+
+
+def time_callable(func, repeat=3):
+    """
+    Times a callable.
+
+    Args:
+        func (callable): Zero-argument callable to time.
+        repeat (int, optional): Number of timed runs. Defaults to 3.
+
+    Returns:
+        dict: 'min' and 'mean' wall-clock seconds and 'peak_mb', the peak traced
+        Python/NumPy allocation of one extra run under tracemalloc.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'min': min(timings), 'mean': sum(timings) / len(timings),
+            'peak_mb': peak / 1e6}
+
+
+def run_benchmarks(datasets=('small',), name_filter=None, repeat=3, verbose=True):
+    """
+    Runs every registered case on every requested dataset preset.
+
+    Args:
+        datasets (iterable of str, optional): DATASET_PRESETS names. Defaults to ('small',).
+        name_filter (str, optional): Only run cases whose name contains this string.
+        repeat (int, optional): Timed runs per case. Defaults to 3.
+        verbose (bool, optional): Print each result as it is measured.
+
+    Returns:
+        dict: Maps 'dataset:case' keys to timing results (see time_callable), or to
+        {'error': message} for cases that raised.
+    """
+    results = {}
+    for dataset in datasets:
+        df = generate_preset(dataset)
+        workdir = tempfile.mkdtemp(prefix='bench_')
+        try:
+            ctx = BenchContext(df, workdir)
+            for name, make_case in sorted(CASES.items()):
+                if name_filter and name_filter not in name:
+                    continue
+                key = f'{dataset}:{name}'
+                try:
+                    results[key] = time_callable(make_case(ctx), repeat=repeat)
+                except Exception as e:
+                    results[key] = {'error': f'{type(e).__name__}: {e}'}
+                if verbose:
+                    print(format_result(key, results[key]))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def format_result(key, result):
+    if 'error' in result:
+        return f'{key:<70} ERROR {result["error"]}'
+    return (f'{key:<70} {result["min"] * 1000:>10.2f} ms '
+            f'{result["peak_mb"]:>9.1f} MB peak')
+
+
+def compare_to_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE,
+                        memory_tolerance=DEFAULT_MEMORY_TOLERANCE):
+    """
+    Compares results with a stored baseline.
+
+    Args:
+        results (dict): Output of run_benchmarks.
+        baseline (dict): A previous output of run_benchmarks.
+        tolerance (float, optional): Allowed relative slowdown. Defaults to 0.20.
+        memory_tolerance (float, optional): Allowed relative growth of the peak
+            memory. Defaults to 0.20.
+
+    Returns:
+        list of tuple: (key, metric, baseline value, current value) for every
+        regression; metric is 'min' (seconds) or 'peak_mb'.
+    """
+    limits = [('min', tolerance, MIN_ABSOLUTE_SLOWDOWN),
+              ('peak_mb', memory_tolerance, MIN_ABSOLUTE_MEMORY_GROWTH)]
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if not old or 'error' in old or 'error' in result:
+            continue
+        for metric, relative, absolute in limits:
+            if metric not in old:
+                continue
+            if result[metric] > old[metric] * (1 + relative) \
+                    and result[metric] - old[metric] > absolute:
+                regressions.append((key, metric, old[metric], result[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the modules package.")
+    parser.add_argument('--datasets', nargs='+', default=['small'],
+                        choices=sorted(DATASET_PRESETS), help="Dataset presets to run on.")
+    parser.add_argument('--filter', default=None, help="Only run cases containing this text.")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per case.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Store the results as the new baseline.")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a case is flagged.")
+    parser.add_argument('--memory-tolerance', type=float, default=DEFAULT_MEMORY_TOLERANCE,
+                        help="Allowed relative peak memory growth before a case is flagged.")
+    args = parser.parse_args(argv)
+
+    uncovered = [name for name in discover_public_functions()
+                 if name not in CASES and name not in SKIPPED]
+    if uncovered:
+        print("Public functions without a benchmark case:")
+        for name in uncovered:
+            print(f"  - {name}")
+
+    results = {}
+    if not args.filter or any(args.filter in key for key in STARTUP_CASES):
+        for key, result in measure_cold_start(args.repeat).items():
+            if not args.filter or args.filter in key:
+                results[key] = result
+                print(format_result(key, result))
+    results.update(run_benchmarks(args.datasets, args.filter, args.repeat))
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.tolerance,
+                                      args.memory_tolerance)
+    for key, metric, old, new in regressions:
+        if metric == 'peak_mb':
+            change = f"{old:.1f} MB -> {new:.1f} MB peak"
+        else:
+            change = f"{old * 1000:.2f} ms -> {new * 1000:.2f} ms"
+        growth = f"{(new / old - 1) * 100:+.0f}%" if old else "new"
+        print(f"REGRESSION {key}: {change} ({growth})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,17 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
+import importlib
 import os
+import queue
 import sys
-
-# Import our custom modules
-from modules.data_loader import load_data_from_file
-from modules.data_cleaner import clean_missing_values, remove_duplicates, filter_data
-from modules.data_analyzer import get_descriptive_stats, calculate_correlations, group_and_aggregate
-from modules.data_visualizer import create_histogram, create_scatter_plot, create_bar_chart, create_box_plot
+import threading
+import time
+
+# Only lightweight modules are imported at startup. pandas, matplotlib, seaborn
+# and the modules that depend on them are imported inside the handlers that use
+# them, and pre-loaded by a background thread once the window is shown.
+from modules.instrumentation import monitor
+from modules.result_table import ResultTable
+
+# Imported in this order by the startup warm-up thread
+WARMUP_MODULES = [
+    "numpy",
+    "pandas",
+    "modules.data_loader",
+    "modules.data_cleaner",
+    "modules.data_analyzer",
+    "modules.data_profiler",
+    "modules.cleaning_pipeline",
+    "modules.data_exporter",
+    "matplotlib.pyplot",
+    "matplotlib.backends.backend_tkagg",
+    "seaborn",
+    "modules.data_visualizer",
+]
 
 
 class DataAnalysisApp(tk.Tk):
@@ -22,6 +38,20 @@ class DataAnalysisApp(tk.Tk):
         self.geometry("1200x800")
         self.df = None
         self.cleaned_df = None
+        # Bumped whenever self.df is replaced; keys the column profile cache
+        self.data_version = 0
+        self.profile_cache = None
+        # Recipe of the cleaning steps applied to cleaned_df since loading
+        self.cleaning_pipeline = None
+        # File the data was loaded from, its Excel sheet/range and all of its
+        # columns; only the selected columns are in df
+        self.source_path = None
+        self.source_options = {}
+        self.source_columns = []
+        # Same keys for the file shown in the schema preview, until it is loaded
+        self.preview_source = None
+        # filter_data conditions applied while loading (pushed down for datasets)
+        self.load_filters = []
 
         # Set up the tab control
         self.tab_control = ttk.Notebook(self)
@@ -32,6 +62,7 @@ class DataAnalysisApp(tk.Tk):
         self.analysis_tab = ttk.Frame(self.tab_control)
         self.visualization_tab = ttk.Frame(self.tab_control)
         self.dashboard_tab = ttk.Frame(self.tab_control)
+        self.performance_tab = ttk.Frame(self.tab_control)
 
         # Add tabs to the notebook
         self.tab_control.add(self.load_tab, text="Load Data")
@@ -39,6 +70,7 @@ class DataAnalysisApp(tk.Tk):
         self.tab_control.add(self.analysis_tab, text="Analysis")
         self.tab_control.add(self.visualization_tab, text="Visualization")
         self.tab_control.add(self.dashboard_tab, text="Dashboard")
+        self.tab_control.add(self.performance_tab, text="Performance")
 
         self.tab_control.pack(expand=1, fill="both")
 
@@ -48,6 +80,7 @@ class DataAnalysisApp(tk.Tk):
         self.setup_analysis_tab()
         self.setup_visualization_tab()
         self.setup_dashboard_tab()
+        self.setup_performance_tab()
 
         # Status bar
         self.status_var = tk.StringVar()
@@ -56,13 +89,108 @@ class DataAnalysisApp(tk.Tk):
             self, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Load the heavy libraries once the window is on screen
+        self.warmup_done = threading.Event()
+        self.after(100, self.start_warmup)
+
+        # Offer to keep the session when the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def start_warmup(self):
+        self.status_var.set("Loading libraries...")
+        start = time.perf_counter()
+
+        def warm_up():
+            with monitor.span("startup.warmup", "startup"):
+                for name in WARMUP_MODULES:
+                    try:
+                        importlib.import_module(name)
+                    except Exception:
+                        pass  # Reported when the handler needing it imports it
+            self.warmup_seconds = time.perf_counter() - start
+            self.warmup_done.set()
+
+        threading.Thread(target=warm_up, daemon=True).start()
+        self.after(100, self.poll_warmup)
+
+    def poll_warmup(self):
+        if not self.warmup_done.is_set():
+            self.after(100, self.poll_warmup)
+        elif self.status_var.get() == "Loading libraries...":
+            self.status_var.set(f"Ready (libraries loaded in {self.warmup_seconds:.1f}s)")
+
     def setup_load_tab(self):
         # Load tab layout
         frame = ttk.LabelFrame(self.load_tab, text="Load Data")
         frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        ttk.Button(frame, text="Load CSV/Excel File",
-                   command=self.load_file).pack(pady=20)
+        load_buttons = ttk.Frame(frame)
+        load_buttons.pack(pady=20)
+        ttk.Button(load_buttons, text="Load CSV/Excel File",
+                   command=self.load_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(load_buttons, text="Load Partitioned Dataset (Folder)",
+                   command=self.load_dataset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(load_buttons, text="Save Session",
+                   command=self.save_session).pack(side=tk.LEFT, padx=5)
+        ttk.Button(load_buttons, text="Restore Session",
+                   command=self.restore_session).pack(side=tk.LEFT, padx=5)
+
+        # Excel sheet and cell range, used when previewing and loading workbooks
+        excel_frame = ttk.Frame(frame)
+        excel_frame.pack(fill="x", padx=10)
+
+        ttk.Label(excel_frame, text="Sheet:").pack(side=tk.LEFT, padx=5)
+        self.sheet_combo = ttk.Combobox(excel_frame, state="readonly", width=25)
+        self.sheet_combo.pack(side=tk.LEFT, padx=5)
+        self.sheet_combo.bind("<<ComboboxSelected>>", lambda event: self.preview_file())
+
+        ttk.Label(excel_frame, text="Cell Range (e.g. A1:F1000):").pack(side=tk.LEFT, padx=5)
+        self.cell_range = ttk.Entry(excel_frame, width=15)
+        self.cell_range.pack(side=tk.LEFT, padx=5)
+        ttk.Button(excel_frame, text="Refresh Preview",
+                   command=self.preview_file).pack(side=tk.LEFT, padx=5)
+
+        # Column selection, filled from the schema preview
+        columns_frame = ttk.LabelFrame(frame, text="Columns to Load")
+        columns_frame.pack(fill="x", padx=10, pady=5)
+
+        self.columns_listbox = tk.Listbox(
+            columns_frame, selectmode=tk.EXTENDED, exportselection=False, height=6)
+        self.columns_listbox.pack(fill="x", expand=True, side=tk.LEFT, padx=5, pady=5)
+        columns_vsb = ttk.Scrollbar(columns_frame, orient="vertical",
+                                    command=self.columns_listbox.yview)
+        columns_vsb.pack(side=tk.LEFT, fill=tk.Y)
+        self.columns_listbox.configure(yscrollcommand=columns_vsb.set)
+
+        columns_buttons = ttk.Frame(columns_frame)
+        columns_buttons.pack(side=tk.LEFT, padx=5)
+        ttk.Button(columns_buttons, text="Select All",
+                   command=lambda: self.columns_listbox.selection_set(0, tk.END)).pack(fill="x", pady=2)
+        ttk.Button(columns_buttons, text="Select None",
+                   command=lambda: self.columns_listbox.selection_clear(0, tk.END)).pack(fill="x", pady=2)
+        ttk.Button(columns_buttons, text="Load Selected Columns",
+                   command=self.load_selected_columns).pack(fill="x", pady=2)
+
+        # Row filters applied while loading; for Parquet files and partitioned
+        # datasets, partitions and row groups that cannot match are never read
+        load_filter_frame = ttk.LabelFrame(frame, text="Row Filters (applied while loading)")
+        load_filter_frame.pack(fill="x", padx=10, pady=5)
+
+        self.load_filter_column = ttk.Combobox(load_filter_frame, width=20)
+        self.load_filter_column.pack(side=tk.LEFT, padx=5, pady=5)
+        self.load_filter_condition = ttk.Combobox(
+            load_filter_frame, values=["==", "!=", ">", "<", ">=", "<=", "in", "not in"], width=7)
+        self.load_filter_condition.current(0)
+        self.load_filter_condition.pack(side=tk.LEFT, padx=5, pady=5)
+        self.load_filter_value = ttk.Entry(load_filter_frame, width=20)
+        self.load_filter_value.pack(side=tk.LEFT, padx=5, pady=5)
+        ttk.Button(load_filter_frame, text="Add Filter",
+                   command=self.add_load_filter).pack(side=tk.LEFT, padx=5)
+        ttk.Button(load_filter_frame, text="Clear Filters",
+                   command=self.clear_load_filters).pack(side=tk.LEFT, padx=5)
+        self.load_filters_var = tk.StringVar(value="No filters")
+        ttk.Label(load_filter_frame, textvariable=self.load_filters_var).pack(
+            side=tk.LEFT, padx=5)
 
         # Data preview frame
         preview_frame = ttk.LabelFrame(frame, text="Data Preview")
@@ -130,8 +258,21 @@ class DataAnalysisApp(tk.Tk):
         self.dup_subset = ttk.Entry(dup_frame)
         self.dup_subset.grid(row=1, column=1, padx=5, pady=5)
 
+        # Exact rows, rows equal after text normalization, or near-duplicates
+        ttk.Label(dup_frame, text="Match:").grid(row=2, column=0, padx=5, pady=5)
+        self.dup_match = ttk.Combobox(
+            dup_frame, values=["exact", "normalized text", "fuzzy text"], state="readonly")
+        self.dup_match.current(0)
+        self.dup_match.grid(row=2, column=1, padx=5, pady=5)
+
+        ttk.Label(dup_frame, text="Fuzzy Similarity (0-1):").grid(
+            row=3, column=0, padx=5, pady=5)
+        self.dup_threshold = ttk.Entry(dup_frame)
+        self.dup_threshold.insert(0, "0.8")
+        self.dup_threshold.grid(row=3, column=1, padx=5, pady=5)
+
         ttk.Button(dup_frame, text="Apply", command=self.remove_dups).grid(
-            row=2, column=0, columnspan=2, pady=10)
+            row=4, column=0, columnspan=2, pady=10)
 
         # Filter data
         filter_frame = ttk.LabelFrame(frame, text="Filter Data")
@@ -157,6 +298,62 @@ class DataAnalysisApp(tk.Tk):
         ttk.Button(filter_frame, text="Apply", command=self.filter_dataframe).grid(
             row=3, column=0, columnspan=2, pady=10)
 
+        # Data type conversion
+        convert_frame = ttk.LabelFrame(frame, text="Convert Data Types")
+        convert_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ttk.Label(convert_frame, text="Column:").grid(
+            row=0, column=0, padx=5, pady=5)
+        self.convert_column = ttk.Combobox(convert_frame)
+        self.convert_column.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(convert_frame, text="Target Type:").grid(
+            row=0, column=2, padx=5, pady=5)
+        self.convert_type = ttk.Combobox(
+            convert_frame, values=["auto"])
+        self.convert_type.current(0)
+        self.convert_type.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(convert_frame, text="Date Format (optional):").grid(
+            row=1, column=0, padx=5, pady=5)
+        self.convert_date_format = ttk.Entry(convert_frame)
+        self.convert_date_format.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Button(convert_frame, text="Apply", command=self.convert_types).grid(
+            row=1, column=2, columnspan=2, pady=10)
+
+        # Outlier handling
+        outlier_frame = ttk.LabelFrame(frame, text="Handle Outliers")
+        outlier_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ttk.Label(outlier_frame, text="Method:").grid(
+            row=0, column=0, padx=5, pady=5)
+        self.outlier_method = ttk.Combobox(
+            outlier_frame, values=["iqr", "zscore", "mad", "isolation_forest"],
+            state="readonly")
+        self.outlier_method.current(0)
+        self.outlier_method.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(outlier_frame, text="Action:").grid(
+            row=0, column=2, padx=5, pady=5)
+        self.outlier_action = ttk.Combobox(
+            outlier_frame, values=["remove rows", "clip values"], state="readonly")
+        self.outlier_action.current(0)
+        self.outlier_action.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(outlier_frame, text="Columns (comma-separated, empty = all numeric):").grid(
+            row=1, column=0, padx=5, pady=5)
+        self.outlier_columns = ttk.Entry(outlier_frame)
+        self.outlier_columns.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Label(outlier_frame, text="Factor (optional):").grid(
+            row=1, column=2, padx=5, pady=5)
+        self.outlier_factor = ttk.Entry(outlier_frame)
+        self.outlier_factor.grid(row=1, column=3, padx=5, pady=5)
+
+        ttk.Button(outlier_frame, text="Apply", command=self.handle_outliers).grid(
+            row=2, column=0, columnspan=4, pady=10)
+
         # Cleansed data preview
         preview_frame = ttk.LabelFrame(frame, text="Cleansed Data Preview")
         preview_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -194,8 +391,8 @@ class DataAnalysisApp(tk.Tk):
         ttk.Button(stats_frame, text="Generate", command=self.show_descriptive_stats).grid(
             row=1, column=0, columnspan=2, pady=10)
 
-        # Statistics result
-        self.stats_result = tk.Text(stats_frame, height=10)
+        # Statistics result; results are paged, sortable and searchable
+        self.stats_result = ResultTable(stats_frame)
         self.stats_result.grid(row=2, column=0, columnspan=2,
                                padx=5, pady=5, sticky="nsew")
 
@@ -210,12 +407,25 @@ class DataAnalysisApp(tk.Tk):
         self.corr_method.current(0)
         self.corr_method.grid(row=0, column=1, padx=5, pady=5)
 
+        # Wide data: only the strongest pairs, computed in column blocks
+        ttk.Label(corr_frame, text="Output:").grid(row=0, column=2, padx=5, pady=5)
+        self.corr_output = ttk.Combobox(
+            corr_frame, values=["full matrix", "pairs above threshold", "top-k per column",
+                                "clustered matrix"], state="readonly")
+        self.corr_output.current(0)
+        self.corr_output.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(corr_frame, text="Threshold / k:").grid(row=0, column=4, padx=5, pady=5)
+        self.corr_limit = ttk.Entry(corr_frame, width=8)
+        self.corr_limit.insert(0, "0.8")
+        self.corr_limit.grid(row=0, column=5, padx=5, pady=5)
+
         ttk.Button(corr_frame, text="Generate", command=self.show_correlations).grid(
-            row=1, column=0, columnspan=2, pady=10)
+            row=1, column=0, columnspan=6, pady=10)
 
         # Correlation result
-        self.corr_result = tk.Text(corr_frame, height=10)
-        self.corr_result.grid(row=2, column=0, columnspan=2,
+        self.corr_result = ResultTable(corr_frame)
+        self.corr_result.grid(row=2, column=0, columnspan=6,
                               padx=5, pady=5, sticky="nsew")
 
         # Group and aggregate
@@ -236,10 +446,106 @@ class DataAnalysisApp(tk.Tk):
             row=2, column=0, columnspan=2, pady=10)
 
         # Aggregation result
-        self.agg_result = tk.Text(agg_frame, height=10)
+        self.agg_result = ResultTable(agg_frame)
         self.agg_result.grid(row=3, column=0, columnspan=2,
                              padx=5, pady=5, sticky="nsew")
 
+        # Pivot tables and crosstabs
+        pivot_frame = ttk.LabelFrame(frame, text="Pivot Table / Crosstab")
+        pivot_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ttk.Label(pivot_frame, text="Mode:").grid(row=0, column=0, padx=5, pady=5)
+        self.pivot_mode = ttk.Combobox(pivot_frame, values=["Pivot table", "Crosstab"],
+                                       state="readonly")
+        self.pivot_mode.current(0)
+        self.pivot_mode.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(pivot_frame, text="Rows (comma-separated):").grid(
+            row=0, column=2, padx=5, pady=5)
+        self.pivot_rows = ttk.Entry(pivot_frame)
+        self.pivot_rows.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(pivot_frame, text="Columns (comma-separated):").grid(
+            row=1, column=0, padx=5, pady=5)
+        self.pivot_columns = ttk.Entry(pivot_frame)
+        self.pivot_columns.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Label(pivot_frame, text="Values (comma-separated):").grid(
+            row=1, column=2, padx=5, pady=5)
+        self.pivot_values = ttk.Entry(pivot_frame)
+        self.pivot_values.grid(row=1, column=3, padx=5, pady=5)
+
+        ttk.Label(pivot_frame, text="Function:").grid(row=2, column=0, padx=5, pady=5)
+        self.pivot_func = ttk.Combobox(
+            pivot_frame, values=["sum", "mean", "count", "min", "max", "std", "var"],
+            state="readonly")
+        self.pivot_func.current(0)
+        self.pivot_func.grid(row=2, column=1, padx=5, pady=5)
+
+        ttk.Label(pivot_frame, text="Normalize (crosstab):").grid(
+            row=2, column=2, padx=5, pady=5)
+        self.pivot_normalize = ttk.Combobox(
+            pivot_frame, values=["none", "all", "index", "columns"], state="readonly")
+        self.pivot_normalize.current(0)
+        self.pivot_normalize.grid(row=2, column=3, padx=5, pady=5)
+
+        self.pivot_long = tk.BooleanVar(value=False)
+        ttk.Checkbutton(pivot_frame, text="Long format (one row per cell)",
+                        variable=self.pivot_long).grid(row=3, column=0, columnspan=2,
+                                                       padx=5, pady=5, sticky="w")
+        self.pivot_margins = tk.BooleanVar(value=False)
+        ttk.Checkbutton(pivot_frame, text="Totals (crosstab)",
+                        variable=self.pivot_margins).grid(row=3, column=2, columnspan=2,
+                                                          padx=5, pady=5, sticky="w")
+
+        ttk.Button(pivot_frame, text="Generate", command=self.show_pivot).grid(
+            row=4, column=0, columnspan=4, pady=10)
+
+        # Only the visible cells of the result are formatted
+        self.pivot_result = ResultTable(pivot_frame)
+        self.pivot_result.grid(row=5, column=0, columnspan=4, padx=5, pady=5, sticky="nsew")
+
+        # Rolling windows and time resampling
+        window_frame = ttk.LabelFrame(frame, text="Rolling / Windowed Analysis")
+        window_frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        ttk.Label(window_frame, text="Mode:").grid(row=0, column=0, padx=5, pady=5)
+        self.window_mode = ttk.Combobox(
+            window_frame, values=["Rolling statistics", "Rolling correlation", "Time resampling"])
+        self.window_mode.current(0)
+        self.window_mode.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(window_frame, text="Columns (comma-separated):").grid(
+            row=0, column=2, padx=5, pady=5)
+        self.window_columns = ttk.Entry(window_frame)
+        self.window_columns.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(window_frame, text="Window / Bucket (e.g. 50, 5min, 1h):").grid(
+            row=1, column=0, padx=5, pady=5)
+        self.window_size = ttk.Entry(window_frame)
+        self.window_size.insert(0, "50")
+        self.window_size.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Label(window_frame, text="Function:").grid(row=1, column=2, padx=5, pady=5)
+        self.window_func = ttk.Combobox(window_frame)
+        self.window_func.grid(row=1, column=3, padx=5, pady=5)
+
+        ttk.Label(window_frame, text="Time Column:").grid(row=2, column=0, padx=5, pady=5)
+        self.window_time_col = ttk.Combobox(window_frame)
+        self.window_time_col.grid(row=2, column=1, padx=5, pady=5)
+
+        ttk.Label(window_frame, text="Group By (comma-separated):").grid(
+            row=2, column=2, padx=5, pady=5)
+        self.window_group = ttk.Entry(window_frame)
+        self.window_group.grid(row=2, column=3, padx=5, pady=5)
+
+        ttk.Button(window_frame, text="Generate", command=self.show_window_analysis).grid(
+            row=3, column=0, columnspan=4, pady=10)
+
+        self.window_result = ResultTable(window_frame)
+        self.window_result.grid(row=4, column=0, columnspan=4,
+                                padx=5, pady=5, sticky="nsew")
+
     def setup_visualization_tab(self):
         # Visualization tab layout
         frame = ttk.LabelFrame(self.visualization_tab,
@@ -252,7 +558,7 @@ class DataAnalysisApp(tk.Tk):
         # Chart type selection
         ttk.Label(controls_frame, text="Chart Type:").pack(anchor="w", pady=5)
         self.chart_type = ttk.Combobox(controls_frame, values=[
-                                       "Histogram", "Scatter Plot", "Bar Chart", "Box Plot"])
+                                       "Histogram", "Scatter Plot", "Bar Chart", "Box Plot", "Time Series"])
         self.chart_type.current(0)
         self.chart_type.pack(fill="x", pady=5)
         self.chart_type.bind("<<ComboboxSelected>>", self.update_chart_options)
@@ -326,18 +632,248 @@ class DataAnalysisApp(tk.Tk):
         ttk.Button(controls_frame, text="Save Dashboard",
                    command=self.save_dashboard).pack(fill="x", pady=5)
 
+        # Small multiples: one panel per value of a category column
+        ttk.Separator(controls_frame).pack(fill="x", pady=10)
+        ttk.Label(controls_frame, text="Small Multiples").pack(anchor="w", pady=5)
+        ttk.Label(controls_frame, text="Facet by:").pack(anchor="w")
+        self.facet_column = ttk.Combobox(controls_frame, state="readonly")
+        self.facet_column.pack(fill="x", pady=2)
+        ttk.Label(controls_frame, text="Value column:").pack(anchor="w")
+        self.facet_value_column = ttk.Combobox(controls_frame, state="readonly")
+        self.facet_value_column.pack(fill="x", pady=2)
+        ttk.Label(controls_frame, text="Chart:").pack(anchor="w")
+        self.facet_kind = ttk.Combobox(controls_frame, values=["histogram", "box"],
+                                       state="readonly")
+        self.facet_kind.current(0)
+        self.facet_kind.pack(fill="x", pady=2)
+        ttk.Button(controls_frame, text="Generate Small Multiples",
+                   command=self.generate_facet_dashboard).pack(fill="x", pady=10)
+
         # Dashboard canvas
         self.dashboard_canvas_frame = ttk.Frame(frame)
         self.dashboard_canvas_frame.pack(
             side=tk.RIGHT, fill="both", expand=True, padx=10, pady=10)
 
+    def setup_performance_tab(self):
+        # Performance tab layout
+        frame = ttk.LabelFrame(self.performance_tab, text="Recent Operations")
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        controls_frame = ttk.Frame(frame)
+        controls_frame.pack(fill="x", padx=5, pady=5)
+
+        ttk.Button(controls_frame, text="Refresh",
+                   command=self.update_performance_view).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls_frame, text="Clear",
+                   command=self.clear_performance_records).pack(side=tk.LEFT, padx=5)
+        self.profile_button = ttk.Button(controls_frame, text="Start Profiling",
+                                         command=self.toggle_profiling)
+        self.profile_button.pack(side=tk.LEFT, padx=5)
+
+        # Treeview with one row per recorded span, newest first
+        columns = ("time", "operation", "category", "duration", "memory", "thread")
+        self.performance_tree = ttk.Treeview(
+            frame, columns=columns, show="headings")
+        headings = {"time": "Time", "operation": "Operation", "category": "Category",
+                    "duration": "Duration (ms)", "memory": "Memory \u0394 (MB)",
+                    "thread": "Thread"}
+        for col in columns:
+            self.performance_tree.heading(col, text=headings[col])
+            self.performance_tree.column(
+                col, width=300 if col == "operation" else 110)
+        self.performance_tree.pack(fill="both", expand=True, side=tk.LEFT)
+
+        vsb = ttk.Scrollbar(frame, orient="vertical",
+                            command=self.performance_tree.yview)
+        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.performance_tree.configure(yscrollcommand=vsb.set)
+
+        # Totals per operation
+        summary_frame = ttk.LabelFrame(self.performance_tab, text="Summary")
+        summary_frame.pack(fill="x", padx=10, pady=10)
+        self.performance_summary = tk.Text(summary_frame, height=8)
+        self.performance_summary.pack(fill="both", expand=True)
+
+        self.tab_control.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+    def on_tab_changed(self, event):
+        if self.tab_control.select() == str(self.performance_tab):
+            self.update_performance_view()
+
+    # Performance tab functions
+    def update_performance_view(self):
+        for item in self.performance_tree.get_children():
+            self.performance_tree.delete(item)
+
+        for record in reversed(monitor.get_records()):
+            memory = record["memory_delta"]
+            memory = f"{memory / 1e6:+.1f}" if memory is not None else ""
+            name = "  " * record["depth"] + record["name"]
+            if record["error"]:
+                name += f" ({record['error']})"
+            self.performance_tree.insert("", "end", values=(
+                time.strftime("%H:%M:%S", time.localtime(record["started_at"])),
+                name, record["category"], f"{record['duration'] * 1000:.1f}",
+                memory, record["thread"]))
+
+        summary = sorted(monitor.summary().items(),
+                         key=lambda item: item[1]["total"], reverse=True)
+        self.performance_summary.delete(1.0, tk.END)
+        for name, entry in summary:
+            self.performance_summary.insert(
+                tk.END, f"{name}: {entry['count']} call(s), total {entry['total'] * 1000:.1f} ms, "
+                f"mean {entry['mean'] * 1000:.1f} ms, max {entry['max'] * 1000:.1f} ms\n")
+
+    def clear_performance_records(self):
+        monitor.clear()
+        self.update_performance_view()
+
+    def toggle_profiling(self):
+        if not monitor.is_profiling:
+            monitor.start_profiling()
+            self.profile_button.configure(text="Stop Profiling and Save")
+            self.status_var.set("cProfile capture started")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".prof",
+            filetypes=[("Profile files", "*.prof")]
+        )
+        try:
+            monitor.stop_profiling(file_path or None)
+            self.status_var.set(
+                f"Profile saved to {file_path}" if file_path else "Profiling stopped")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save profile: {str(e)}")
+        self.profile_button.configure(text="Start Profiling")
+
     # Load tab functions
     def load_file(self):
-        self.df = load_data_from_file()
+        from modules.data_loader import ask_data_file_path
+        from modules.excel_loader import STREAMABLE_EXTENSIONS, list_sheets
+
+        file_path = ask_data_file_path()
+        if not file_path:
+            self.status_var.set("Data loading canceled or failed")
+            return
+
+        sheets = []
+        if file_path.lower().endswith(STREAMABLE_EXTENSIONS):
+            try:
+                sheets = list_sheets(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"An error occurred: {e}")
+                return
+        self.sheet_combo['values'] = sheets
+        if sheets:
+            self.sheet_combo.current(0)
+        else:
+            self.sheet_combo.set("")
+        self.cell_range.delete(0, tk.END)
+        self.clear_load_filters()
+
+        self.preview_source = {'path': file_path, 'options': {}, 'columns': []}
+        self.preview_file()
+
+    def load_dataset(self):
+        from modules.data_loader import ask_dataset_directory
+
+        directory = ask_dataset_directory()
+        if not directory:
+            self.status_var.set("Data loading canceled or failed")
+            return
+
+        self.sheet_combo['values'] = []
+        self.sheet_combo.set("")
+        self.cell_range.delete(0, tk.END)
+        self.clear_load_filters()
+        self.preview_source = {'path': directory, 'options': {}, 'columns': []}
+        self.preview_file()
+
+    def add_load_filter(self):
+        column = self.load_filter_column.get()
+        condition = self.load_filter_condition.get()
+        if not column:
+            messagebox.showerror("Error", "No filter column selected")
+            return
+        value = self.parse_filter_value(condition, self.load_filter_value.get())
+        self.load_filters.append({'column': column, 'condition': condition, 'value': value})
+        self.load_filters_var.set(
+            " AND ".join(f"{f['column']} {f['condition']} {f['value']!r}" for f in self.load_filters))
+
+    def clear_load_filters(self):
+        self.load_filters = []
+        self.load_filters_var.set("No filters")
+
+    def preview_file(self):
+        from modules.data_loader import preview_schema
+
+        if self.preview_source is None:
+            return
+
+        file_path = self.preview_source['path']
+        options = {'sheet_name': self.sheet_combo.get() or None,
+                   'cell_range': self.cell_range.get().strip() or None}
+
+        # Only the header and a sample are parsed until the user picks columns
+        try:
+            with monitor.span("data_loader.preview_schema"):
+                sample = preview_schema(file_path, **options)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+            return
+
+        self.preview_source = {'path': file_path, 'options': options,
+                               'columns': list(sample.columns)}
+        self.load_filter_column['values'] = list(sample.columns)
+        self.columns_listbox.delete(0, tk.END)
+        for col, dtype in sample.dtypes.items():
+            self.columns_listbox.insert(tk.END, f"{col} ({dtype})")
+        self.columns_listbox.selection_set(0, tk.END)
+        self.update_data_preview(sample)
+        self.status_var.set(
+            f"Schema preview: {len(sample.columns)} columns. "
+            "Select the columns to load and click 'Load Selected Columns'")
+
+    def load_selected_columns(self):
+        from modules.cleaning_pipeline import CleaningPipeline
+        from modules.data_loader import read_data_file, format_load_stats
+        from modules.dataset_loader import format_dataset_stats
+
+        if self.preview_source is None:
+            messagebox.showerror("Error", "No file selected")
+            return
+
+        source = self.preview_source
+        selected = [source['columns'][i] for i in self.columns_listbox.curselection()]
+        if not selected:
+            messagebox.showerror("Error", "No columns selected")
+            return
+        usecols = None if len(selected) == len(source['columns']) else selected
+        options = dict(source['options'], filters=list(self.load_filters) or None)
+
+        try:
+            with monitor.span("data_loader.read_data_file"):
+                self.df = read_data_file(source['path'], usecols=usecols, **options)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+            self.df = None
+
         if self.df is not None:
-            self.cleaned_df = self.df.copy()  # Initialize cleaned_df with the original data
-            self.status_var.set(
-                f"Data loaded: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+            self.source_path = source['path']
+            self.source_options = options
+            self.source_columns = source['columns']
+            self.data_version += 1
+            # Initialize cleaned_df with the original data. A shallow copy keeps
+            # memory-mapped data mapped; cleaning steps always build new frames.
+            self.cleaned_df = self.df.copy(deep=False)
+            self.cleaning_pipeline = CleaningPipeline()
+            status = f"Data loaded: {self.df.shape[0]} rows, {self.df.shape[1]} columns"
+            if "load_stats" in self.df.attrs:
+                status += f" ({format_load_stats(self.df.attrs['load_stats'])})"
+            if "dataset_stats" in self.df.attrs:
+                status += f" ({format_dataset_stats(self.df.attrs['dataset_stats'])})"
+            self.status_var.set(status)
             self.update_data_preview()
             self.update_data_info()
             self.update_column_dropdowns()
@@ -345,30 +881,189 @@ class DataAnalysisApp(tk.Tk):
         else:
             self.status_var.set("Data loading canceled or failed")
 
-    def update_data_preview(self):
+    def session_arguments(self):
+        # Frames, recipe and state written by session_store.save_session; the
+        # cleaned data is only stored when cleaning steps changed it
+        return {'df': self.df,
+                'cleaned_df': self.cleaned_df if len(self.cleaning_pipeline) else None,
+                'pipeline': self.cleaning_pipeline,
+                'state': {'source_path': self.source_path,
+                          'source_options': self.source_options,
+                          'source_columns': self.source_columns,
+                          'load_filters': self.load_filters}}
+
+    def save_session(self):
+        from modules.session_store import DEFAULT_SESSION_DIR, save_session
+
+        if self.df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        os.makedirs(DEFAULT_SESSION_DIR, exist_ok=True)
+        session_dir = filedialog.askdirectory(title="Select Session Folder",
+                                              initialdir=DEFAULT_SESSION_DIR)
+        if not session_dir:
+            return
+
+        # Write the snapshot in the background so the UI stays responsive
+        result = queue.Queue()
+        arguments = self.session_arguments()
+
+        def run_save():
+            try:
+                with monitor.span("session_store.save_session"):
+                    result.put(("done", save_session(session_dir, **arguments)))
+            except Exception as e:
+                result.put(("error", e))
+
+        threading.Thread(target=run_save, daemon=True).start()
+        self.status_var.set(f"Saving session to {session_dir}...")
+        self.after(100, self.poll_session_save, result, session_dir)
+
+    def poll_session_save(self, result, session_dir):
+        try:
+            kind, payload = result.get_nowait()
+        except queue.Empty:
+            self.after(100, self.poll_session_save, result, session_dir)
+            return
+        if kind == "done":
+            self.status_var.set(
+                f"Session saved to {session_dir} "
+                f"({payload['bytes'] / 1e6:,.1f} MB in {payload['seconds']:.2f}s)")
+        else:
+            self.status_var.set("Saving the session failed")
+            messagebox.showerror("Error", f"Failed to save session: {str(payload)}")
+
+    def restore_session(self):
+        from modules.session_store import DEFAULT_SESSION_DIR, MANIFEST_NAME, load_session
+
+        manifest = filedialog.askopenfilename(
+            title="Select Session",
+            initialdir=DEFAULT_SESSION_DIR if os.path.isdir(DEFAULT_SESSION_DIR) else None,
+            filetypes=[("Session", MANIFEST_NAME)])
+        if not manifest:
+            return
+
+        try:
+            with monitor.span("session_store.load_session"):
+                session = load_session(os.path.dirname(manifest))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to restore session: {str(e)}")
+            return
+
+        state = session['state']
+        self.df = session['df']
+        self.cleaned_df = session['cleaned_df']
+        self.cleaning_pipeline = session['pipeline']
+        self.source_path = state.get('source_path')
+        self.source_options = state.get('source_options') or {}
+        self.source_columns = state.get('source_columns') or []
+        self.load_filters = state.get('load_filters') or []
+        self.load_filters_var.set(
+            " AND ".join(f"{f['column']} {f['condition']} {f['value']!r}"
+                         for f in self.load_filters) or "No filters")
+        self.preview_source = None
+        self.data_version += 1
+
+        self.update_data_preview()
+        self.update_data_info()
+        self.update_column_dropdowns()
+        self.update_cleansed_preview()
+        self.status_var.set(
+            f"Session restored in {session['seconds']:.2f}s: {self.df.shape[0]} rows, "
+            f"{self.df.shape[1]} columns, {len(self.cleaning_pipeline)} cleaning step(s)")
+
+    def on_close(self):
+        if self.df is not None:
+            answer = messagebox.askyesnocancel(
+                "Save Session", "Save the current session to resume it later?")
+            if answer is None:
+                return
+            if answer:
+                from modules.session_store import DEFAULT_SESSION_DIR, save_session
+
+                self.status_var.set("Saving session...")
+                self.update_idletasks()
+                try:
+                    with monitor.span("session_store.save_session"):
+                        save_session(DEFAULT_SESSION_DIR, **self.session_arguments())
+                except Exception as e:
+                    if not messagebox.askyesno(
+                            "Error", f"Failed to save session: {str(e)}\n\nClose anyway?"):
+                        return
+        self.destroy()
+
+    def available_columns(self):
+        # Columns of the source file, including those not loaded yet
+        if self.source_columns:
+            return list(self.source_columns)
+        return list(self.df.columns) if self.df is not None else []
+
+    def ensure_columns(self, columns):
+        # Loads columns skipped at load time into df and cleaned_df. The cleaning
+        # pipeline is replayed on the widened frame; its steps record the columns
+        # they were applied to, so the new columns do not change which rows are kept.
+        from modules.data_loader import load_columns
+
+        missing = [col for col in columns
+                   if col in self.source_columns and col not in self.df.columns]
+        if not missing:
+            return
+
+        with monitor.span("data_loader.load_columns"):
+            extra = load_columns(self.source_path, missing, index=self.df.index,
+                                 **self.source_options)
+        attrs = self.df.attrs
+        df = self.df.join(extra)
+        self.df = df[[col for col in self.source_columns if col in df.columns]]
+        self.df.attrs = attrs
+        with monitor.span("cleaning_pipeline.apply"):
+            self.cleaned_df = self.cleaning_pipeline.apply(self.df.copy(deep=False))
+        self.data_version += 1
+
+        # Reflect the new columns in the column list if it still shows this source
+        if self.preview_source == {'path': self.source_path, 'options': self.source_options,
+                                   'columns': self.source_columns}:
+            loaded = set(self.df.columns)
+            for i, col in enumerate(self.source_columns):
+                if col in loaded:
+                    self.columns_listbox.selection_set(i)
+        self.update_data_preview()
+        self.update_data_info()
+        self.update_cleansed_preview()
+        self.status_var.set(f"Loaded additional column(s): {', '.join(map(str, missing))}")
+
+    @monitor.timed()
+    def update_data_preview(self, df=None):
         # Clear existing data
         for item in self.preview_tree.get_children():
             self.preview_tree.delete(item)
 
-        if self.df is None:
+        # Shows the loaded data, or the schema sample before loading
+        if df is None:
+            df = self.df
+        if df is None:
             return
 
         # Configure columns
-        self.preview_tree["columns"] = list(self.df.columns)
+        self.preview_tree["columns"] = list(df.columns)
         self.preview_tree["show"] = "headings"
 
-        for col in self.df.columns:
+        for col in df.columns:
             self.preview_tree.heading(col, text=col)
             self.preview_tree.column(col, width=100)
 
         # Add data rows (limit to first 100 rows for performance)
-        for i, row in self.df.head(100).iterrows():
+        for i, row in df.head(100).iterrows():
             values = row.tolist()
             # Convert any non-string values to strings
             values = [str(v) if v is not None else "" for v in values]
             self.preview_tree.insert("", "end", values=values)
 
+    @monitor.timed()
     def update_data_info(self):
+        from modules.data_profiler import profile_dataframe, format_profile, ProfileCache
+
         if self.df is None:
             return
 
@@ -381,31 +1076,94 @@ class DataAnalysisApp(tk.Tk):
 
         # Add column info
         info += "Column Information:\n"
-        for col in self.df.columns:
-            dtype = self.df[col].dtype
-            missing = self.df[col].isna().sum()
-            pct_missing = (missing / len(self.df)) * 100
-            info += f"- {col}: {dtype}, Missing: {missing} ({pct_missing:.2f}%)\n"
-
         self.info_text.insert(tk.END, info)
 
+        if self.profile_cache is None:
+            self.profile_cache = ProfileCache()
+        cached = self.profile_cache.get(self.data_version)
+        if cached is not None:
+            for profile in cached.values():
+                self.info_text.insert(tk.END, format_profile(profile))
+            return
+
+        # Profile columns in the background and show each one as it finishes
+        results = queue.Queue()
+        df, version = self.df, self.data_version
+
+        def run_profiling():
+            try:
+                with monitor.span("data_profiler.profile_dataframe"):
+                    profiles = profile_dataframe(
+                        df, callback=lambda p: results.put(("column", p)))
+                results.put(("done", profiles))
+            except Exception as e:
+                results.put(("error", e))
+
+        threading.Thread(target=run_profiling, daemon=True).start()
+        self.status_var.set("Profiling columns...")
+        self.after(50, self.poll_profile_results, results, version)
+
+    def poll_profile_results(self, results, version):
+        from modules.data_profiler import format_profile
+
+        if version != self.data_version:
+            return  # A newer dataset was loaded; drop stale results
+
+        while True:
+            try:
+                kind, payload = results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "column":
+                self.info_text.insert(tk.END, format_profile(payload))
+            elif kind == "done":
+                self.profile_cache.put(version, payload)
+                self.status_var.set(
+                    f"Profiled {len(payload)} columns")
+                return
+            else:
+                self.status_var.set(f"Profiling failed: {payload}")
+                return
+
+        self.after(50, self.poll_profile_results, results, version)
+
     def update_column_dropdowns(self):
         if self.df is None:
             return
 
-        # Update all dropdown menus with the current column names
-        columns = list(self.df.columns)
+        # Update all dropdown menus with the column names, including columns that
+        # are loaded on first use
+        columns = self.available_columns()
 
         # Update filter column dropdown
         self.filter_column['values'] = columns
         if columns:
             self.filter_column.current(0)
 
+        # Update type conversion dropdowns
+        from modules.data_cleaner import CONVERSION_TYPES
+        self.convert_type['values'] = CONVERSION_TYPES
+        self.convert_column['values'] = ["(all text columns)"] + columns
+        self.convert_column.current(0)
+
+        # Update windowed analysis dropdowns
+        from modules.window_analyzer import RESAMPLE_FUNCTIONS
+        self.window_func['values'] = RESAMPLE_FUNCTIONS
+        self.window_func.current(0)
+        self.window_time_col['values'] = ["(row order)"] + columns
+        self.window_time_col.current(0)
+
+        # Update small-multiple dashboard dropdowns
+        self.facet_column['values'] = columns
+        self.facet_value_column['values'] = columns
+
         # Clear and update visualization tab options
         self.update_chart_options(None)
 
     # Cleanse tab functions
     def handle_missing_values(self):
+        from modules.data_cleaner import clean_missing_values
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -428,8 +1186,13 @@ class DataAnalysisApp(tk.Tk):
                 return
 
         try:
-            self.cleaned_df = clean_missing_values(
-                self.cleaned_df, method=method, fill_value=fill_value)
+            # Record the current columns so that a replay ignores columns loaded later
+            columns = list(self.cleaned_df.columns)
+            with monitor.span("data_cleaner.clean_missing_values"):
+                self.cleaned_df = clean_missing_values(
+                    self.cleaned_df, method=method, fill_value=fill_value, columns=columns)
+            self.cleaning_pipeline.add_step(
+                "clean_missing_values", method=method, fill_value=fill_value, columns=columns)
             self.update_cleansed_preview()
             self.status_var.set(
                 f"Missing values handled using method: {method}")
@@ -439,6 +1202,8 @@ class DataAnalysisApp(tk.Tk):
             messagebox.showerror("Error", str(e))
 
     def remove_dups(self):
+        from modules.data_cleaner import remove_duplicates, remove_near_duplicates
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -451,9 +1216,28 @@ class DataAnalysisApp(tk.Tk):
         subset = None if not subset_str else [
             col.strip() for col in subset_str.split(',')]
 
+        match = self.dup_match.get()
+
         try:
-            self.cleaned_df = remove_duplicates(
-                self.cleaned_df, subset=subset, keep=keep)
+            if subset:
+                self.ensure_columns(subset)
+            else:
+                # Record the current columns so that a replay ignores columns loaded later
+                subset = list(self.cleaned_df.columns)
+            if match == "exact":
+                with monitor.span("data_cleaner.remove_duplicates"):
+                    self.cleaned_df = remove_duplicates(
+                        self.cleaned_df, subset=subset, keep=keep)
+                self.cleaning_pipeline.add_step(
+                    "remove_duplicates", subset=subset, keep=keep)
+            else:
+                threshold = 1.0 if match == "normalized text" else float(
+                    self.dup_threshold.get())
+                with monitor.span("data_cleaner.remove_near_duplicates"):
+                    self.cleaned_df = remove_near_duplicates(
+                        self.cleaned_df, subset=subset, threshold=threshold, keep=keep)
+                self.cleaning_pipeline.add_step(
+                    "remove_near_duplicates", subset=subset, threshold=threshold, keep=keep)
             self.update_cleansed_preview()
             self.status_var.set(
                 f"Duplicates removed: {self.df.shape[0] - self.cleaned_df.shape[0]} rows")
@@ -462,14 +1246,31 @@ class DataAnalysisApp(tk.Tk):
             messagebox.showerror("Error", str(e))
 
     def filter_dataframe(self):
+        from modules.data_cleaner import filter_data
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
 
         column = self.filter_column.get()
         condition = self.filter_condition.get()
-        value_str = self.filter_value.get()
+        value = self.parse_filter_value(condition, self.filter_value.get())
+
+        try:
+            self.ensure_columns([column])
+            with monitor.span("data_cleaner.filter_data"):
+                self.cleaned_df = filter_data(
+                    self.cleaned_df, column, condition, value)
+            self.cleaning_pipeline.add_step(
+                "filter_data", column=column, condition=condition, value=value)
+            self.update_cleansed_preview()
+            self.status_var.set(
+                f"Data filtered: {self.cleaned_df.shape[0]} rows remaining")
+            messagebox.showinfo("Success", "Data filtered successfully")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
 
+    def parse_filter_value(self, condition, value_str):
         # Process value based on condition
         value = value_str
         if condition in ["in", "not in"]:
@@ -483,17 +1284,101 @@ class DataAnalysisApp(tk.Tk):
             except ValueError:
                 # Keep as string if not numeric
                 pass
+        return value
+
+    def convert_types(self):
+        from modules.data_cleaner import convert_column_types
+
+        if self.cleaned_df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        column = self.convert_column.get()
+        target = self.convert_type.get()
+        if column == "(all text columns)":
+            columns = self.cleaned_df.select_dtypes(
+                include=['object', 'string']).columns.tolist()
+        else:
+            columns = [column]
+        conversions = {col: target for col in columns}
+
+        date_format = self.convert_date_format.get().strip()
+        datetime_formats = {col: date_format for col in columns} if date_format else None
 
         try:
-            self.cleaned_df = filter_data(
-                self.cleaned_df, column, condition, value)
+            self.ensure_columns(columns)
+            with monitor.span("data_cleaner.convert_column_types"):
+                self.cleaned_df, report = convert_column_types(
+                    self.cleaned_df, conversions, datetime_formats=datetime_formats)
+            self.cleaning_pipeline.add_step(
+                "convert_column_types", conversions=conversions,
+                datetime_formats=datetime_formats)
             self.update_cleansed_preview()
+            failed = {col: n for col, n in report.items() if n}
             self.status_var.set(
-                f"Data filtered: {self.cleaned_df.shape[0]} rows remaining")
-            messagebox.showinfo("Success", "Data filtered successfully")
+                f"Converted {len(report)} column(s) to {target}, "
+                f"{sum(failed.values())} value(s) could not be converted")
+            if failed:
+                details = "\n".join(f"- {col}: {n}" for col, n in failed.items())
+                messagebox.showwarning(
+                    "Conversion", f"Values that could not be converted (set to missing):\n{details}")
+            else:
+                messagebox.showinfo("Success", "Data types converted successfully")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def handle_outliers(self):
+        from modules.data_cleaner import (outlier_bounds, outlier_mask, remove_outliers,
+                                          clip_outliers)
+
+        if self.cleaned_df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        method = self.outlier_method.get()
+        action = self.outlier_action.get()
+        columns = [col.strip() for col in self.outlier_columns.get().split(',')
+                   if col.strip()] or None
+        factor_str = self.outlier_factor.get().strip()
+
+        try:
+            factor = float(factor_str) if factor_str else None
+            if columns:
+                self.ensure_columns(columns)
+            if method == "isolation_forest":
+                if action == "clip values":
+                    raise ValueError("Isolation forest has no bounds to clip to")
+                if columns is None:
+                    # Record the current columns so that a replay ignores columns loaded later
+                    columns = self.cleaned_df.select_dtypes(include=['number']).columns.tolist()
+                rows_before = len(self.cleaned_df)
+                with monitor.span("data_cleaner.remove_outliers"):
+                    self.cleaned_df = remove_outliers(self.cleaned_df, columns=columns,
+                                                      method=method, factor=factor)
+                count = rows_before - len(self.cleaned_df)
+                self.cleaning_pipeline.add_step(
+                    "remove_outliers", columns=columns, method=method, factor=factor)
+            else:
+                # Fixed bounds make the recorded step replayable chunk by chunk
+                with monitor.span("data_cleaner.outlier_bounds"):
+                    bounds = outlier_bounds(self.cleaned_df, columns=columns, method=method,
+                                            factor=factor)
+                    mask = outlier_mask(self.cleaned_df, bounds=bounds)
+                count = int(mask.sum())
+                op = "remove_outliers" if action == "remove rows" else "clip_outliers"
+                with monitor.span(f"data_cleaner.{op}"):
+                    if op == "remove_outliers":
+                        self.cleaned_df = self.cleaned_df[~mask.to_numpy()]
+                    else:
+                        self.cleaned_df = clip_outliers(self.cleaned_df, bounds=bounds)
+                self.cleaning_pipeline.add_step(op, bounds=bounds)
+            self.update_cleansed_preview()
+            verb = "clipped" if action == "clip values" else "removed"
+            self.status_var.set(f"Outliers ({method}): {count} rows {verb}")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
+    @monitor.timed()
     def update_cleansed_preview(self):
         # Clear existing data
         for item in self.cleansed_preview_tree.get_children():
@@ -518,27 +1403,70 @@ class DataAnalysisApp(tk.Tk):
             self.cleansed_preview_tree.insert("", "end", values=values)
 
     def save_cleansed_data(self):
+        from modules.data_exporter import export_dataframe
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No cleansed data to save")
             return
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx")]
+            filetypes=[("CSV files", "*.csv"), ("Gzip CSV files", "*.csv.gz"),
+                       ("Zstandard CSV files", "*.csv.zst"),
+                       ("Parquet files", "*.parquet"), ("Feather files", "*.feather"),
+                       ("Excel files", "*.xlsx")]
         )
 
         if file_path:
+            # Export in the background so the UI stays responsive
+            progress = queue.Queue()
+            df = self.cleaned_df
+
+            def report_progress(rows, seconds):
+                progress.put(("progress", (rows, seconds)))
+
+            def run_export():
+                try:
+                    with monitor.span("data_exporter.export_dataframe"):
+                        stats = export_dataframe(
+                            df, file_path, progress_callback=report_progress)
+                    progress.put(("done", stats))
+                except Exception as e:
+                    progress.put(("error", e))
+
+            threading.Thread(target=run_export, daemon=True).start()
+            self.status_var.set(f"Exporting to {file_path}...")
+            self.after(100, self.poll_export_progress, progress, file_path, len(df))
+
+    def poll_export_progress(self, progress, file_path, total_rows):
+        from modules.data_exporter import format_export_stats
+
+        while True:
             try:
-                if file_path.endswith('.csv'):
-                    self.cleaned_df.to_csv(file_path, index=False)
-                else:
-                    self.cleaned_df.to_excel(file_path, index=False)
+                kind, payload = progress.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                rows, seconds = payload
+                self.status_var.set(
+                    f"Exporting: {rows}/{total_rows} rows "
+                    f"({rows / max(seconds, 1e-9):,.0f} rows/s)")
+            elif kind == "done":
+                self.status_var.set(f"Exported {format_export_stats(payload)}")
                 messagebox.showinfo("Success", f"Data saved to {file_path}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+                return
+            else:
+                self.status_var.set("Export failed")
+                messagebox.showerror("Error", f"Failed to save data: {str(payload)}")
+                return
+
+        self.after(100, self.poll_export_progress, progress, file_path, total_rows)
 
     # Analysis tab functions
+    @monitor.timed()
     def show_descriptive_stats(self):
+        from modules.data_analyzer import get_descriptive_stats
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -550,38 +1478,54 @@ class DataAnalysisApp(tk.Tk):
             include = 'object'
 
         try:
-            stats_df = get_descriptive_stats(self.cleaned_df, include=include)
-
-            # Clear previous results
-            self.stats_result.delete(1.0, tk.END)
+            with monitor.span("data_analyzer.get_descriptive_stats"):
+                stats_df = get_descriptive_stats(self.cleaned_df, include=include)
 
             # Display results
-            self.stats_result.insert(tk.END, stats_df.to_string())
+            self.stats_result.show(stats_df)
             self.status_var.set("Descriptive statistics generated")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    @monitor.timed()
     def show_correlations(self):
+        from modules.data_analyzer import (calculate_correlations, compact_correlation_matrix,
+                                           correlation_pairs)
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
 
         method = self.corr_method.get()
+        output = self.corr_output.get()
 
         try:
-            corr_df = calculate_correlations(self.cleaned_df, method=method)
-
-            # Clear previous results
-            self.corr_result.delete(1.0, tk.END)
+            if output == "pairs above threshold":
+                with monitor.span("data_analyzer.correlation_pairs"):
+                    corr_df = correlation_pairs(self.cleaned_df, method=method,
+                                                threshold=float(self.corr_limit.get()))
+            elif output == "top-k per column":
+                with monitor.span("data_analyzer.correlation_pairs"):
+                    corr_df = correlation_pairs(self.cleaned_df, method=method,
+                                                top_k=int(self.corr_limit.get()))
+            elif output == "clustered matrix":
+                with monitor.span("data_analyzer.compact_correlation_matrix"):
+                    corr_df = compact_correlation_matrix(self.cleaned_df, method=method)
+            else:
+                with monitor.span("data_analyzer.calculate_correlations"):
+                    corr_df = calculate_correlations(self.cleaned_df, method=method)
 
             # Display results
-            self.corr_result.insert(tk.END, corr_df.to_string())
+            self.corr_result.show(corr_df)
             self.status_var.set(
-                f"Correlation matrix generated using {method} method")
+                f"Correlations ({output}) generated using {method} method")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    @monitor.timed()
     def show_aggregation(self):
+        from modules.data_analyzer import group_and_aggregate
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -612,17 +1556,106 @@ class DataAnalysisApp(tk.Tk):
             agg_dict[col] = func
 
         try:
-            agg_df = group_and_aggregate(self.cleaned_df, group_cols, agg_dict)
-
-            # Clear previous results
-            self.agg_result.delete(1.0, tk.END)
+            self.ensure_columns(group_cols + list(agg_dict))
+            with monitor.span("data_analyzer.group_and_aggregate"):
+                agg_df = group_and_aggregate(self.cleaned_df, group_cols, agg_dict)
 
             # Display results
-            self.agg_result.insert(tk.END, agg_df.to_string())
+            self.agg_result.show(agg_df)
             self.status_var.set(f"Data aggregated by {group_cols_str}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    @monitor.timed()
+    def show_pivot(self):
+        from modules.data_analyzer import pivot_table, crosstab
+
+        if self.cleaned_df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        def parse(entry):
+            return [col.strip() for col in entry.get().split(',') if col.strip()]
+
+        mode = self.pivot_mode.get()
+        rows, columns, values = (parse(self.pivot_rows), parse(self.pivot_columns),
+                                 parse(self.pivot_values))
+        if not rows:
+            messagebox.showerror("Error", "Pivot rows not specified")
+            return
+
+        try:
+            self.ensure_columns(rows + columns + values)
+            if mode == "Crosstab":
+                normalize = self.pivot_normalize.get()
+                with monitor.span("data_analyzer.crosstab"):
+                    result = crosstab(self.cleaned_df, rows, columns,
+                                      normalize=None if normalize == "none" else normalize,
+                                      margins=self.pivot_margins.get())
+            else:
+                # A single value column keeps the column keys as the only header
+                with monitor.span("data_analyzer.pivot_table"):
+                    result = pivot_table(
+                        self.cleaned_df, rows, columns or None,
+                        values=values[0] if len(values) == 1 else values or None,
+                        aggfunc=self.pivot_func.get(), long_format=self.pivot_long.get())
+
+            self.pivot_result.show(result)
+            self.status_var.set(
+                f"{mode}: {result.shape[0]:,} rows x {result.shape[1]:,} columns")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
+    @monitor.timed()
+    def show_window_analysis(self):
+        from modules.window_analyzer import (parse_window, rolling_stats, rolling_correlation,
+                                             resample_time)
+
+        if self.cleaned_df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        mode = self.window_mode.get()
+        func = self.window_func.get()
+        columns = [col.strip() for col in self.window_columns.get().split(',') if col.strip()]
+        by = [col.strip() for col in self.window_group.get().split(',') if col.strip()] or None
+        time_col = self.window_time_col.get()
+        time_col = None if time_col in ("", "(row order)") else time_col
+
+        try:
+            self.ensure_columns(columns + (by or []) + ([time_col] if time_col else []))
+            df = self.cleaned_df
+            if time_col is not None and not df[time_col].is_monotonic_increasing:
+                df = df.sort_values(time_col, kind="stable")
+
+            with monitor.span(f"window_analyzer.{mode}"):
+                if mode == "Time resampling":
+                    if time_col is None:
+                        raise ValueError("Select a time column for resampling")
+                    result = resample_time(df, time_col, self.window_size.get().strip(),
+                                           agg=func, columns=columns or None, by=by)
+                elif mode == "Rolling correlation":
+                    if len(columns) != 2:
+                        raise ValueError("Rolling correlation needs exactly two columns")
+                    result = rolling_correlation(
+                        df, columns[0], columns[1], parse_window(self.window_size.get()),
+                        on=time_col, by=by).to_frame()
+                else:
+                    if not columns:
+                        raise ValueError("No columns specified")
+                    result = rolling_stats(df, columns, parse_window(self.window_size.get()),
+                                           funcs=[func], on=time_col, by=by)
+
+            if mode != "Time resampling":
+                # Show the rows' time and group next to the window values
+                context = [col for col in ([time_col] if time_col else []) + (by or [])]
+                result = df[context].join(result) if context else result
+
+            self.window_result.show(result)
+            self.status_var.set(f"{mode} generated: {len(result)} rows")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
     # Visualization tab functions
     def update_chart_options(self, event):
         if self.df is None:
@@ -633,7 +1666,7 @@ class DataAnalysisApp(tk.Tk):
             widget.destroy()
 
         chart_type = self.chart_type.get()
-        columns = list(self.df.columns)
+        columns = self.available_columns()
 
         if chart_type == "Histogram":
             ttk.Label(self.column_frame, text="Column:").grid(
@@ -712,7 +1745,44 @@ class DataAnalysisApp(tk.Tk):
                 self.plot_color.current(0)
                 self.plot_color.grid(row=2, column=1, padx=5, pady=5)
 
+        elif chart_type == "Time Series":
+            ttk.Label(self.column_frame, text="X Column (Time):").grid(
+                row=0, column=0, padx=5, pady=5)
+            self.ts_x = ttk.Combobox(self.column_frame, values=columns)
+            if columns:
+                self.ts_x.current(0)
+            self.ts_x.grid(row=0, column=1, padx=5, pady=5)
+
+            ttk.Label(self.column_frame, text="Y Column (Value):").grid(
+                row=1, column=0, padx=5, pady=5)
+            self.ts_y = ttk.Combobox(self.column_frame, values=columns)
+            if len(columns) > 1:
+                self.ts_y.current(1)
+            else:
+                self.ts_y.current(0)
+            self.ts_y.grid(row=1, column=1, padx=5, pady=5)
+
+            ttk.Label(self.column_frame, text="Downsampling:").grid(
+                row=2, column=0, padx=5, pady=5)
+            self.ts_method = ttk.Combobox(
+                self.column_frame, values=["lttb", "minmax"])
+            self.ts_method.current(0)
+            self.ts_method.grid(row=2, column=1, padx=5, pady=5)
+
+            ttk.Label(self.column_frame, text="Color:").grid(
+                row=3, column=0, padx=5, pady=5)
+            self.plot_color = ttk.Combobox(self.column_frame, values=[
+                                           "None", "red", "blue", "green", "black"])
+            self.plot_color.current(0)
+            self.plot_color.grid(row=3, column=1, padx=5, pady=5)
+
+    @monitor.timed()
     def create_plot(self):
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from modules.data_visualizer import (create_histogram, create_scatter_plot, create_bar_chart,
+                                             create_box_plot, create_time_series_plot)
+
         if self.df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -726,29 +1796,44 @@ class DataAnalysisApp(tk.Tk):
             widget.destroy()
 
         try:
-            if chart_type == "Histogram":
-                col = self.hist_column.get()
-                bins = int(self.hist_bins.get())
-                create_histogram(self.df, column=col, bins=bins, color=color)
-            elif chart_type == "Scatter Plot":
-                x_col = self.scatter_x.get()
-                y_col = self.scatter_y.get()
-                create_scatter_plot(self.df, x_col=x_col,
-                                    y_col=y_col, color=color)
-            elif chart_type == "Bar Chart":
-                x_col = self.cat_x.get()
-                y_col = self.cat_y.get()
-                create_bar_chart(self.df, x_col=x_col,
-                                 y_col=y_col, color=color)
-            elif chart_type == "Box Plot":
-                x_col = self.cat_x.get()
-                y_col = self.cat_y.get()
-                create_box_plot(self.df, x_col=x_col, y_col=y_col, color=color)
+            with monitor.span(f"data_visualizer.{chart_type}"):
+                if chart_type == "Histogram":
+                    col = self.hist_column.get()
+                    bins = int(self.hist_bins.get())
+                    self.ensure_columns([col])
+                    create_histogram(self.df, column=col, bins=bins, color=color)
+                elif chart_type == "Scatter Plot":
+                    x_col = self.scatter_x.get()
+                    y_col = self.scatter_y.get()
+                    self.ensure_columns([x_col, y_col])
+                    create_scatter_plot(self.df, x_col=x_col,
+                                        y_col=y_col, color=color)
+                elif chart_type == "Bar Chart":
+                    x_col = self.cat_x.get()
+                    y_col = self.cat_y.get()
+                    self.ensure_columns([x_col, y_col])
+                    create_bar_chart(self.df, x_col=x_col,
+                                     y_col=y_col, color=color)
+                elif chart_type == "Box Plot":
+                    x_col = self.cat_x.get()
+                    y_col = self.cat_y.get()
+                    self.ensure_columns([x_col, y_col])
+                    create_box_plot(self.df, x_col=x_col, y_col=y_col, color=color)
+                elif chart_type == "Time Series":
+                    x_col = self.ts_x.get()
+                    y_col = self.ts_y.get()
+                    self.ensure_columns([x_col, y_col])
+                    create_time_series_plot(self.df, x_col=x_col, y_col=y_col,
+                                            color=color, method=self.ts_method.get())
 
             # Embed the plot in the tkinter window
             figure = plt.gcf()  # Get the current figure
             canvas = FigureCanvasTkAgg(figure, master=self.plot_frame)
-            canvas.draw()
+            with monitor.span("matplotlib.draw", "render"):
+                canvas.draw()
+            if chart_type == "Time Series":
+                # Zoom/pan toolbar; the plot re-decimates on every limit change
+                NavigationToolbar2Tk(canvas, self.plot_frame).update()
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
             self.status_var.set(f"{chart_type} created")
@@ -757,6 +1842,8 @@ class DataAnalysisApp(tk.Tk):
             messagebox.showerror("Error", f"Could not create plot: {e}")
 
     def save_plot(self):
+        import matplotlib.pyplot as plt
+
         if not plt.gcf().get_axes():  # Check if a plot exists
             messagebox.showerror("Error", "No plot to save")
             return
@@ -773,7 +1860,15 @@ class DataAnalysisApp(tk.Tk):
                 messagebox.showerror("Error", f"Failed to save plot: {str(e)}")
 
     # Dashboard tab functions
+    @monitor.timed()
     def generate_dashboard(self):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from modules.data_analyzer import (COMPACT_HEATMAP_COLUMNS, get_descriptive_stats,
+                                           calculate_correlations, compact_correlation_matrix)
+        from modules.data_visualizer import HEATMAP_ANNOT_COLUMNS
+
         if self.cleaned_df is None:
             messagebox.showerror("Error", "No data loaded")
             return
@@ -869,10 +1964,19 @@ class DataAnalysisApp(tk.Tk):
 
         # Add correlation heatmap to the dashboard if selected
         if self.dashboard_options["correlation"].get() and self.cleaned_df.select_dtypes(include=['number']).columns.any():
-            corr_matrix = calculate_correlations(self.cleaned_df)
-            sns.heatmap(corr_matrix, annot=True,
+            numeric_count = len(self.cleaned_df.select_dtypes(include=['number']).columns)
+            if numeric_count > COMPACT_HEATMAP_COLUMNS:
+                # Wide data: the most correlated columns, clustered into blocks
+                with monitor.span("data_analyzer.compact_correlation_matrix"):
+                    corr_matrix = compact_correlation_matrix(self.cleaned_df)
+                heatmap_title = (f"Correlation Heatmap ({len(corr_matrix)} of "
+                                 f"{numeric_count} columns, clustered)")
+            else:
+                corr_matrix = calculate_correlations(self.cleaned_df)
+                heatmap_title = "Correlation Heatmap"
+            sns.heatmap(corr_matrix, annot=len(corr_matrix) <= HEATMAP_ANNOT_COLUMNS,
                         cmap='coolwarm', ax=axes[row, col])
-            axes[row, col].set_title("Correlation Heatmap")
+            axes[row, col].set_title(heatmap_title)
             plots_added += 1
 
         if plots_added == 0:
@@ -885,12 +1989,51 @@ class DataAnalysisApp(tk.Tk):
         # Embed the dashboard in the tkinter window
         canvas = FigureCanvasTkAgg(
             dashboard_fig, master=self.dashboard_canvas_frame)
-        canvas.draw()
+        with monitor.span("matplotlib.draw", "render"):
+            canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
         self.status_var.set("Dashboard generated")
 
+    @monitor.timed()
+    def generate_facet_dashboard(self):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from modules.facet_dashboard import create_facet_dashboard
+
+        if self.cleaned_df is None:
+            messagebox.showerror("Error", "No data loaded")
+            return
+
+        facet_col = self.facet_column.get()
+        value_col = self.facet_value_column.get()
+        if not facet_col or not value_col:
+            messagebox.showerror("Error", "Select a facet column and a value column")
+            return
+
+        try:
+            self.ensure_columns([facet_col, value_col])
+            with monitor.span("facet_dashboard.create_facet_dashboard"):
+                fig = create_facet_dashboard(self.cleaned_df, facet_col, value_col,
+                                             kind=self.facet_kind.get(),
+                                             title=self.dashboard_title.get(), show=False)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        # Clear previous dashboard
+        for widget in self.dashboard_canvas_frame.winfo_children():
+            widget.destroy()
+
+        canvas = FigureCanvasTkAgg(fig, master=self.dashboard_canvas_frame)
+        with monitor.span("matplotlib.draw", "render"):
+            canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self.status_var.set(f"Small multiples of {value_col} by {facet_col} generated")
+
     def save_dashboard(self):
+        import matplotlib.pyplot as plt
+
         if not plt.gcf().get_axes():  # Check if a plot exists
             messagebox.showerror("Error", "No dashboard to save")
             return
@@ -0,0 +1,503 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_BYTES = 4 * 1024 ** 3
+MAX_PREVIEW_ROWS = 1000
+# Longest request or response line; asyncio's default of 64 KiB is too small
+# for batches and preview pages.
+STREAM_LIMIT = 64 * 1024 * 1024
+# Request keys passed on to data_loader.read_data_file.
+LOAD_OPTIONS = ('usecols', 'sheet_name', 'cell_range', 'filters')
+
+
+def frame_to_json(df):
+    """
+    Converts a DataFrame to a JSON-compatible dict for the server protocol.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        dict: With the keys 'columns', 'index' and 'data' (a list of rows);
+        missing values are None and timestamps ISO strings.
+    """
+    return json.loads(df.to_json(orient='split', date_format='iso', default_handler=str))
+
+
+def frame_from_json(data):
+    """
+    Rebuilds a DataFrame from the output of frame_to_json.
+
+    Args:
+        data (dict): A dict with the keys 'columns', 'index' and 'data'.
+
+    Returns:
+        pd.DataFrame: The DataFrame; MultiIndex labels (lists) are restored.
+    """
+    def labels(values):
+        if values and all(isinstance(value, list) for value in values):
+            return pd.MultiIndex.from_tuples([tuple(value) for value in values])
+        return values
+
+    return pd.DataFrame(data['data'], index=labels(data['index']),
+                        columns=labels(data['columns']))
+
+
+def _json_default(value):
+    # numpy scalars and arrays in operation results
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _op_schema(df, params):
+    return {'rows': len(df), 'columns': [str(col) for col in df.columns],
+            'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            'memory_bytes': int(df.memory_usage(deep=False).sum())}
+
+
+def _op_preview(df, params):
+    offset = max(int(params.get('offset', 0)), 0)
+    limit = min(int(params.get('limit', 100)), MAX_PREVIEW_ROWS)
+    page = df.iloc[offset:offset + limit]
+    if params.get('columns'):
+        page = page[list(params['columns'])]
+    return {'total_rows': len(df), 'offset': offset, 'rows': frame_to_json(page)}
+
+
+def _op_describe(df, params):
+    from modules.data_analyzer import get_descriptive_stats
+    return frame_to_json(get_descriptive_stats(df, include=params.get('include', 'all')))
+
+
+def _op_correlations(df, params):
+    from modules.data_analyzer import calculate_correlations
+    return frame_to_json(calculate_correlations(df, method=params.get('method', 'pearson')))
+
+
+def _op_aggregate(df, params):
+    from modules.data_analyzer import group_and_aggregate
+    return frame_to_json(group_and_aggregate(df, params['group_cols'], params['agg']))
+
+
+def _op_profile(df, params):
+    from modules.data_profiler import profile_dataframe
+    return profile_dataframe(df, top_k=params.get('top_k', 5))
+
+
+def _op_duplicates(df, params):
+    from modules.data_cleaner import find_near_duplicates
+
+    subset = params.get('subset')
+    threshold = params.get('threshold')
+    if threshold is None:
+        duplicated = df.duplicated(subset=subset)
+    else:
+        duplicated = find_near_duplicates(df, subset=subset, threshold=threshold).duplicated()
+    return {'duplicate_rows': int(duplicated.sum())}
+
+
+def _op_outliers(df, params):
+    from modules.data_cleaner import outlier_mask
+    mask = outlier_mask(df, columns=params.get('columns'), method=params.get('method', 'iqr'),
+                        factor=params.get('factor'), bounds=params.get('bounds'))
+    return {'outlier_rows': int(mask.sum())}
+
+
+# Maps request ops to functions of (cached DataFrame, request) that must not
+# modify the frame: they run concurrently on the same shared data.
+OPERATIONS = {
+    'schema': _op_schema,
+    'preview': _op_preview,
+    'describe': _op_describe,
+    'correlations': _op_correlations,
+    'aggregate': _op_aggregate,
+    'profile': _op_profile,
+    'duplicates': _op_duplicates,
+    'outliers': _op_outliers,
+}
+
+
+def _load_sized(load):
+    # Runs in a worker thread: deep memory usage walks every Python string
+    df = load()
+    return df, int(df.memory_usage(deep=True).sum())
+
+
+class DatasetCache:
+    """
+    Loaded datasets shared by all clients, evicting the least recently used.
+
+    A dataset that is requested again while it is still loading is not loaded a
+    second time: all requests wait for the same load.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._loading = {}
+
+    async def get(self, key, load, executor):
+        """
+        Returns the dataset stored under key, loading it in executor if needed.
+
+        Args:
+            key (tuple): Cache key; its first item is the source path.
+            load (callable): Returns the DataFrame; runs in a worker thread.
+            executor (concurrent.futures.Executor): Runs load.
+
+        Returns:
+            pd.DataFrame: The shared DataFrame; callers must not modify it.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        if key in self._loading:
+            self.hits += 1
+            return await asyncio.shield(self._loading[key])
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        future = self._loading[key] = loop.create_future()
+        try:
+            df, nbytes = await loop.run_in_executor(executor, _load_sized, load)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here, so unawaited failures are not logged
+            raise
+        finally:
+            del self._loading[key]
+        future.set_result(df)
+        self._put(key, df, nbytes)
+        return df
+
+    def _put(self, key, df, nbytes):
+        self._entries[key] = (df, nbytes)
+        # The newest entry stays even if it alone exceeds the budget
+        while len(self._entries) > 1 and self.total_bytes() > self.max_bytes:
+            self._entries.popitem(last=False)
+
+    def total_bytes(self):
+        """Returns the memory used by all cached datasets."""
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    def evict(self, path=None):
+        """
+        Removes cached datasets.
+
+        Args:
+            path (str, optional): Only remove the datasets loaded from this path
+                (cleaned variants included). Defaults to all.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        path = os.path.abspath(path) if path is not None else None
+        keys = [key for key in self._entries if path is None or key[0] == path]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def info(self):
+        """Returns the cached datasets and the hit/miss counters."""
+        return {'entries': [{'path': key[0], 'rows': len(df), 'columns': len(df.columns),
+                             'bytes': nbytes, 'cleaned': len(key) > 4}
+                            for key, (df, nbytes) in self._entries.items()],
+                'total_bytes': self.total_bytes(), 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+
+class AnalysisServer:
+    """
+    Serves analysis operations on shared, cached datasets to local clients.
+
+    The protocol is newline-delimited JSON over a TCP or Unix socket. A request
+    is an object such as::
+
+        {"id": 1, "op": "describe", "path": "data/sales.csv",
+         "pipeline": {"steps": [...]}}
+
+    where op is one of OPERATIONS, 'cache_info' or 'evict'; 'usecols',
+    'sheet_name', 'cell_range' and 'filters' are passed to read_data_file, and
+    an optional 'pipeline' (CleaningPipeline.to_dict()) is applied first, its
+    result cached too. A JSON array of requests is a batch: its requests run
+    concurrently and are answered with an array in the same order. Responses
+    are {"id": 1, "ok": true, "result": ...} or {"id": 1, "ok": false,
+    "error": "..."}.
+
+    Datasets are loaded once and shared read-only by all clients; operations run
+    in a thread pool, and identical requests that arrive while one is running
+    share its result.
+    """
+
+    def __init__(self, cache_bytes=DEFAULT_CACHE_BYTES, max_workers=None):
+        self.cache = DatasetCache(cache_bytes)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+        self.requests = 0
+        self.coalesced = 0
+        self._running = {}
+        self._server = None
+
+    async def dataset(self, request):
+        """
+        Returns the (cleaned) dataset a request refers to, from the cache.
+
+        Args:
+            request (dict): A request with 'path' and optionally the load options
+                and 'pipeline'.
+
+        Returns:
+            pd.DataFrame: The shared DataFrame.
+        """
+        from modules.cleaning_pipeline import CleaningPipeline
+        from modules.data_loader import read_data_file
+
+        if not request.get('path'):
+            raise ValueError("No dataset path given")
+        path = os.path.abspath(request['path'])
+        options = {name: request[name] for name in LOAD_OPTIONS if request.get(name) is not None}
+        stat = os.stat(path)
+        # Size and modification time in the key: edited files are loaded again
+        key = (path, stat.st_size, stat.st_mtime_ns, json.dumps(options, sort_keys=True))
+        df = await self.cache.get(key, lambda: read_data_file(path, **options), self.executor)
+
+        pipeline = CleaningPipeline.from_dict(request.get('pipeline') or {})
+        if len(pipeline):
+            steps = json.dumps(pipeline.to_dict(), sort_keys=True, default=str)
+            df = await self.cache.get(key + (steps,), lambda: pipeline.apply(df), self.executor)
+        return df
+
+    async def _execute(self, request):
+        op = request.get('op')
+        if op == 'cache_info':
+            return dict(self.cache.info(), requests=self.requests, coalesced=self.coalesced)
+        if op == 'evict':
+            return {'evicted': self.cache.evict(request.get('path'))}
+        if op not in OPERATIONS:
+            raise ValueError(f"Invalid operation: {op}")
+        df = await self.dataset(request)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, OPERATIONS[op], df, request)
+
+    async def handle(self, request):
+        """
+        Answers one request.
+
+        Args:
+            request (dict): The request, see the class description.
+
+        Returns:
+            dict: The response.
+        """
+        self.requests += 1
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+            params = {key: value for key, value in request.items() if key != 'id'}
+            key = json.dumps(params, sort_keys=True, default=str)
+            task = self._running.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = self._running[key] = asyncio.ensure_future(self._execute(params))
+                task.add_done_callback(lambda _: self._running.pop(key, None))
+            # Shielded: a client disconnecting does not cancel a shared computation
+            result = await asyncio.shield(task)
+            return {'id': request_id, 'ok': True, 'result': result}
+        except Exception as e:
+            return {'id': request_id, 'ok': False, 'error': str(e) or type(e).__name__}
+
+    async def _serve_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {'id': None, 'ok': False, 'error': f"Invalid JSON: {e}"}
+                else:
+                    if isinstance(message, list):
+                        response = await asyncio.gather(*(self.handle(r) for r in message))
+                    else:
+                        response = await self.handle(message)
+                writer.write(json.dumps(response, default=_json_default).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Starts listening.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to localhost only.
+            port (int, optional): TCP port; 0 picks a free one. Defaults to 8765.
+            path (str, optional): Listen on this Unix socket instead of TCP.
+
+        Returns:
+            tuple or str: The bound (host, port), or the socket path.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve_client, path=path,
+                                                           limit=STREAM_LIMIT)
+            return path
+        self._server = await asyncio.start_server(self._serve_client, host, port,
+                                                  limit=STREAM_LIMIT)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """Serves requests until the task is cancelled."""
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        """Stops listening and shuts down the worker threads."""
+        if self._server is not None:
+            self._server.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, cache_bytes=DEFAULT_CACHE_BYTES,
+          max_workers=None):
+    """
+    Runs an AnalysisServer until interrupted.
+
+    Args:
+        host (str, optional): Interface to bind. Defaults to localhost only.
+        port (int, optional): TCP port. Defaults to 8765.
+        path (str, optional): Listen on this Unix socket instead of TCP.
+        cache_bytes (int, optional): Memory budget of the dataset cache.
+        max_workers (int, optional): Worker threads. Defaults to the CPU count.
+    """
+    async def run():
+        server = AnalysisServer(cache_bytes=cache_bytes, max_workers=max_workers)
+        address = await server.start(host=host, port=port, path=path)
+        print(f"Analysis server listening on {address}")
+        try:
+            await server.serve_forever()
+        finally:
+            server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+class AnalysisClient:
+    """
+    Blocking client of an AnalysisServer.
+
+    Example::
+
+        with AnalysisClient() as client:
+            stats = frame_from_json(client.request('describe', path='sales.csv'))
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, timeout=None):
+        if path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(path)
+        else:
+            self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._file = self._socket.makefile('rwb')
+        self._next_id = 0
+
+    def _send(self, message):
+        self._file.write(json.dumps(message, default=_json_default).encode('utf-8') + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The analysis server closed the connection")
+        return json.loads(line)
+
+    def _request(self, op, params):
+        self._next_id += 1
+        return dict(params, op=op, id=self._next_id)
+
+    @staticmethod
+    def _result(response):
+        if not response['ok']:
+            raise RuntimeError(f"Analysis server error: {response['error']}")
+        return response['result']
+
+    def request(self, op, **params):
+        """
+        Sends one request and waits for its result.
+
+        Args:
+            op (str): The operation, see AnalysisServer.
+            **params: The request's other keys, e.g. path and pipeline.
+
+        Returns:
+            The operation's result; DataFrames come as frame_to_json dicts.
+
+        Raises:
+            RuntimeError: If the server could not run the request.
+        """
+        return self._result(self._send(self._request(op, params)))
+
+    def batch(self, requests):
+        """
+        Sends several requests at once; the server runs them concurrently.
+
+        Args:
+            requests (list of dict): Requests with an 'op' key and parameters.
+
+        Returns:
+            list: The results, in the order of requests.
+
+        Raises:
+            RuntimeError: If the server could not run one of the requests.
+        """
+        messages = [self._request(r['op'], {k: v for k, v in r.items() if k != 'op'})
+                    for r in requests]
+        return [self._result(response) for response in self._send(messages)]
+
+    def close(self):
+        """Closes the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Serve cached datasets and analysis operations to local clients.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to bind.")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="TCP port.")
+    parser.add_argument('--socket', help="Listen on this Unix socket instead of TCP.")
+    parser.add_argument('--cache-mb', type=int, default=DEFAULT_CACHE_BYTES // 1024 ** 2,
+                        help="Memory budget of the dataset cache in MB.")
+    parser.add_argument('--workers', type=int, help="Worker threads.")
+    args = parser.parse_args()
+    serve(host=args.host, port=args.port, path=args.socket,
+          cache_bytes=args.cache_mb * 1024 ** 2, max_workers=args.workers)
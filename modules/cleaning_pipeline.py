@@ -0,0 +1,134 @@
+from modules.data_cleaner import (clean_missing_values, remove_duplicates, filter_data,
+                                  convert_column_types, remove_near_duplicates,
+                                  remove_outliers, clip_outliers)
+
+
+def _convert_column_types(df, **params):
+    df_converted, _ = convert_column_types(df, **params)
+    return df_converted
+
+
+# Maps step names to the data_cleaner function applying them.
+OPERATIONS = {
+    'clean_missing_values': clean_missing_values,
+    'remove_duplicates': remove_duplicates,
+    'remove_near_duplicates': remove_near_duplicates,
+    'filter_data': filter_data,
+    'convert_column_types': _convert_column_types,
+    'remove_outliers': remove_outliers,
+    'clip_outliers': clip_outliers,
+}
+
+
+def is_row_local(op, params):
+    """
+    Tells whether a step gives the same result when applied chunk by chunk.
+
+    Steps that look at other rows (duplicates, mean/median fills, forward/backward
+    fills) or that infer something from the data ('auto' types, inferred datetime
+    formats, outlier bounds that were not fixed in advance) need the whole frame.
+
+    Args:
+        op (str): Step name.
+        params (dict): Step parameters.
+
+    Returns:
+        bool: True if the step can run on independent chunks.
+    """
+    if op == 'filter_data':
+        return True
+    if op in ('remove_outliers', 'clip_outliers'):
+        return params.get('bounds') is not None
+    if op == 'clean_missing_values':
+        return params.get('method', 'drop') in ('drop', 'constant')
+    if op == 'convert_column_types':
+        conversions = params.get('conversions', {})
+        formats = params.get('datetime_formats') or {}
+        return all(target not in ('auto', 'category')
+                   and (target != 'datetime' or col in formats)
+                   for col, target in conversions.items())
+    return False
+
+
+class CleaningPipeline:
+    """
+    An ordered, replayable recipe of cleaning steps.
+
+    Every step is the name of a data_cleaner operation plus its keyword arguments,
+    so a pipeline can be re-applied to a fresh copy of the source data, streamed
+    over chunks, or serialized with to_dict().
+    """
+
+    def __init__(self, steps=None):
+        self.steps = [dict(step) for step in (steps or [])]
+
+    def add_step(self, op, **params):
+        """
+        Appends a step to the pipeline.
+
+        Args:
+            op (str): Name of the operation (see OPERATIONS).
+            **params: Keyword arguments of the operation.
+
+        Raises:
+            ValueError: If the operation is unknown.
+        """
+        if op not in OPERATIONS:
+            raise ValueError(f"Invalid pipeline operation: {op}")
+        self.steps.append({'op': op, 'params': params})
+
+    def clear(self):
+        """Removes all steps."""
+        self.steps = []
+
+    def apply(self, df):
+        """
+        Applies all steps to a DataFrame.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to clean.
+
+        Returns:
+            pd.DataFrame: The cleaned DataFrame.
+        """
+        for step in self.steps:
+            df = OPERATIONS[step['op']](df, **step['params'])
+        return df
+
+    def is_streamable(self):
+        """Returns True if every step can be applied chunk by chunk."""
+        return all(is_row_local(step['op'], step['params']) for step in self.steps)
+
+    def iter_apply(self, chunks):
+        """
+        Lazily applies the pipeline to an iterable of DataFrame chunks.
+
+        Only one chunk is held in memory at a time, so the cleaned result never has
+        to be materialized as a whole.
+
+        Args:
+            chunks (iterable of pd.DataFrame): The input chunks.
+
+        Yields:
+            pd.DataFrame: Each cleaned chunk.
+
+        Raises:
+            ValueError: If a step needs the whole frame (see is_row_local).
+        """
+        if not self.is_streamable():
+            raise ValueError(
+                "Pipeline contains steps that need the whole dataset and cannot be streamed.")
+        for chunk in chunks:
+            yield self.apply(chunk)
+
+    def to_dict(self):
+        """Returns a JSON-serializable description of the pipeline."""
+        return {'steps': [dict(step) for step in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Creates a pipeline from the output of to_dict()."""
+        return cls(data.get('steps', []))
+
+    def __len__(self):
+        return len(self.steps)
@@ -1,5 +1,25 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+PIVOT_FUNCTIONS = ('sum', 'mean', 'count', 'min', 'max', 'std', 'var')
+CROSSTAB_NORMALIZE = ('all', 'index', 'columns')
+# The occupied cells of grids up to this many cells, or DENSE_PIVOT_CELLS_PER_ROW
+# cells per data row, are found with a bincount over the grid, which is cheaper
+# than hashing the cell codes; larger, mostly empty grids are hashed.
+DENSE_PIVOT_MIN_CELLS = 1_000_000
+DENSE_PIVOT_CELLS_PER_ROW = 16
+# Largest wide pivot table (rows x columns x values); use the long format beyond.
+MAX_PIVOT_CELLS = 20_000_000
+BLOCK_CORRELATION_METHODS = ('pearson', 'spearman')
+# Columns per block of correlation_pairs; a block pair needs a few
+# CORRELATION_BLOCK_SIZE^2 arrays, whatever the number of columns.
+CORRELATION_BLOCK_SIZE = 256
+# Columns shown in a compact (clustered) correlation heatmap.
+COMPACT_HEATMAP_COLUMNS = 40
+
 
 def get_descriptive_stats(df, include='all'):
     """
@@ -35,6 +55,292 @@ def calculate_correlations(df, method='pearson', min_periods=1):
     return numeric_df.corr(method=method, min_periods=min_periods)
 
 
+def _correlation_inputs(df, method):
+    # Numerical columns as a float matrix centered on the column means, with
+    # missing values set to 0, and the boolean mask of the present values (None
+    # when nothing is missing). For 'spearman' these are the ranks of each column
+    # over all its values, exact for pairs without missing values; _spearman_block
+    # ranks the other pairs again.
+    if method not in BLOCK_CORRELATION_METHODS:
+        raise ValueError(f"Invalid method for blockwise correlations: {method}")
+    numeric = df.select_dtypes(include=['number'])
+    if method == 'spearman':
+        numeric = numeric.rank()
+    # A private copy, centered in place to avoid more full-size temporaries
+    values = numeric.to_numpy(dtype=float, na_value=np.nan, copy=True)
+    missing = np.isnan(values)
+    values[missing] = 0.0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = values.sum(axis=0) / (~missing).sum(axis=0)
+    # Centering keeps the sums of the correlation formula small and accurate
+    values -= np.nan_to_num(means)
+    values[missing] = 0.0
+    present = ~missing if missing.any() else None
+    return list(numeric.columns), values, present
+
+
+def _block_mask(present, columns):
+    # Float mask of a column block for the matrix products; None if it is complete
+    if present is None:
+        return None
+    block = present[:, columns]
+    return block.astype(float) if not block.all() else None
+
+
+def _block_correlations(x, x_mask, y, y_mask, min_periods):
+    # Correlations of the columns of x with those of y over the rows where both
+    # are present, and the number of such rows
+    if x_mask is None and y_mask is None:
+        n = np.full((x.shape[1], y.shape[1]), len(x), dtype=float)
+        cov = x.T @ y
+        var = np.outer((x * x).sum(axis=0), (y * y).sum(axis=0))
+    else:
+        x_mask = np.ones_like(x) if x_mask is None else x_mask
+        y_mask = np.ones_like(y) if y_mask is None else y_mask
+        n = x_mask.T @ y_mask
+        sum_x, sum_y = x.T @ y_mask, x_mask.T @ y
+        cov = n * (x.T @ y) - sum_x * sum_y
+        var = (n * ((x * x).T @ y_mask) - sum_x ** 2) * (n * (x_mask.T @ (y * y)) - sum_y ** 2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = np.clip(cov / np.sqrt(var), -1.0, 1.0)
+    r[(var <= 0) | (n < max(min_periods, 2))] = np.nan
+    return r, n
+
+
+def _sorted_ties(values, present):
+    # Sort order along the last axis of values (one column, or one column per
+    # row) with the missing values last, and for every sorted position the first
+    # and last position of its run of equal values; the runs are None when all
+    # present values differ
+    keys = np.where(present, values, np.inf)
+    order = np.argsort(keys, axis=-1, kind='stable')
+    ordered = np.take_along_axis(keys, order, axis=-1)
+    change = ordered[..., 1:] != ordered[..., :-1]
+    if not (~change & np.isfinite(ordered[..., 1:])).any():
+        return order, None, None
+    positions = np.arange(keys.shape[-1])
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[..., 1:] = change
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    ends = np.ones(ordered.shape, dtype=bool)
+    ends[..., :-1] = change
+    last = np.flip(np.minimum.accumulate(
+        np.flip(np.where(ends, positions, keys.shape[-1] - 1), axis=-1), axis=-1), axis=-1)
+    return order, first, last
+
+
+def _run_ranks(included, first, last):
+    # Average ranks among the included values, in sorted order along the last
+    # axis, with the runs of equal values of _sorted_ties
+    counts = np.zeros(included.shape[:-1] + (included.shape[-1] + 1,))
+    np.cumsum(included, axis=-1, out=counts[..., 1:])
+    if first is None:
+        return counts[..., 1:]
+    if first.ndim == 1:
+        return (counts[:, first] + 1 + counts[:, last + 1]) / 2
+    return (np.take_along_axis(counts, first, axis=-1) + 1
+            + np.take_along_axis(counts, last + 1, axis=-1)) / 2
+
+
+def _spearman_block(x, x_present, y, y_present, min_periods):
+    # Spearman correlations of the columns of x with those of y, each pair ranked
+    # again over the rows where both are present, as in DataFrame.corr; x and y
+    # may be the per-column ranks, which order the rows the same way. The y
+    # columns are transposed so that the cumulative sums run over contiguous
+    # memory, and every pair is computed in the sort order of the x column.
+    y_present = np.ascontiguousarray(y_present.T)
+    y_order, y_first, y_last = _sorted_ties(y.T, y_present)
+    y_sorted_present = np.take_along_axis(y_present, y_order, axis=-1)
+    y_position = np.empty_like(y_order)
+    np.put_along_axis(y_position, y_order, np.arange(len(y)), axis=-1)
+    r = np.full((x.shape[1], y.shape[1]), np.nan)
+    n = np.zeros(r.shape)
+    for i in range(x.shape[1]):
+        x_order, x_first, x_last = _sorted_ties(x[:, i], x_present[:, i])
+        common = x_present[x_order, i] & y_present[:, x_order]
+        x_ranks = _run_ranks(common, x_first, x_last)
+        y_ranks = _run_ranks(x_present[:, i][y_order] & y_sorted_present, y_first, y_last)
+        y_ranks = np.take_along_axis(y_ranks, y_position[:, x_order], axis=-1)
+
+        count = common.sum(axis=-1)
+        center = ((count + 1) / 2)[:, None]
+        x_ranks -= center
+        y_ranks -= center
+        x_ranks[~common] = 0.0
+        y_ranks[~common] = 0.0
+        var = np.einsum('ij,ij->i', x_ranks, x_ranks) * np.einsum('ij,ij->i', y_ranks, y_ranks)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r[i] = np.clip(np.einsum('ij,ij->i', x_ranks, y_ranks) / np.sqrt(var), -1.0, 1.0)
+        r[i, (var <= 0) | (count < max(min_periods, 2))] = np.nan
+        n[i] = count
+    return r, n
+
+
+def _merge_top_k(best, rows, r, n, columns, k):
+    # Keeps the k strongest correlations of each row among best and the new block
+    score, index, corr, count = best
+    block_score = np.abs(r)
+    block_score[np.isnan(block_score)] = -np.inf
+    candidates = [np.hstack([score[rows], block_score]),
+                  np.hstack([index[rows], np.broadcast_to(columns, r.shape)]),
+                  np.hstack([corr[rows], r]), np.hstack([count[rows], n])]
+    keep = np.argpartition(-candidates[0], k - 1, axis=1)[:, :k]
+    for target, values in zip(best, candidates):
+        target[rows] = np.take_along_axis(values, keep, axis=1)
+
+
+def correlation_pairs(df, method='pearson', threshold=None, top_k=None, min_periods=1,
+                      block_size=CORRELATION_BLOCK_SIZE):
+    """
+    Finds the strongest correlations of a wide DataFrame without a full matrix.
+
+    The columns are processed in blocks of block_size: each pair of blocks is one
+    matrix product, and only the pairs that pass the threshold, or the running top
+    k of every column, are kept. Memory therefore grows with the block size and
+    the result, not with the square of the number of columns. Missing values are
+    handled pairwise, as in calculate_correlations: for 'spearman', the columns of
+    blocks with missing values are ranked again for every pair over the rows where
+    both are present, which is much slower than the matrix products.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to analyze; only numerical columns are used.
+        method (str, optional): 'pearson' or 'spearman'. Defaults to 'pearson'.
+        threshold (float, optional): Keep the pairs with an absolute correlation of
+            at least this value.
+        top_k (int, optional): Keep the k strongest correlations of every column.
+        min_periods (int, optional): Minimum number of rows with both values.
+            Defaults to 1.
+        block_size (int, optional): Columns per block. Defaults to 256.
+
+    Returns:
+        pd.DataFrame: One row per pair with 'column_1', 'column_2', 'correlation'
+        and 'observations'. With a threshold only, every pair appears once, from the
+        strongest; with top_k, each column's partners follow the column order of df,
+        strongest first.
+
+    Raises:
+        ValueError: If neither threshold nor top_k is given or the method is invalid.
+    """
+    if threshold is None and top_k is None:
+        raise ValueError("Specify a correlation threshold or top_k.")
+    if top_k is not None and top_k < 1:
+        raise ValueError(f"Invalid top_k: {top_k}")
+    names, values, present = _correlation_inputs(df, method)
+    n_columns = len(names)
+
+    found = []
+    if top_k is not None:
+        k = min(top_k, max(n_columns - 1, 1))
+        best = [np.full((n_columns, k), -np.inf), np.full((n_columns, k), -1, dtype=np.intp),
+                np.full((n_columns, k), np.nan), np.zeros((n_columns, k))]
+    for i in range(0, n_columns, block_size):
+        rows = slice(i, min(i + block_size, n_columns))
+        x, x_mask = values[:, rows], _block_mask(present, rows)
+        for j in range(i, n_columns, block_size):
+            cols = slice(j, min(j + block_size, n_columns))
+            y_mask = _block_mask(present, cols)
+            if method == 'spearman' and (x_mask is not None or y_mask is not None):
+                r, n = _spearman_block(x, present[:, rows], values[:, cols], present[:, cols],
+                                       min_periods)
+            else:
+                r, n = _block_correlations(x, x_mask, values[:, cols], y_mask, min_periods)
+            if i == j:
+                # Each pair once, and no column paired with itself
+                r[np.tril_indices_from(r)] = np.nan
+            if threshold is not None:
+                r[np.abs(r) < threshold] = np.nan
+            if top_k is not None:
+                upper = r if i != j else np.fmax(r, r.T)
+                _merge_top_k(best, rows, upper, n, np.arange(cols.start, cols.stop), k)
+                if i != j:
+                    _merge_top_k(best, cols, r.T, n.T, np.arange(rows.start, rows.stop), k)
+            else:
+                a, b = np.nonzero(~np.isnan(r))
+                found.append((a + i, b + j, r[a, b], n[a, b]))
+
+    if top_k is not None:
+        score, index, corr, count = best
+        order = np.argsort(-score, axis=1, kind='stable')
+        score, index, corr, count = (np.take_along_axis(arr, order, axis=1)
+                                     for arr in (score, index, corr, count))
+        valid = np.isfinite(score)
+        first, second = np.nonzero(valid)[0], index[valid]
+        corr, count = corr[valid], count[valid]
+    elif found:
+        first, second, corr, count = (np.concatenate(parts) for parts in zip(*found))
+        order = np.argsort(-np.abs(corr), kind='stable')
+        first, second, corr, count = first[order], second[order], corr[order], count[order]
+    else:
+        first = second = np.array([], dtype=np.intp)
+        corr = count = np.array([], dtype=float)
+
+    labels = np.array(names, dtype=object)
+    return pd.DataFrame({'column_1': labels[first], 'column_2': labels[second],
+                         'correlation': corr, 'observations': count.astype(np.int64)})
+
+
+def cluster_order(corr):
+    """
+    Orders the columns of a correlation matrix so that correlated ones are adjacent.
+
+    The order is the leaf order of an average-linkage hierarchical clustering with
+    the distance 1 - |r|; it is O(n^3), meant for matrices that are drawn.
+
+    Args:
+        corr (pd.DataFrame): Square correlation matrix.
+
+    Returns:
+        list of int: Positions of the columns in clustered order.
+    """
+    n = len(corr)
+    distance = 1.0 - np.abs(corr.to_numpy(dtype=float, na_value=np.nan))
+    distance[np.isnan(distance)] = 1.0
+    np.fill_diagonal(distance, np.inf)
+    leaves = [[i] for i in range(n)]
+    sizes = np.ones(n)
+    for _ in range(n - 1):
+        a, b = np.unravel_index(np.argmin(distance), distance.shape)
+        a, b = min(a, b), max(a, b)
+        # Average distance of the merged cluster to all the others
+        merged = (sizes[a] * distance[a] + sizes[b] * distance[b]) / (sizes[a] + sizes[b])
+        distance[a], distance[:, a] = merged, merged
+        distance[a, a] = np.inf
+        distance[b], distance[:, b] = np.inf, np.inf
+        leaves[a] = leaves[a] + leaves[b]
+        sizes[a] += sizes[b]
+    return leaves[0] if n else []
+
+
+def compact_correlation_matrix(df, method='pearson', max_columns=COMPACT_HEATMAP_COLUMNS,
+                               block_size=CORRELATION_BLOCK_SIZE):
+    """
+    Builds a small, clustered correlation matrix for a heatmap of wide data.
+
+    When there are more than max_columns numerical columns, the ones with the
+    strongest correlation to any other column are kept, found blockwise with
+    correlation_pairs. The matrix is reordered with cluster_order so that groups
+    of correlated columns form blocks along the diagonal.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to analyze.
+        method (str, optional): 'pearson' or 'spearman'. Defaults to 'pearson'.
+        max_columns (int, optional): Columns to keep. Defaults to 40.
+        block_size (int, optional): See correlation_pairs.
+
+    Returns:
+        pd.DataFrame: The clustered correlation matrix.
+    """
+    numeric = df.select_dtypes(include=['number'])
+    if len(numeric.columns) > max_columns:
+        strongest = correlation_pairs(numeric, method=method, top_k=1, block_size=block_size)
+        strength = strongest['correlation'].abs()
+        strength.index = strongest['column_1']
+        numeric = numeric[strength.nlargest(max_columns).index.tolist()]
+    corr = calculate_correlations(numeric, method=method)
+    order = cluster_order(corr)
+    return corr.iloc[order, order]
+
+
 def group_and_aggregate(df, group_cols, agg_dict):
     """
     Groups a DataFrame by specified columns and aggregates other columns.
@@ -50,3 +356,256 @@ def group_and_aggregate(df, group_cols, agg_dict):
     """
 
     return df.groupby(group_cols).agg(agg_dict)
+
+
+def _as_list(keys):
+    return [] if keys is None else ([keys] if isinstance(keys, str) else list(keys))
+
+
+def _key_codes(df, keys):
+    # Codes 0..n-1 of the key combinations, in sorted key order, and their labels;
+    # rows with a missing key get -1
+    codes, sizes = [], []
+    for key in keys:
+        key_codes, uniques = pd.factorize(df[key], sort=True)
+        codes.append(key_codes)
+        sizes.append(max(len(uniques), 1))
+    if len(keys) == 1:
+        return codes[0], pd.Index(uniques, name=keys[0])
+
+    missing = np.zeros(len(df), dtype=bool)
+    combined = np.zeros(len(df), dtype=np.int64)
+    for key_codes, size in zip(codes, sizes):
+        missing |= key_codes < 0
+        if combined.max(initial=0) >= 2 ** 62 // size:
+            # Renumber the combinations seen so far before the codes overflow
+            combined = pd.factorize(combined, sort=True)[0].astype(np.int64)
+        combined = combined * size + key_codes
+    rows = np.flatnonzero(~missing)
+    result = np.full(len(df), -1, dtype=np.intp)
+    if np.prod(sizes, dtype=float) <= max(len(df), DENSE_PIVOT_MIN_CELLS):
+        # Few possible combinations: renumber the present ones with a bincount
+        present = np.bincount(combined[rows], minlength=int(np.prod(sizes))) > 0
+        result[rows] = (np.cumsum(present) - 1)[combined[rows]]
+    else:
+        result[rows] = pd.factorize(combined[rows], sort=True)[0]
+
+    # Label every combination with the keys of its first row
+    first = np.zeros(result.max(initial=-1) + 1, dtype=np.intp)
+    first[result[rows][::-1]] = rows[::-1]
+    labels = pd.MultiIndex.from_arrays([df[key].iloc[first] for key in keys], names=keys)
+    return result, labels
+
+
+def _cell_values(df, col, aggfunc):
+    # Values of a column for accumulation and the mask of the non-missing ones
+    series = df[col]
+    if aggfunc == 'count':
+        return None, series.notna().to_numpy()
+    if not pd.api.types.is_numeric_dtype(series):
+        raise ValueError(f"Column '{col}' is not numerical.")
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    return values, ~np.isnan(values)
+
+
+def _accumulate(slots, n_slots, values, valid, aggfunc):
+    # Aggregates values per slot with O(n) bincount/ufunc.at passes
+    if not valid.all():
+        slots = slots[valid]
+        values = values[valid] if values is not None else None
+    count = np.bincount(slots, minlength=n_slots)
+    if aggfunc == 'count':
+        return count
+    if aggfunc in ('min', 'max'):
+        ufunc = np.minimum if aggfunc == 'min' else np.maximum
+        result = np.full(n_slots, np.inf if aggfunc == 'min' else -np.inf)
+        ufunc.at(result, slots, values)
+        result[count == 0] = np.nan
+        return result
+    total = np.bincount(slots, weights=values, minlength=n_slots)
+    if aggfunc == 'sum':
+        return total
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        if aggfunc == 'mean':
+            return mean
+        # Squared deviations from the cell mean; stable unlike sum of squares
+        deviation = values - mean[slots]
+        var = np.bincount(slots, weights=deviation * deviation, minlength=n_slots) / (count - 1)
+    var[count < 2] = np.nan
+    return var if aggfunc == 'var' else np.sqrt(var)
+
+
+def _pivot_cells(df, index, columns, values, aggfunc, max_workers):
+    # Returns the row labels, column labels (None without column keys), the ids of
+    # the occupied cells (row * n_columns + column, ascending) and one array of
+    # aggregates per value column, aligned with the cells
+    index, columns, values = _as_list(index), _as_list(columns), _as_list(values)
+    if not index:
+        raise ValueError("No row keys specified.")
+    if aggfunc not in PIVOT_FUNCTIONS:
+        raise ValueError(f"Invalid pivot function: {aggfunc}")
+
+    row_codes, row_labels = _key_codes(df, index)
+    if columns:
+        col_codes, col_labels = _key_codes(df, columns)
+    else:
+        col_codes, col_labels = np.zeros(len(df), dtype=np.intp), None
+    n_cols = len(col_labels) if col_labels is not None else 1
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    cells = row_codes[valid].astype(np.int64) * n_cols + col_codes[valid]
+
+    # Number the occupied cells; the aggregates are only accumulated for those
+    n_cells = len(row_labels) * n_cols
+    dense_limit = min(DENSE_PIVOT_CELLS_PER_ROW * len(cells), MAX_PIVOT_CELLS)
+    if n_cells <= max(dense_limit, DENSE_PIVOT_MIN_CELLS):
+        # Dense: mark the occupied cells of the whole grid with one bincount
+        is_occupied = np.bincount(cells, minlength=n_cells) > 0
+        occupied = np.flatnonzero(is_occupied)
+        slots = (np.cumsum(is_occupied) - 1)[cells]
+    else:
+        # Sparse: hash the cell codes instead of allocating a mostly empty grid
+        slots, occupied = pd.factorize(cells, sort=True)
+    n_slots = len(occupied)
+
+    def aggregate(col):
+        col_values, col_valid = _cell_values(df, col, aggfunc)
+        if col_values is not None:
+            col_values = col_values[valid]
+        return _accumulate(slots, n_slots, col_values, col_valid[valid], aggfunc)
+
+    if values:
+        workers = min(len(values), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            stats = list(executor.map(aggregate, values))
+    else:
+        stats = [np.bincount(slots, minlength=n_slots)]
+    return row_labels, col_labels, occupied, stats
+
+
+def _cell_labels(labels, positions):
+    # Levels, codes and names of labels taken at positions, for a MultiIndex
+    if isinstance(labels, pd.MultiIndex):
+        return (list(labels.levels), [codes[positions] for codes in labels.codes],
+                list(labels.names))
+    return [labels], [positions], [labels.name]
+
+
+def _wide_grid(n_rows, n_cols, cells, stat, fill_value):
+    fill = np.nan if fill_value is None else fill_value
+    grid = np.full(n_rows * n_cols, fill, dtype=np.result_type(stat, np.asarray(fill)))
+    grid[cells] = stat
+    return grid.reshape(n_rows, n_cols)
+
+
+def pivot_table(df, index, columns=None, values=None, aggfunc='sum', fill_value=None,
+                long_format=False, max_workers=None):
+    """
+    Computes a pivot table.
+
+    Every key column is factorized once and each row is mapped to a cell code. The
+    occupied cells are numbered with a bincount over the grid when it is small
+    compared to the data, or by hashing the cell codes when it is large and mostly
+    empty (high-cardinality keys); the aggregates are then accumulated with O(n)
+    bincount passes over the occupied cells only. The value columns are aggregated
+    in parallel threads.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to pivot.
+        index (str or list of str): Columns whose values become the rows.
+        columns (str or list of str, optional): Columns whose values become the
+            columns. Without them there is one result column per value column.
+        values (str or list of str, optional): Columns to aggregate. Defaults to
+            counting the rows of every cell.
+        aggfunc (str, optional): Aggregation from PIVOT_FUNCTIONS. Defaults to 'sum'.
+            Missing values are ignored.
+        fill_value (scalar, optional): Value of empty cells. Defaults to NaN.
+        long_format (bool, optional): Return one row per occupied cell instead of a
+            grid, which is also possible for very large pivots. Defaults to False.
+        max_workers (int, optional): Number of threads. Defaults to the CPU count.
+
+    Returns:
+        pd.DataFrame: The pivot table, sorted by the keys. With several value
+        columns and column keys, the columns are (value, column key) pairs. In long
+        format, indexed by the row and column keys with one column per value.
+
+    Raises:
+        ValueError: If the aggregation is invalid, a value column is not numerical
+            (except for 'count') or the grid has more than MAX_PIVOT_CELLS cells.
+    """
+    value_names = _as_list(values) or ['count']
+    row_labels, col_labels, cells, stats = _pivot_cells(df, index, columns, values, aggfunc,
+                                                        max_workers)
+    n_rows = len(row_labels)
+    n_cols = len(col_labels) if col_labels is not None else 1
+
+    if long_format:
+        levels, codes, names = _cell_labels(row_labels, cells // n_cols)
+        if col_labels is not None:
+            col_levels, col_codes, col_names = _cell_labels(col_labels, cells % n_cols)
+            levels, codes, names = levels + col_levels, codes + col_codes, names + col_names
+        cell_index = pd.MultiIndex(levels=levels, codes=codes, names=names,
+                                   verify_integrity=False)
+        if cell_index.nlevels == 1:
+            cell_index = cell_index.get_level_values(0)
+        return pd.DataFrame(dict(zip(value_names, stats)), index=cell_index)
+
+    if n_rows * n_cols * len(stats) > MAX_PIVOT_CELLS:
+        raise ValueError(
+            f"The pivot table would have {n_rows:,} x {n_cols * len(stats):,} cells; "
+            "use the long format or fewer keys.")
+    if col_labels is None:
+        # Every row label has rows, so there are no empty cells
+        return pd.DataFrame(dict(zip(value_names, stats)), index=row_labels)
+    frames = [pd.DataFrame(_wide_grid(n_rows, n_cols, cells, stat, fill_value),
+                           index=row_labels, columns=col_labels) for stat in stats]
+    if values is None or isinstance(values, str):
+        return frames[0]
+    return pd.concat(dict(zip(value_names, frames)), axis=1)
+
+
+def crosstab(df, index, columns, normalize=None, margins=False):
+    """
+    Counts the rows of every combination of row and column keys.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to tabulate.
+        index (str or list of str): Columns whose values become the rows.
+        columns (str or list of str): Columns whose values become the columns.
+        normalize (str, optional): Divide the counts by the grand total ('all'), the
+            row totals ('index') or the column totals ('columns').
+        margins (bool, optional): Add an 'All' row and column with the totals.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame: The counts (or shares), with zeros for empty cells.
+
+    Raises:
+        ValueError: If normalize is invalid or the table is too large.
+    """
+    if normalize is not None and normalize not in CROSSTAB_NORMALIZE:
+        raise ValueError(f"Invalid normalization: {normalize}")
+    if not _as_list(columns):
+        raise ValueError("No column keys specified.")
+    table = pivot_table(df, index, columns, aggfunc='count', fill_value=0)
+    counts = table.to_numpy()
+    row_totals, col_totals, total = counts.sum(axis=1), counts.sum(axis=0), counts.sum()
+
+    if margins:
+        def with_total(labels):
+            label = 'All' if labels.nlevels == 1 else ('All',) + ('',) * (labels.nlevels - 1)
+            result = labels.append(pd.Index([label]))
+            result.names = labels.names
+            return result
+
+        counts = np.vstack([np.column_stack([counts, row_totals]), np.append(col_totals, total)])
+        row_totals, col_totals = np.append(row_totals, total), np.append(col_totals, total)
+        table = pd.DataFrame(counts, index=with_total(table.index),
+                             columns=with_total(table.columns))
+
+    if normalize is not None:
+        totals = {'all': max(total, 1), 'index': row_totals[:, None],
+                  'columns': col_totals[None, :]}[normalize]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            table = pd.DataFrame(counts / totals, index=table.index, columns=table.columns)
+    return table
@@ -1,7 +1,40 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+# Candidate formats tried on a sample before a whole column is parsed as dates.
+DATETIME_FORMATS = [
+    '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M',
+    '%Y/%m/%d', '%Y%m%d', '%d/%m/%Y', '%m/%d/%Y', '%d/%m/%Y %H:%M',
+    '%m/%d/%Y %H:%M', '%d.%m.%Y', '%d-%m-%Y', '%d %b %Y', '%b %d %Y',
+]
+BOOLEAN_VALUES = {
+    'true': True, 'false': False, 'yes': True, 'no': False, 't': True, 'f': False,
+    'y': True, 'n': False, '1': True, '0': False, 'on': True, 'off': False,
+}
+CONVERSION_SAMPLE_SIZE = 1000
+# Share of sampled values that must parse for 'auto' to pick a type.
+AUTO_MIN_SUCCESS = 0.95
+CONVERSION_TYPES = ['auto', 'numeric', 'datetime', 'boolean', 'category', 'string']
+OUTLIER_METHODS = ['iqr', 'zscore', 'mad', 'isolation_forest']
+# Default cut-off per method: IQR multiples beyond the quartiles, standard
+# deviations, robust (MAD-based) z-scores, and the isolation forest anomaly score.
+OUTLIER_FACTORS = {'iqr': 1.5, 'zscore': 3.0, 'mad': 3.5, 'isolation_forest': 0.6}
+# Scales the median absolute deviation to the standard deviation of normal data.
+MAD_SCALE = 1.4826
+# Rows scored per block by isolation_forest_scores.
+ISOLATION_BLOCK_SIZE = 32_768
+# Distinct values hashed per block; bounds the memory of the n-gram arrays.
+MINHASH_BLOCK_SIZE = 100_000
+# Members of an LSH bucket are compared with this many following members, so
+# small buckets are compared pairwise and huge ones stay linear.
+MAX_BUCKET_NEIGHBOURS = 20
+
 
-def clean_missing_values(df, method='drop', fill_value=None):
+def clean_missing_values(df, method='drop', fill_value=None, columns=None):
     """
     Handles missing values in a DataFrame.
 
@@ -16,6 +49,8 @@ def clean_missing_values(df, method='drop', fill_value=None):
             - 'constant': Fill missing values with a specified 'fill_value'.
             Defaults to 'drop'.
         fill_value: Value to use when method is 'constant'. Defaults to None.
+        columns (list of str, optional): Only look at and fill these columns.
+            Defaults to all columns.
 
     Returns:
         pd.DataFrame: The DataFrame with missing values handled.
@@ -23,21 +58,22 @@ def clean_missing_values(df, method='drop', fill_value=None):
     Raises:
         ValueError: If an invalid method is provided.
     """
+    selected = df if columns is None else df[list(columns)]
     if method == 'drop':
-        df_cleaned = df.dropna()
+        df_cleaned = df.dropna(subset=columns)
     elif method == 'mean':
-        df_cleaned = df.fillna(df.mean(numeric_only=True))
+        df_cleaned = df.fillna(selected.mean(numeric_only=True))
     elif method == 'median':
-        df_cleaned = df.fillna(df.median(numeric_only=True))
-    elif method == 'ffill':
-        df_cleaned = df.fillna(method='ffill')
-    elif method == 'bfill':
-        df_cleaned = df.fillna(method='bfill')
+        df_cleaned = df.fillna(selected.median(numeric_only=True))
+    elif method in ('ffill', 'bfill'):
+        filled = selected.ffill() if method == 'ffill' else selected.bfill()
+        df_cleaned = df.copy(deep=False)
+        df_cleaned[filled.columns] = filled
     elif method == 'constant':
         if fill_value is None:
             raise ValueError(
                 "fill_value must be specified when method is 'constant'.")
-        df_cleaned = df.fillna(fill_value)
+        df_cleaned = df.fillna({col: fill_value for col in selected.columns})
     else:
         raise ValueError("Invalid method for handling missing values.")
     return df_cleaned
@@ -63,6 +99,241 @@ def remove_duplicates(df, subset=None, keep='first'):
     return df_cleaned
 
 
+def normalize_text(series, sort_tokens=False):
+    """
+    Normalizes text for matching: case, accents, punctuation and whitespace.
+
+    Each distinct value is normalized once and the results are mapped back, so
+    columns with many repeated values are cheap.
+
+    Args:
+        series (pd.Series): The column to normalize; missing values become ''.
+        sort_tokens (bool, optional): Sort the words, so that 'Smith, John' and
+            'John Smith' match. Defaults to False.
+
+    Returns:
+        pd.Series: The normalized strings, with the index of series.
+    """
+    codes, uniques = pd.factorize(series, sort=False)
+    # Object dtype: Python's re, whose \w also matches non-ASCII letters
+    text = pd.Series([str(value) for value in uniques], dtype=object)
+    text = (text.str.normalize('NFKD')
+            .str.replace(r'[\u0300-\u036f]', '', regex=True)  # combining accents
+            .str.casefold()
+            .str.replace(r'[^\w\s]|_', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip())
+    if sort_tokens:
+        text = text.str.split().map(sorted).str.join(' ')
+    normalized = np.append(text.to_numpy(dtype=object), '')  # code -1 (missing) -> ''
+    return pd.Series(normalized[codes], index=series.index, dtype=object)
+
+
+def _match_keys(df, subset, sort_tokens):
+    # One normalized string per row, joining the columns of subset
+    columns = list(df.columns) if subset is None else (
+        [subset] if isinstance(subset, str) else list(subset))
+    keys = normalize_text(df[columns[0]], sort_tokens)
+    for col in columns[1:]:
+        keys = keys.str.cat(normalize_text(df[col], sort_tokens), sep=' | ')
+    return keys
+
+
+def _minhash_signatures(strings, ngram, num_perm, seed):
+    # MinHash signatures of the character n-gram sets of strings, and a mask of
+    # the strings that have any n-gram
+    rng = np.random.default_rng(seed)
+    # Multiply-shift hashing: ((a * x + b) mod 2**64) >> 32 with odd a
+    a = rng.integers(1, 1 << 63, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 1 << 63, num_perm, dtype=np.uint64)
+    signatures = np.full((len(strings), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    has_ngrams = np.zeros(len(strings), dtype=bool)
+
+    for start in range(0, len(strings), MINHASH_BLOCK_SIZE):
+        block = strings[start:start + MINHASH_BLOCK_SIZE]
+        # Pad with spaces so that word boundaries and short values yield n-grams
+        encoded = pd.Series(block, dtype=object).map(lambda v: f" {v} ").str.encode('utf-8')
+        lengths = encoded.str.len().to_numpy()
+        data = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint64)
+        if len(data) < ngram:
+            continue
+
+        # Every n bytes packed into one integer: an exact id of the n-gram
+        codes = np.zeros(len(data) - ngram + 1, dtype=np.uint64)
+        for i in range(ngram):
+            codes = (codes << np.uint64(8)) | data[i:len(data) - ngram + 1 + i]
+        owner = np.repeat(np.arange(len(block)), lengths)[:len(codes)]
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        valid = np.arange(len(codes)) - offsets[owner] <= lengths[owner] - ngram
+        codes, owner = codes[valid], owner[valid]
+        if len(codes) == 0:
+            continue
+
+        # Owners are sorted, so every string is one segment of codes
+        segments = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+        rows = start + owner[segments]
+        has_ngrams[rows] = True
+        with np.errstate(over='ignore'):
+            for k in range(num_perm):
+                hashed = (a[k] * codes + b[k]) >> np.uint64(32)
+                signatures[rows, k] = np.minimum.reduceat(hashed, segments)
+    return signatures, has_ngrams
+
+
+def _lsh_bands(threshold, num_perm):
+    # Fewest bands (fewest candidates) that still propose a pair with similarity
+    # threshold with 99% probability
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= 0.99:
+            return bands, rows
+    return num_perm, 1
+
+
+def _lsh_candidates(signatures, has_ngrams, blocks, threshold, seed):
+    # Candidate pairs (i < j) of strings sharing an LSH bucket in any band, never
+    # crossing a block
+    n, num_perm = signatures.shape
+    bands, rows = _lsh_bands(threshold, num_perm)
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(1, 1 << 63, rows + 1, dtype=np.uint64) | np.uint64(1)
+    candidates = np.flatnonzero(has_ngrams)
+
+    pairs = []
+    with np.errstate(over='ignore'):
+        for band in range(bands):
+            key = blocks[candidates].astype(np.uint64) * multipliers[rows]
+            for j in range(rows):
+                key = key * multipliers[j] + signatures[candidates, band * rows + j]
+            order = np.argsort(key, kind='stable')
+            key, order = key[order], candidates[order]
+            for offset in range(1, MAX_BUCKET_NEIGHBOURS + 1):
+                same = np.flatnonzero(key[offset:] == key[:-offset])
+                if len(same) == 0:
+                    break
+                # order is ascending within a bucket, so left < right
+                pairs.append(order[same] * n + order[same + offset])
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(pairs)
+    pairs.sort()
+    pairs = pairs[np.r_[True, pairs[1:] != pairs[:-1]]]
+    return np.stack([pairs // n, pairs % n], axis=1)
+
+
+def _connected_components(n, pairs):
+    # Label of every node: the smallest node of its component
+    labels = np.arange(n)
+    if len(pairs) == 0:
+        return labels
+    left, right = pairs[:, 0], pairs[:, 1]
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, low)
+        np.minimum.at(updated, right, low)
+        # Pointer jumping: follow labels to their current root
+        while True:
+            jumped = updated[updated]
+            if np.array_equal(jumped, updated):
+                break
+            updated = jumped
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def find_near_duplicates(df, subset=None, threshold=0.8, block_on=None, sort_tokens=False,
+                         ngram=3, num_perm=64, seed=0):
+    """
+    Groups rows whose text is equal or nearly equal after normalization.
+
+    Values are normalized with normalize_text, so differences in case, accents,
+    punctuation and whitespace are ignored. Typos are caught by comparing the
+    character n-grams of the distinct normalized values: MinHash signatures and
+    locality-sensitive hashing (LSH) propose candidate pairs in near-linear time,
+    instead of comparing all pairs, and pairs whose estimated Jaccard similarity
+    reaches the threshold are merged into groups (transitively).
+
+    Args:
+        df (pd.DataFrame): The DataFrame to check.
+        subset (str or list of str, optional): Columns to compare, joined into one
+            text per row. Defaults to all columns.
+        threshold (float, optional): Minimum n-gram Jaccard similarity, between 0
+            and 1; 1 only merges values that are equal after normalization.
+            Defaults to 0.8.
+        block_on (str or list of str, optional): Only match rows that have equal
+            values in these columns (e.g. a postal code).
+        sort_tokens (bool, optional): Ignore the order of words. Defaults to False.
+        ngram (int, optional): Characters per n-gram, 2 to 4. Defaults to 3.
+        num_perm (int, optional): MinHash signature length; more is more accurate
+            and slower. Defaults to 64.
+        seed (int, optional): Seed of the hash functions. Defaults to 0.
+
+    Returns:
+        pd.Series: For every row of df, the position of the first row of its group.
+
+    Raises:
+        ValueError: If threshold or ngram is out of range.
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError(f"Invalid similarity threshold: {threshold}")
+    if not 2 <= ngram <= 4:
+        raise ValueError(f"Invalid n-gram size: {ngram}")
+
+    keys = _match_keys(df, subset, sort_tokens)
+    if block_on is not None:
+        block_codes = df.groupby(block_on, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        block_codes = np.zeros(len(df), dtype=np.int64)
+
+    # Exact duplicates after normalization (within a block) collapse into one
+    # distinct value
+    key_codes, key_uniques = pd.factorize(keys, sort=False)
+    codes, uniques = pd.factorize(block_codes * len(key_uniques) + key_codes, sort=False)
+    first_rows = pd.Series(np.arange(len(df))).groupby(codes).min().to_numpy()
+
+    labels = np.arange(len(uniques))
+    if threshold < 1 and len(uniques) > 1:
+        strings = keys.to_numpy(dtype=object)[first_rows]
+        signatures, has_ngrams = _minhash_signatures(strings, ngram, num_perm, seed)
+        pairs = _lsh_candidates(signatures, has_ngrams, block_codes[first_rows], threshold,
+                                seed)
+        # Estimated Jaccard similarity: the share of equal signature positions
+        matches = [chunk[(signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+                         >= threshold]
+                   for chunk in np.array_split(pairs, max(1, len(pairs) // 1_000_000))]
+        labels = _connected_components(len(uniques), np.concatenate(matches))
+
+    group_first = pd.Series(first_rows).groupby(labels).transform('min').to_numpy()
+    return pd.Series(group_first[codes], index=df.index, name='duplicate_group')
+
+
+def remove_near_duplicates(df, subset=None, threshold=0.8, keep='first', block_on=None,
+                           sort_tokens=False):
+    """
+    Removes rows whose text is equal or nearly equal after normalization.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to clean.
+        subset (str or list of str, optional): Columns to compare. Defaults to all
+            columns.
+        threshold (float, optional): Minimum similarity, see find_near_duplicates.
+            Defaults to 0.8.
+        keep (str, optional): Which row of a group to keep: 'first', 'last' or
+            False (drop all rows of groups with duplicates). Defaults to 'first'.
+        block_on (str or list of str, optional): Only match rows with equal values
+            in these columns.
+        sort_tokens (bool, optional): Ignore the order of words. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The DataFrame with near-duplicates removed.
+    """
+    groups = find_near_duplicates(df, subset=subset, threshold=threshold, block_on=block_on,
+                                  sort_tokens=sort_tokens)
+    return df[~groups.duplicated(keep=keep).to_numpy()]
+
+
 def filter_data(df, column, condition, value):
     """
     Filters a DataFrame based on a given condition.
@@ -99,3 +370,493 @@ def filter_data(df, column, condition, value):
     else:
         raise ValueError(f"Invalid condition: {condition}")
     return df_filtered
+
+
+def _sample(series, sample_size=CONVERSION_SAMPLE_SIZE):
+    values = series.dropna()
+    if len(values) > sample_size:
+        values = values.sample(sample_size, random_state=0)
+    return values
+
+
+def infer_datetime_format(series, sample_size=CONVERSION_SAMPLE_SIZE):
+    """
+    Picks the datetime format that parses the most values of a sample.
+
+    Args:
+        series (pd.Series): Column of date strings.
+        sample_size (int, optional): Number of non-null values to try the formats on.
+
+    Returns:
+        str or None: The best format from DATETIME_FORMATS, or None if none matches.
+    """
+    sample = _sample(series, sample_size).astype(str).str.strip()
+    if sample.empty:
+        return None
+    best_format, best_rate = None, 0.0
+    for fmt in DATETIME_FORMATS:
+        rate = pd.to_datetime(sample, format=fmt, errors='coerce').notna().mean()
+        if rate > best_rate:
+            best_format, best_rate = fmt, rate
+            if rate == 1.0:
+                break
+    return best_format
+
+
+def _missing(series):
+    # Missing values, including NaN in Arrow-backed float columns, where isna()
+    # only reports nulls
+    missing = series.isna()
+    if isinstance(series.dtype, pd.ArrowDtype) and pd.api.types.is_float_dtype(series.dtype):
+        missing |= np.isnan(series.to_numpy(dtype=float, na_value=np.nan))
+    return missing
+
+
+def _to_numeric(series):
+    if isinstance(series.dtype, pd.ArrowDtype) and not pd.api.types.is_numeric_dtype(series):
+        # Parsed Arrow strings give NaN instead of nulls for unparsable values
+        series = series.astype(object)
+    converted = pd.to_numeric(series, errors='coerce')
+    failed = series.notna() & _missing(converted)
+    if failed.any() and not pd.api.types.is_numeric_dtype(series):
+        # Retry only the failures with thousands separators and spaces removed
+        cleaned = series[failed].astype(str).str.replace(r'[\s,_]', '', regex=True)
+        converted[failed] = pd.to_numeric(cleaned, errors='coerce')
+    return converted
+
+
+def _to_datetime(series, datetime_format=None):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    fmt = datetime_format or infer_datetime_format(series)
+    return pd.to_datetime(series, format=fmt or 'mixed', errors='coerce')
+
+
+def _to_boolean(series):
+    if pd.api.types.is_bool_dtype(series):
+        return series.astype('boolean')
+    if pd.api.types.is_numeric_dtype(series):
+        return series.map({1: True, 0: False}).astype('boolean')
+    lowered = series.astype('string').str.strip().str.lower()
+    return lowered.map(BOOLEAN_VALUES).astype('boolean')
+
+
+def infer_conversion_type(series, sample_size=CONVERSION_SAMPLE_SIZE):
+    """
+    Chooses a target type for a column by trial-converting a sample.
+
+    Numeric, boolean and datetime parsers are tried in that order; the first one
+    that parses at least AUTO_MIN_SUCCESS of the sample wins. Low-cardinality text
+    falls back to 'category', anything else to None (leave unchanged).
+
+    Args:
+        series (pd.Series): The column to inspect.
+        sample_size (int, optional): Number of non-null values to sample.
+
+    Returns:
+        str or None: One of 'numeric', 'boolean', 'datetime', 'category' or None.
+    """
+    sample = _sample(series, sample_size)
+    if sample.empty or pd.api.types.is_numeric_dtype(series) \
+            or pd.api.types.is_datetime64_any_dtype(series):
+        return None
+    if (~_missing(_to_numeric(sample))).mean() >= AUTO_MIN_SUCCESS:
+        return 'numeric'
+    if _to_boolean(sample).notna().mean() >= AUTO_MIN_SUCCESS:
+        return 'boolean'
+    fmt = infer_datetime_format(sample, sample_size)
+    if fmt and _to_datetime(sample, fmt).notna().mean() >= AUTO_MIN_SUCCESS:
+        return 'datetime'
+    if sample.nunique() <= max(20, len(sample) * 0.05):
+        return 'category'
+    return None
+
+
+def convert_series_type(series, target, datetime_format=None):
+    """
+    Converts a single column to the target type, turning unparsable values into NA.
+
+    Args:
+        series (pd.Series): The column to convert.
+        target (str): One of CONVERSION_TYPES.
+        datetime_format (str, optional): strftime format for 'datetime'. Inferred
+            from a sample when omitted.
+
+    Returns:
+        tuple: (converted pd.Series, number of non-null values that failed to convert).
+
+    Raises:
+        ValueError: If an invalid target type is provided.
+    """
+    if target == 'auto':
+        target = infer_conversion_type(series)
+        if target is None:
+            return series, 0
+
+    if target == 'numeric':
+        converted = _to_numeric(series)
+    elif target == 'datetime':
+        converted = _to_datetime(series, datetime_format)
+    elif target == 'boolean':
+        converted = _to_boolean(series)
+    elif target == 'category':
+        converted = series.astype('category')
+    elif target == 'string':
+        converted = series.astype('string')
+    else:
+        raise ValueError(f"Invalid conversion type: {target}")
+
+    failed = int((series.notna() & _missing(converted)).sum())
+    return converted, failed
+
+
+def convert_column_types(df, conversions, datetime_formats=None, max_workers=None):
+    """
+    Converts several columns to new types in parallel.
+
+    Values that cannot be converted become missing values and are counted in the
+    report instead of raising an error.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+        conversions (dict): Maps column names to a target type from CONVERSION_TYPES.
+            Example: {'price': 'numeric', 'date': 'datetime', 'status': 'auto'}
+        datetime_formats (dict, optional): Maps column names to explicit datetime
+            formats. Columns without an entry have their format inferred.
+        max_workers (int, optional): Number of threads. Defaults to the CPU count.
+
+    Returns:
+        tuple: (converted pd.DataFrame, dict mapping each column to its number of
+        failed conversions).
+
+    Raises:
+        KeyError: If a column is not in the DataFrame.
+    """
+    missing = [col for col in conversions if col not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not found: {', '.join(map(str, missing))}")
+
+    datetime_formats = datetime_formats or {}
+    df_converted = df.copy(deep=False)
+    report = {}
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        futures = {col: executor.submit(convert_series_type, df[col], target,
+                                        datetime_formats.get(col))
+                   for col, target in conversions.items()}
+        for col, future in futures.items():
+            df_converted[col], report[col] = future.result()
+    return df_converted, report
+
+
+def _numeric_columns(df, columns):
+    if columns is None:
+        return df.select_dtypes(include=['number']).columns.tolist()
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    invalid = [col for col in columns if not pd.api.types.is_numeric_dtype(df[col])]
+    if invalid:
+        raise ValueError(f"Columns are not numerical: {', '.join(map(str, invalid))}")
+    return columns
+
+
+def _column_values(df, col):
+    # Float view of a column (no copy for float64 columns); NA becomes NaN
+    return df[col].to_numpy(dtype=float, na_value=np.nan)
+
+
+def outlier_bounds(df, columns=None, method='iqr', factor=None):
+    """
+    Computes the range of normal values of numerical columns.
+
+    The statistics of all columns are computed together, with one quantile,
+    mean/std or median call over the selected columns. Missing values are ignored.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to inspect.
+        columns (str or list of str, optional): Numerical columns. Defaults to all.
+        method (str, optional): 'iqr' (quartiles -/+ factor * IQR), 'zscore'
+            (mean -/+ factor * std) or 'mad' (median -/+ factor * scaled MAD).
+            Defaults to 'iqr'.
+        factor (float, optional): Width of the range. Defaults to OUTLIER_FACTORS.
+
+    Returns:
+        dict: Maps each column to [low, high]; JSON-serializable, so the bounds can
+        be stored in a cleaning pipeline and applied to other data or chunks.
+        Columns without bounds (no values, or a single one for 'zscore') are left
+        out.
+
+    Raises:
+        ValueError: If the method is invalid or a column is not numerical.
+    """
+    if method not in ('iqr', 'zscore', 'mad'):
+        raise ValueError(f"Invalid outlier method for bounds: {method}")
+    columns = _numeric_columns(df, columns)
+    if not columns:
+        return {}
+    factor = OUTLIER_FACTORS[method] if factor is None else factor
+    values = df[columns]
+
+    if method == 'iqr':
+        quartiles = values.quantile([0.25, 0.75])
+        q1, q3 = quartiles.iloc[0], quartiles.iloc[1]
+        low, high = q1 - factor * (q3 - q1), q3 + factor * (q3 - q1)
+    elif method == 'zscore':
+        mean, std = values.mean(), values.std()
+        low, high = mean - factor * std, mean + factor * std
+    else:
+        median = values.median()
+        mad = (values - median).abs().median() * MAD_SCALE
+        low, high = median - factor * mad, median + factor * mad
+    low, high = low.astype('Float64'), high.astype('Float64')
+    return _finite_bounds(columns, low, high)
+
+
+def _finite_bounds(columns, low, high):
+    # Bounds of the columns where both are known; NaN is not valid JSON
+    return {col: [float(low[col]), float(high[col])] for col in columns
+            if not (pd.isna(low[col]) or pd.isna(high[col]))}
+
+
+def outlier_bounds_from_chunks(chunks, columns=None, method='iqr', factor=None,
+                               sample_size=100_000, seed=0):
+    """
+    Computes outlier bounds over a stream of chunks.
+
+    'zscore' bounds are exact (means and variances of the chunks are merged).
+    'iqr' and 'mad' need quantiles, which are taken from a uniform random sample
+    of sample_size rows kept while streaming, so memory stays bounded.
+
+    Args:
+        chunks (iterable of pd.DataFrame): The data, e.g. from
+            data_loader.iter_data_chunks.
+        columns, method, factor: See outlier_bounds.
+        sample_size (int, optional): Rows sampled for 'iqr' and 'mad'. Defaults
+            to 100000.
+        seed (int, optional): Seed of the sample. Defaults to 0.
+
+    Returns:
+        dict: Maps each column to [low, high], see outlier_bounds.
+
+    Raises:
+        ValueError: If the method is invalid or a column is not numerical.
+    """
+    if method not in ('iqr', 'zscore', 'mad'):
+        raise ValueError(f"Invalid outlier method for bounds: {method}")
+    rng = np.random.default_rng(seed)
+    count = mean = m2 = None
+    sample, sample_keys = None, None
+
+    for chunk in chunks:
+        if columns is None:
+            columns = _numeric_columns(chunk, None)
+        values = chunk[list(columns)]
+        if method == 'zscore':
+            # Chan et al.'s parallel update of count, mean and squared deviations
+            n, chunk_mean = values.count(), values.mean()
+            chunk_m2 = values.var(ddof=0) * n
+            if count is None:
+                count, mean, m2 = n, chunk_mean.fillna(0), chunk_m2.fillna(0)
+                continue
+            total = count + n
+            delta = (chunk_mean - mean).fillna(0)
+            weight = (n / total).fillna(0)
+            mean = mean + delta * weight
+            m2 = m2 + chunk_m2.fillna(0) + delta ** 2 * count * weight
+            count = total
+        else:
+            # Keep the rows with the smallest random keys: a uniform sample
+            keys = rng.random(len(values))
+            if sample is not None:
+                values = pd.concat([sample, values], ignore_index=True)
+                keys = np.concatenate([sample_keys, keys])
+            keep = np.argsort(keys, kind='stable')[:sample_size]
+            sample, sample_keys = values.iloc[keep], keys[keep]
+
+    if method != 'zscore':
+        return outlier_bounds(sample, columns, method, factor) if sample is not None else {}
+    if count is None:
+        return {}
+    factor = OUTLIER_FACTORS[method] if factor is None else factor
+    std = (m2 / (count - 1)).where(count > 1) ** 0.5
+    mean = mean.where(count > 0)
+    return _finite_bounds(columns, mean - factor * std, mean + factor * std)
+
+
+def _average_path_length(n):
+    # Average depth of an unsuccessful search in a binary search tree of n points
+    n = np.asarray(n, dtype=float)
+    harmonic = np.log(np.maximum(n - 1, 1)) + np.euler_gamma
+    return np.where(n > 2, 2 * harmonic - 2 * (n - 1) / np.maximum(n, 1),
+                    np.where(n == 2, 1.0, 0.0))
+
+
+def _build_isolation_tree(sample, rng, max_depth):
+    # A tree as arrays: split feature (0 for leaves), threshold, children
+    # (left, right; leaves point to themselves) and the path length credited to
+    # rows ending in each node
+    feature, threshold, children, path = [], [], [], []
+
+    def grow(rows, depth):
+        node = len(feature)
+        feature.append(0)
+        threshold.append(0.0)
+        children.append([node, node])
+        path.append(depth + float(_average_path_length(len(rows))))
+        if depth >= max_depth or len(rows) <= 1:
+            return node
+        low, high = rows.min(axis=0), rows.max(axis=0)
+        splittable = np.flatnonzero(high > low)
+        if len(splittable) == 0:
+            return node
+        col = rng.choice(splittable)
+        split = rng.uniform(low[col], high[col])
+        feature[node], threshold[node] = col, split
+        children[node] = [grow(rows[rows[:, col] < split], depth + 1),
+                          grow(rows[rows[:, col] >= split], depth + 1)]
+        return node
+
+    grow(sample, 0)
+    return (np.array(feature), np.array(threshold), np.array(children).ravel(),
+            np.array(path))
+
+
+def isolation_forest_scores(df, columns=None, n_trees=100, sample_size=256, seed=0):
+    """
+    Scores rows by how easily random splits isolate them (isolation forest).
+
+    Trees are grown on small random samples; all rows are then routed through a
+    tree together, one level at a time, so scoring is vectorized over the rows.
+    Missing values are replaced by the column median.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to score.
+        columns (str or list of str, optional): Numerical columns. Defaults to all.
+        n_trees (int, optional): Number of trees. Defaults to 100.
+        sample_size (int, optional): Rows per tree. Defaults to 256.
+        seed (int, optional): Seed of the samples and splits. Defaults to 0.
+
+    Returns:
+        pd.Series: Anomaly scores between 0 and 1; values near 1 are outliers,
+        values up to about 0.5 are normal.
+
+    Raises:
+        ValueError: If a column is not numerical.
+    """
+    columns = _numeric_columns(df, columns)
+    if not columns or len(df) == 0:
+        return pd.Series(0.5, index=df.index, name='anomaly_score')
+    values = np.column_stack([_column_values(df, col) for col in columns])
+    medians = np.nan_to_num(np.nanmedian(values, axis=0)) if np.isnan(values).any() else None
+    if medians is not None:
+        values = np.where(np.isnan(values), medians, values)
+
+    rng = np.random.default_rng(seed)
+    sample_size = min(sample_size, len(values))
+    max_depth = int(np.ceil(np.log2(max(sample_size, 2))))
+    trees = [_build_isolation_tree(values[rng.choice(len(values), sample_size, replace=False)],
+                                   rng, max_depth)
+             for _ in range(n_trees)]
+
+    total = np.zeros(len(values))
+    # Blocks of rows keep the per-level arrays in the CPU cache
+    for start in range(0, len(values), ISOLATION_BLOCK_SIZE):
+        block = values[start:start + ISOLATION_BLOCK_SIZE]
+        flat = block.ravel()
+        offsets = np.arange(len(block)) * len(columns)
+        for feature, threshold, children, path in trees:
+            node = np.zeros(len(block), dtype=np.intp)
+            for _ in range(max_depth):
+                go_right = flat[offsets + feature[node]] >= threshold[node]
+                # Leaves point to themselves, so rows that reached one stay there
+                node = children[2 * node + go_right]
+            total[start:start + len(block)] += path[node]
+    scores = 2.0 ** (-total / n_trees / max(float(_average_path_length(sample_size)), 1.0))
+    return pd.Series(scores, index=df.index, name='anomaly_score')
+
+
+def outlier_mask(df, columns=None, method='iqr', factor=None, bounds=None):
+    """
+    Flags the rows that contain an outlier.
+
+    Columns are compared with their bounds one at a time through float views, so
+    the frame is never copied; the result can be used to filter or inspect rows.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to check.
+        columns (str or list of str, optional): Numerical columns. Defaults to all.
+        method (str, optional): One of OUTLIER_METHODS. Defaults to 'iqr'.
+        factor (float, optional): Cut-off, see OUTLIER_FACTORS; for
+            'isolation_forest' the minimum anomaly score.
+        bounds (dict, optional): Precomputed bounds (e.g. from
+            outlier_bounds_from_chunks); columns, method and factor are then
+            ignored.
+
+    Returns:
+        pd.Series: True for rows with at least one value outside its bounds.
+
+    Raises:
+        ValueError: If the method is invalid or a column is not numerical.
+    """
+    if bounds is None:
+        if method == 'isolation_forest':
+            factor = OUTLIER_FACTORS[method] if factor is None else factor
+            return (isolation_forest_scores(df, columns) >= factor).rename('outlier')
+        if method not in OUTLIER_METHODS:
+            raise ValueError(f"Invalid outlier method: {method}")
+        bounds = outlier_bounds(df, columns, method, factor)
+
+    mask = np.zeros(len(df), dtype=bool)
+    for col, (low, high) in bounds.items():
+        values = _column_values(df, col)
+        mask |= (values < low) | (values > high)
+    return pd.Series(mask, index=df.index, name='outlier')
+
+
+def remove_outliers(df, columns=None, method='iqr', factor=None, bounds=None):
+    """
+    Removes rows that contain an outlier.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to clean.
+        columns, method, factor, bounds: See outlier_mask.
+
+    Returns:
+        pd.DataFrame: The DataFrame without outlier rows.
+    """
+    mask = outlier_mask(df, columns=columns, method=method, factor=factor, bounds=bounds)
+    return df[~mask.to_numpy()]
+
+
+def clip_outliers(df, columns=None, method='iqr', factor=None, bounds=None):
+    """
+    Replaces outliers by the nearest bound (winsorizing), keeping all rows.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to clean.
+        columns, method, factor, bounds: See outlier_bounds; 'isolation_forest'
+            has no bounds and cannot be used.
+
+    Returns:
+        pd.DataFrame: The DataFrame with clipped values and the original dtypes;
+        integer columns are clipped to the integers inside their bounds. Columns
+        without outliers are shared with df.
+    """
+    if bounds is None:
+        bounds = outlier_bounds(df, columns, method, factor)
+    df_clipped = df.copy(deep=False)
+    for col, (low, high) in bounds.items():
+        column = df[col]
+        if pd.api.types.is_integer_dtype(column.dtype):
+            low = math.ceil(low) if math.isfinite(low) else None
+            high = math.floor(high) if math.isfinite(high) else None
+            if low is not None and high is not None and high < low:
+                # No integer lies inside the bounds
+                high = low
+        values = _column_values(df, col)
+        outside = np.zeros(len(values), dtype=bool)
+        if low is not None:
+            outside |= values < low
+        if high is not None:
+            outside |= values > high
+        if outside.any():
+            df_clipped[col] = column.clip(low, high).astype(column.dtype)
+    return df_clipped
@@ -0,0 +1,330 @@
+import gzip
+import io
+import os
+import time
+
+
+# Maps file suffixes to (format, compression); longest suffixes are matched first.
+EXPORT_SUFFIXES = {
+    '.csv.gz': ('csv', 'gzip'),
+    '.csv.zst': ('csv', 'zstd'),
+    '.csv': ('csv', None),
+    '.xlsx': ('excel', None),
+    '.parquet': ('parquet', None),
+    '.feather': ('feather', None),
+    '.arrow': ('feather', None),
+}
+EXCEL_MAX_ROWS = 1_048_576
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def detect_export_format(file_path):
+    """
+    Determines the export format and compression from a file name.
+
+    Args:
+        file_path (str): Destination path.
+
+    Returns:
+        tuple: (format, compression), e.g. ('csv', 'gzip').
+
+    Raises:
+        ValueError: If the suffix is not supported.
+    """
+    lower = file_path.lower()
+    for suffix in sorted(EXPORT_SUFFIXES, key=len, reverse=True):
+        if lower.endswith(suffix):
+            return EXPORT_SUFFIXES[suffix]
+    raise ValueError(f"Unsupported export file type: {os.path.basename(file_path)}")
+
+
+def iter_frame_chunks(df, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Splits a DataFrame into row chunks without copying.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to split.
+        chunk_size (int, optional): Rows per chunk. Defaults to 100000.
+
+    Yields:
+        pd.DataFrame: Consecutive row slices of df; one empty slice if df is empty,
+        so that writers still get its columns.
+    """
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def _open_text(file_path, compression):
+    if compression == 'gzip':
+        # Level 6 instead of gzip.open's default 9: much faster for a few % in size
+        return gzip.open(file_path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the 'zstandard' package.")
+        raw = open(file_path, 'wb')
+        writer = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(raw)
+        return io.TextIOWrapper(writer, encoding='utf-8', newline='')
+    return open(file_path, 'w', encoding='utf-8', newline='')
+
+
+def arrow_schema(df):
+    """
+    Derives the Arrow schema of a whole DataFrame for a chunked Parquet/Feather export.
+
+    Inferring the schema from the first chunk alone types a column that is empty
+    there as null, and the first later chunk with values in it then fails.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to export.
+
+    Returns:
+        pyarrow.Schema: The schema, without the index.
+    """
+    import pyarrow as pa
+
+    return pa.Schema.from_pandas(df, preserve_index=False)
+
+
+def _chunk_table(chunk, schema):
+    # Converts a chunk with the export schema. Without one (lazy chunks) the schema
+    # comes from the first chunk, and columns that are empty there become strings.
+    import pyarrow as pa
+
+    if schema is None:
+        schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+        for i, field in enumerate(schema):
+            if pa.types.is_null(field.type):
+                schema = schema.set(i, field.with_type(pa.string()))
+    return pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+
+def _write_csv(chunks, file_path, compression, on_chunk, schema=None):
+    with _open_text(file_path, compression) as handle:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(handle, header=(i == 0), index=False)
+            on_chunk(len(chunk))
+
+
+def _write_parquet(chunks, file_path, compression, on_chunk, schema=None):
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = _chunk_table(chunk, schema)
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(file_path, schema,
+                                          compression=compression or 'snappy')
+            writer.write_table(table)
+            on_chunk(len(chunk))
+        if writer is None:
+            # No chunks: an empty file with the schema, if known
+            writer = pq.ParquetWriter(file_path, _empty_schema(schema),
+                                      compression=compression or 'snappy')
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _empty_schema(schema):
+    import pyarrow as pa
+
+    return schema if schema is not None else pa.schema([])
+
+
+def _write_feather(chunks, file_path, compression, on_chunk, schema=None):
+    import pyarrow as pa
+
+    writer = sink = None
+    try:
+        for chunk in chunks:
+            table = _chunk_table(chunk, schema)
+            if writer is None:
+                schema = table.schema
+                sink = pa.OSFile(file_path, 'wb')
+                # Uncompressed by default so the file can later be memory-mapped
+                options = pa.ipc.IpcWriteOptions(compression=compression)
+                writer = pa.ipc.new_file(sink, schema, options=options)
+            writer.write_table(table)
+            on_chunk(len(chunk))
+        if writer is None:
+            # No chunks: an empty file with the schema, if known
+            sink = pa.OSFile(file_path, 'wb')
+            writer = pa.ipc.new_file(sink, _empty_schema(schema),
+                                     options=pa.ipc.IpcWriteOptions(compression=compression))
+    finally:
+        if writer is not None:
+            writer.close()
+        if sink is not None:
+            sink.close()
+
+
+def _write_excel(chunks, file_path, compression, on_chunk, schema=None):
+    from openpyxl import Workbook
+
+    # Write-only mode streams rows to disk instead of building the sheet in memory
+    workbook = Workbook(write_only=True)
+    sheet, sheet_rows, header = None, 0, None
+    for chunk in chunks:
+        if header is None:
+            header = [str(col) for col in chunk.columns]
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if sheet is None or sheet_rows >= EXCEL_MAX_ROWS:
+                # Rows beyond Excel's sheet limit continue on a new sheet
+                sheet = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+                sheet.append(header)
+                sheet_rows = 1
+            sheet.append(row)
+            sheet_rows += 1
+        on_chunk(len(chunk))
+    if sheet is None:
+        sheet = workbook.create_sheet("Sheet1")
+        if header is not None:
+            sheet.append(header)
+    workbook.save(file_path)
+
+
+WRITERS = {
+    'csv': _write_csv,
+    'parquet': _write_parquet,
+    'feather': _write_feather,
+    'excel': _write_excel,
+}
+
+
+def export_chunks(chunks, file_path, fmt=None, compression=None, progress_callback=None,
+                  schema=None):
+    """
+    Writes an iterable of DataFrame chunks to a single file.
+
+    Only one chunk is held in memory at a time, so the data to export can come
+    from a lazy source such as CleaningPipeline.iter_apply().
+
+    Args:
+        chunks (iterable of pd.DataFrame): Chunks with identical columns.
+        file_path (str): Destination path.
+        fmt (str, optional): 'csv', 'parquet', 'feather' or 'excel'. Detected from
+            the file name when omitted.
+        compression (str, optional): 'gzip' or 'zstd' for CSV, a Parquet codec
+            ('snappy', 'zstd', 'gzip', ...) or an Arrow IPC codec ('lz4', 'zstd') for
+            Feather. Detected from the file name when omitted.
+        progress_callback (callable, optional): Called after each chunk with the
+            number of rows written so far and the elapsed seconds.
+        schema (pyarrow.Schema, optional): Arrow schema of all chunks for Parquet
+            and Feather, see arrow_schema. Defaults to the schema of the first
+            chunk, with columns that are empty there written as strings.
+
+    Returns:
+        dict: Export statistics with the keys 'rows', 'seconds', 'rows_per_sec',
+        'bytes' and 'mb_per_sec'.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt is None:
+        fmt, detected_compression = detect_export_format(file_path)
+        compression = compression or detected_compression
+    if fmt not in WRITERS:
+        raise ValueError(f"Invalid export format: {fmt}")
+
+    start = time.perf_counter()
+    rows = 0
+
+    def on_chunk(n_rows):
+        nonlocal rows
+        rows += n_rows
+        if progress_callback is not None:
+            progress_callback(rows, time.perf_counter() - start)
+
+    WRITERS[fmt](chunks, file_path, compression, on_chunk, schema=schema)
+
+    seconds = max(time.perf_counter() - start, 1e-9)
+    size = os.path.getsize(file_path)
+    return {
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds,
+        'bytes': size,
+        'mb_per_sec': size / seconds / 1e6,
+    }
+
+
+def export_dataframe(df, file_path, fmt=None, compression=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    """
+    Writes a DataFrame to a file in chunks.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to export.
+        file_path (str): Destination path (.csv, .csv.gz, .csv.zst, .xlsx, .parquet,
+            .feather or .arrow).
+        fmt (str, optional): Format override, see export_chunks.
+        compression (str, optional): Compression override, see export_chunks.
+        chunk_size (int, optional): Rows per chunk. Defaults to 100000.
+        progress_callback (callable, optional): See export_chunks.
+
+    Returns:
+        dict: Export statistics, see export_chunks.
+    """
+    if fmt is None:
+        fmt, detected_compression = detect_export_format(file_path)
+        compression = compression or detected_compression
+    # The whole frame is at hand, so every chunk gets the types of its full columns
+    schema = arrow_schema(df) if fmt in ('parquet', 'feather') else None
+    return export_chunks(iter_frame_chunks(df, chunk_size), file_path, fmt=fmt,
+                         compression=compression, progress_callback=progress_callback,
+                         schema=schema)
+
+
+def export_pipeline(source_path, pipeline, file_path, fmt=None, compression=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None, usecols=None,
+                    sheet_name=None, cell_range=None, filters=None):
+    """
+    Streams a source file through a cleaning pipeline straight into an export file.
+
+    The cleaned dataset is never materialized: each chunk is read, cleaned and
+    written before the next one is loaded. Pass the options the data was loaded
+    with, so that the replay sees the same rows and columns.
+
+    Args:
+        source_path (str): Path of the original CSV/Excel file.
+        pipeline (CleaningPipeline): Steps to apply; must be streamable.
+        file_path (str): Destination path.
+        fmt (str, optional): Format override, see export_chunks.
+        compression (str, optional): Compression override, see export_chunks.
+        chunk_size (int, optional): Rows per chunk. Defaults to 100000.
+        progress_callback (callable, optional): See export_chunks.
+        usecols (list of str, optional): Only read these columns.
+        sheet_name (str, optional): Excel worksheet. Defaults to the first sheet.
+        cell_range (str, optional): Excel cell range such as 'B2:F1000'.
+        filters (list of dict, optional): Load filters, see
+            data_loader.read_data_file.
+
+    Returns:
+        dict: Export statistics, see export_chunks.
+    """
+    from modules.data_loader import iter_data_chunks
+
+    chunks = pipeline.iter_apply(iter_data_chunks(
+        source_path, chunk_size, usecols=usecols, sheet_name=sheet_name,
+        cell_range=cell_range, filters=filters))
+    return export_chunks(chunks, file_path, fmt=fmt, compression=compression,
+                         progress_callback=progress_callback)
+
+
+def format_export_stats(stats):
+    """
+    Formats export statistics for display.
+
+    Args:
+        stats (dict): Statistics returned by export_chunks.
+
+    Returns:
+        str: A one-line summary.
+    """
+    return (f"{stats['rows']} rows in {stats['seconds']:.2f}s "
+            f"({stats['rows_per_sec']:,.0f} rows/s, {stats['mb_per_sec']:.1f} MB/s)")
@@ -1,6 +1,476 @@
+import csv
+import importlib.util
+import math
+import os
+import time
+
+import numpy as np
 import pandas as pd
 from tkinter import filedialog, messagebox
 
+from modules.data_cleaner import filter_data
+from modules.dataset_loader import iter_dataset_chunks, read_dataset
+from modules.excel_loader import STREAMABLE_EXTENSIONS, iter_excel_chunks, read_excel_fast
+
+NPY_EXTENSIONS = ('.npy',)
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+PARQUET_EXTENSIONS = ('.parquet',)
+
+SNIFF_SAMPLE_BYTES = 64 * 1024
+SNIFF_DELIMITERS = ',;\t|'
+# Tried in order; latin-1 decodes anything, so it is the last resort. The two
+# Windows code pages decode almost any byte, so when both succeed the one whose
+# letters are more frequent wins (see _code_page).
+CANDIDATE_ENCODINGS = ('utf-8-sig', 'cp1252', 'cp1250', 'latin-1')
+# Rough frequencies (% of letters, in the languages written with each code page)
+# of the lowercase letters on which cp1252 and cp1250 differ; other characters,
+# e.g. the symbols one code page has where the other has a letter, count as rare.
+CODE_PAGE_LETTERS = {
+    'cp1252': {'à': 0.5, 'ã': 0.7, 'å': 1.0, 'æ': 0.8, 'è': 0.3, 'ê': 0.2, 'ì': 0.05,
+               'ï': 0.05, 'ð': 0.1, 'ñ': 0.3, 'ò': 0.1, 'õ': 0.05, 'ø': 0.8, 'ù': 0.05,
+               'û': 0.05, 'þ': 0.1, 'ÿ': 0.01, 'œ': 0.05, 'ƒ': 0.01},
+    'cp1250': {'ą': 1.0, 'ă': 0.5, 'ć': 0.4, 'č': 0.5, 'ď': 0.05, 'đ': 0.1, 'ę': 1.0,
+               'ě': 1.2, 'ĺ': 0.01, 'ľ': 0.1, 'ł': 1.8, 'ń': 0.2, 'ň': 0.05, 'ő': 0.8,
+               'ŕ': 0.01, 'ř': 0.4, 'ś': 0.7, 'ş': 0.4, 'ţ': 0.4, 'ť': 0.05, 'ů': 0.2,
+               'ű': 0.1, 'ź': 0.1, 'ż': 0.8},
+}
+RARE_CHARACTER_FREQUENCY = 0.001
+
+
+def sniff_csv(file_path, sample_bytes=SNIFF_SAMPLE_BYTES):
+    """Detects the encoding, delimiter, quote character and header of a CSV file.
+
+    Only the first sample_bytes of the file are read.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        sample_bytes (int, optional): Size of the sample. Defaults to 64 KiB.
+
+    Returns:
+        dict: With the keys 'encoding', 'delimiter', 'quotechar' and 'has_header'.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read(sample_bytes)
+    if len(raw) == sample_bytes and b'\n' in raw:
+        # Drop the last, probably incomplete line (and any split multi-byte char)
+        raw = raw[:raw.rfind(b'\n') + 1]
+
+    encoding, text = 'utf-8', ''
+    for candidate in CANDIDATE_ENCODINGS:
+        try:
+            text = raw.decode(candidate)
+            encoding = candidate
+            break
+        except UnicodeDecodeError:
+            continue
+    if encoding == 'cp1252':
+        try:
+            central = raw.decode('cp1250')
+        except UnicodeDecodeError:
+            pass
+        else:
+            if _code_page(raw) == 'cp1250':
+                encoding, text = 'cp1250', central
+
+    sniffer = csv.Sniffer()
+    try:
+        dialect = sniffer.sniff(text, delimiters=SNIFF_DELIMITERS)
+        delimiter, quotechar = dialect.delimiter, dialect.quotechar or '"'
+    except csv.Error:
+        delimiter, quotechar = ',', '"'
+    try:
+        has_header = sniffer.has_header(text)
+    except csv.Error:
+        has_header = True
+    if not has_header:
+        # The sniffer's heuristic is unreliable on short samples; only trust it
+        # when the first row itself looks like data
+        first_row = next(csv.reader(text.splitlines()[:1], delimiter=delimiter,
+                                    quotechar=quotechar), [])
+        has_header = not any(_is_number(value) for value in first_row)
+
+    return {'encoding': encoding, 'delimiter': delimiter, 'quotechar': quotechar,
+            'has_header': has_header}
+
+
+def _code_page(raw):
+    # Chooses between cp1252 and cp1250 for bytes both can decode: sums the log
+    # ratio of the frequencies of the letters each one decodes the bytes to
+    counts = np.bincount(np.frombuffer(raw, dtype=np.uint8), minlength=256)
+    score = 0.0
+    for byte in np.flatnonzero(counts[0x80:]) + 0x80:
+        western = bytes([byte]).decode('cp1252').lower()
+        central = bytes([byte]).decode('cp1250').lower()
+        if western != central:
+            score += counts[byte] * math.log(
+                CODE_PAGE_LETTERS['cp1250'].get(central, RARE_CHARACTER_FREQUENCY)
+                / CODE_PAGE_LETTERS['cp1252'].get(western, RARE_CHARACTER_FREQUENCY))
+    return 'cp1250' if score > 0 else 'cp1252'
+
+
+def _is_number(value):
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def select_csv_engine():
+    """Returns the fastest available pandas CSV engine.
+
+    Returns:
+        str: 'pyarrow' (multithreaded) when pyarrow is installed, otherwise 'c'.
+    """
+    return 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+
+def _csv_options(file_path, sniff):
+    if not sniff:
+        return {}
+    dialect = sniff_csv(file_path)
+    return {'sep': dialect['delimiter'], 'quotechar': dialect['quotechar'],
+            'encoding': dialect['encoding'],
+            'header': 0 if dialect['has_header'] else None}
+
+
+def read_csv_fast(file_path, usecols=None, dtype=None, sniff=True, engine=None):
+    """Reads a CSV file with a sniffed dialect and the fastest available parser.
+
+    Parse statistics are stored in df.attrs['load_stats'] with the keys 'engine',
+    'seconds', 'bytes', 'mb_per_sec', 'rows_per_sec' and 'dialect'.
+
+    Args:
+        file_path (str): Path to the CSV file.
+        usecols (list of str, optional): Only parse these columns; the others are
+            skipped by the parser.
+        dtype (dict, optional): Column dtypes, e.g. {'id': 'int64', 'city': 'category'}.
+            Skips type inference for those columns.
+        sniff (bool, optional): Detect delimiter, encoding and header from a sample.
+            Defaults to True.
+        engine (str, optional): Force a pandas engine ('pyarrow', 'c' or 'python').
+            Defaults to select_csv_engine().
+
+    Returns:
+        pandas.DataFrame: The loaded DataFrame.
+    """
+    options = _csv_options(file_path, sniff)
+    engine = engine or select_csv_engine()
+    start = time.perf_counter()
+    try:
+        df = pd.read_csv(file_path, engine=engine, usecols=usecols, dtype=dtype, **options)
+    except (ValueError, TypeError, ImportError):
+        if engine == 'c':
+            raise
+        # pyarrow rejects some dialects/options; the C parser handles them
+        engine = 'c'
+        df = pd.read_csv(file_path, engine=engine, usecols=usecols, dtype=dtype, **options)
+    if engine == 'pyarrow':
+        if usecols is not None and options.get('header', 0) is None:
+            # pyarrow labels the selected columns of a headerless file 0, 1, ... in
+            # the order of usecols; use their positions in the file, as the C parser
+            df.columns = list(usecols)
+            df = df[sorted(usecols)]
+        df = _dates_to_datetime64(df)
+    seconds = max(time.perf_counter() - start, 1e-9)
+
+    size = os.path.getsize(file_path)
+    df.attrs['load_stats'] = {
+        'engine': engine,
+        'seconds': seconds,
+        'bytes': size,
+        'mb_per_sec': size / seconds / 1e6,
+        'rows_per_sec': len(df) / seconds,
+        'dialect': options,
+    }
+    return df
+
+
+def _dates_to_datetime64(df):
+    # The pyarrow engine returns date columns (Arrow date32) as objects holding
+    # datetime.date; convert them to datetime64, like its timestamp columns
+    for col in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == 'date':
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+
+def format_load_stats(stats):
+    """Formats the load statistics stored by read_csv_fast for display.
+
+    Args:
+        stats (dict): The df.attrs['load_stats'] dictionary.
+
+    Returns:
+        str: A one-line summary.
+    """
+    return (f"{stats['engine']} engine, {stats['seconds']:.2f}s, "
+            f"{stats['mb_per_sec']:.1f} MB/s, {stats['rows_per_sec']:,.0f} rows/s")
+
+
+def load_npy(file_path, columns=None):
+    """Memory-maps a NumPy .npy file as a DataFrame without copying it.
+
+    The file is opened with mmap_mode='r', so opening is near-instant regardless of
+    size and the operating system pages data in as it is accessed. The columns are
+    read-only views over the mapped file.
+
+    Args:
+        file_path (str): Path to the .npy file. Supported layouts are 1-D and 2-D
+            arrays of a single dtype and 1-D structured (record) arrays.
+        columns (list of str, optional): Column names for plain 2-D arrays.
+            Defaults to col_0, col_1, ...
+
+    Returns:
+        pandas.DataFrame: DataFrame backed by the memory-mapped file.
+
+    Raises:
+        ValueError: If the array has more than two dimensions.
+    """
+    array = np.load(file_path, mmap_mode='r')
+    if array.dtype.names:
+        # Each field is a strided view into the mapped records
+        return pd.DataFrame({name: array[name] for name in array.dtype.names}, copy=False)
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    if array.ndim != 2:
+        raise ValueError(f"Cannot load a {array.ndim}-dimensional array as a table.")
+    if columns is None:
+        columns = [f"col_{i}" for i in range(array.shape[1])]
+    # A C-ordered 2-D array becomes a single block that is a transposed view
+    return pd.DataFrame(array, columns=columns, copy=False)
+
+
+def load_arrow_ipc(file_path, arrow_dtypes=True):
+    """Memory-maps an Arrow IPC (Feather v2) file as a DataFrame.
+
+    With arrow_dtypes the columns use pandas' ArrowDtype and point directly at the
+    mapped Arrow buffers, so nothing is copied or decompressed up front. Files must
+    be uncompressed for this to be zero-copy (the default of data_exporter).
+
+    Args:
+        file_path (str): Path to the .arrow/.feather/.ipc file (file or stream format).
+        arrow_dtypes (bool, optional): Keep Arrow-backed columns (zero-copy). If False,
+            columns are converted to NumPy dtypes, which copies most of them.
+            Defaults to True.
+
+    Returns:
+        pandas.DataFrame: The loaded DataFrame.
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(file_path, 'r')
+    try:
+        table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        source.seek(0)
+        table = pa.ipc.open_stream(source).read_all()
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas(split_blocks=True)
+
+
+def _read_legacy_excel(file_path, sheet_name, cell_range, **kwargs):
+    if cell_range:
+        raise ValueError("Cell ranges are only supported for .xlsx/.xlsm files.")
+    return pd.read_excel(file_path, sheet_name=sheet_name or 0, **kwargs)
+
+
+def _is_dataset(file_path):
+    return os.path.isdir(file_path) or file_path.lower().endswith(PARQUET_EXTENSIONS)
+
+
+def _filter_columns(usecols, filters):
+    # Columns to read so that the filters can be evaluated
+    if usecols is None:
+        return None
+    return list(dict.fromkeys(list(usecols) + [f['column'] for f in filters]))
+
+
+def read_data_file(file_path, usecols=None, dtype=None, sheet_name=None, cell_range=None,
+                   filters=None):
+    """Reads a data file without any user interaction.
+
+    .xlsx/.xlsm workbooks are streamed in read-only mode and cached in a binary
+    format (see excel_loader.read_excel_fast). Directories and Parquet files are
+    read as partitioned datasets, skipping partitions and row groups that cannot
+    match the filters (see dataset_loader.read_dataset).
+
+    Args:
+        file_path (str): Path to a CSV, Excel, Parquet, NumPy .npy or Arrow
+            IPC/Feather file, or to a directory of Parquet/CSV files.
+        usecols (list of str, optional): Only load these columns.
+        dtype (dict, optional): Column dtype hints (CSV and Excel only).
+        sheet_name (str, optional): Excel worksheet. Defaults to the first sheet.
+        cell_range (str, optional): Excel cell range such as 'B2:F1000'.
+        filters (list of dict, optional): filter_data arguments ('column',
+            'condition', 'value') that every loaded row must satisfy.
+
+    Returns:
+        pandas.DataFrame: The loaded DataFrame.
+    """
+    if _is_dataset(file_path):
+        df = read_dataset(file_path, filters=filters, usecols=usecols)
+        return df.astype(dtype) if dtype else df
+    if not filters:
+        return _read_file(file_path, usecols, dtype, sheet_name, cell_range)
+
+    df = _read_file(file_path, _filter_columns(usecols, filters), dtype, sheet_name, cell_range)
+    for f in filters:
+        df = filter_data(df, f['column'], f['condition'], f['value'])
+    return df[list(usecols)] if usecols is not None else df
+
+
+def _read_file(file_path, usecols, dtype, sheet_name, cell_range):
+    lower = file_path.lower()
+    if lower.endswith(NPY_EXTENSIONS):
+        df = load_npy(file_path)
+        return df[usecols] if usecols is not None else df
+    if lower.endswith(ARROW_EXTENSIONS):
+        df = load_arrow_ipc(file_path)
+        return df[usecols] if usecols is not None else df
+    if file_path.endswith(('.csv')):
+        return read_csv_fast(file_path, usecols=usecols, dtype=dtype)
+    if lower.endswith(STREAMABLE_EXTENSIONS):
+        df = read_excel_fast(file_path, sheet_name=sheet_name, cell_range=cell_range,
+                             usecols=usecols)
+        return df.astype(dtype) if dtype else df
+    return _read_legacy_excel(file_path, sheet_name, cell_range, usecols=usecols, dtype=dtype)
+
+
+def preview_schema(file_path, sample_rows=100, sheet_name=None, cell_range=None, filters=None):
+    """Reads only the header and the first rows of a data file.
+
+    Used to let the user pick columns before the full file is parsed.
+
+    Args:
+        file_path (str): Path to a CSV, Excel, NumPy .npy or Arrow IPC/Feather file.
+        sample_rows (int, optional): Number of rows to read. Defaults to 100.
+        sheet_name (str, optional): Excel worksheet. Defaults to the first sheet.
+        cell_range (str, optional): Excel cell range such as 'B2:F1000'.
+        filters (list of dict, optional): Ignored; accepted so that the same options
+            can be passed as to read_data_file.
+
+    Returns:
+        pandas.DataFrame: A sample with all columns of the file.
+    """
+    if _is_dataset(file_path):
+        # Only the first CSV file or Parquet row group is read
+        chunks = iter_dataset_chunks(file_path)
+        try:
+            return next(chunks).head(sample_rows)
+        finally:
+            chunks.close()
+    lower = file_path.lower()
+    if lower.endswith(NPY_EXTENSIONS + ARROW_EXTENSIONS):
+        # Memory-mapped, so taking the head does not read the rest of the file
+        return read_data_file(file_path).head(sample_rows)
+    if file_path.endswith(('.csv')):
+        return pd.read_csv(file_path, nrows=sample_rows, **_csv_options(file_path, sniff=True))
+    if lower.endswith(STREAMABLE_EXTENSIONS):
+        # Stops parsing the sheet after the first chunk
+        chunks = iter_excel_chunks(file_path, sheet_name=sheet_name, cell_range=cell_range,
+                                   chunk_size=sample_rows)
+        try:
+            return next(chunks)
+        finally:
+            chunks.close()
+    return _read_legacy_excel(file_path, sheet_name, cell_range, nrows=sample_rows)
+
+
+def load_columns(file_path, columns, index=None, sheet_name=None, cell_range=None,
+                 filters=None):
+    """Loads additional columns of a file, aligned to an already loaded frame.
+
+    Args:
+        file_path (str): Path of the file the frame was loaded from.
+        columns (list of str): Columns to load.
+        index (pandas.Index, optional): Row labels of the loaded frame; the new
+            columns are reindexed to it. Defaults to all rows.
+        sheet_name (str, optional): Excel worksheet the frame was loaded from.
+        cell_range (str, optional): Excel cell range the frame was loaded from.
+        filters (list of dict, optional): Filters the frame was loaded with.
+
+    Returns:
+        pandas.DataFrame: The requested columns.
+    """
+    extra = read_data_file(file_path, usecols=list(columns), sheet_name=sheet_name,
+                           cell_range=cell_range, filters=filters)[list(columns)]
+    extra.attrs = {}
+    if index is not None:
+        extra = extra.reindex(index)
+    return extra
+
+
+def iter_data_chunks(file_path, chunk_size=100_000, usecols=None, sheet_name=None,
+                     cell_range=None, filters=None):
+    """Reads a CSV or Excel file as a sequence of DataFrame chunks.
+
+    CSV and .xlsx/.xlsm files and datasets are streamed from disk, so only one
+    chunk is in memory at a time. Other formats are read whole (memory-mapped for
+    .npy/Arrow) and then split. Dataset chunks are one per CSV file or Parquet
+    row group rather than chunk_size rows.
+
+    Args:
+        file_path (str): Path to the file to read.
+        chunk_size (int, optional): Number of rows per chunk. Defaults to 100000.
+        usecols (list of str, optional): Only read these columns.
+        sheet_name (str, optional): Excel worksheet. Defaults to the first sheet.
+        cell_range (str, optional): Excel cell range such as 'B2:F1000'.
+        filters (list of dict, optional): See read_data_file.
+
+    Yields:
+        pandas.DataFrame: Consecutive chunks with a continuous RangeIndex.
+    """
+    if _is_dataset(file_path):
+        yield from iter_dataset_chunks(file_path, filters=filters, usecols=usecols)
+        return
+    if filters:
+        for chunk in iter_data_chunks(file_path, chunk_size, _filter_columns(usecols, filters),
+                                      sheet_name, cell_range):
+            for f in filters:
+                chunk = filter_data(chunk, f['column'], f['condition'], f['value'])
+            yield chunk[list(usecols)] if usecols is not None else chunk
+        return
+    if file_path.endswith(('.csv')):
+        # Chunked reading needs the C engine; the dialect is still sniffed
+        options = _csv_options(file_path, sniff=True)
+        with pd.read_csv(file_path, chunksize=chunk_size, usecols=usecols,
+                         **options) as reader:
+            yield from reader
+        return
+    if file_path.lower().endswith(STREAMABLE_EXTENSIONS):
+        yield from iter_excel_chunks(file_path, sheet_name=sheet_name, cell_range=cell_range,
+                                     usecols=usecols, chunk_size=chunk_size)
+        return
+    df = read_data_file(file_path, usecols=usecols, sheet_name=sheet_name,
+                        cell_range=cell_range)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size]
+
+
+def ask_data_file_path():
+    """Opens a file dialog for the user to select a data file.
+
+    Returns:
+        str: The selected path, or an empty string if the dialog was canceled.
+    """
+    return filedialog.askopenfilename(
+        title="Select Data File",
+        filetypes=(("CSV files", "*.csv"), ("Excel files", "*.xlsx *.xls"),
+                   ("Parquet files", "*.parquet"), ("NumPy arrays", "*.npy"),
+                   ("Arrow IPC / Feather files", "*.arrow *.feather *.ipc"))
+    )
+
+
+def ask_dataset_directory():
+    """Opens a dialog for the user to select a partitioned dataset directory.
+
+    Returns:
+        str: The selected directory, or an empty string if the dialog was canceled.
+    """
+    return filedialog.askdirectory(title="Select Dataset Directory")
+
 
 def load_data_from_file():
     """Opens a file dialog for the user to select a CSV or Excel file.
@@ -8,17 +478,10 @@ def load_data_from_file():
     Returns:
         pandas.DataFrame or None: The loaded DataFrame if successful, None otherwise.
     """
-    file_path = filedialog.askopenfilename(
-        title="Select Data File",
-        filetypes=(("CSV files", "*.csv"), ("Excel files", "*.xlsx *.xls"))
-    )
+    file_path = ask_data_file_path()
     if file_path:
         try:
-            if file_path.endswith(('.csv')):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-            return df
+            return read_data_file(file_path)
         except FileNotFoundError:
             messagebox.showerror("Error", "File not found.")
             return None
@@ -0,0 +1,228 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+# Columns with at most this many non-null values get an exact distinct count;
+# longer ones use a K-Minimum-Values sketch over 64-bit hashes.
+EXACT_DISTINCT_LIMIT = 200_000
+KMV_SIZE = 2048
+
+SEMANTIC_SAMPLE_SIZE = 1000
+SEMANTIC_MATCH_RATIO = 0.9
+SEMANTIC_PATTERNS = {
+    'email': r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+    'url': r'^(https?|ftp)://\S+$',
+    # At least 7 digits, with a leading '+' or separators between digit groups;
+    # plain numbers, decimals and ISO dates do not match
+    'phone': (r'^(?=(?:\D*\d){7})(?!\d+\.\d+$)(?!\d{4}-\d{2}-\d{2})'
+              r'(?:\+\d[\d\s().-]*|\(?\d+\)?(?:[\s.-]+\(?\d+\)?)+)$'),
+}
+BOOLEAN_STRINGS = {'true', 'false', 'yes', 'no', 't', 'f', 'y', 'n', '0', '1'}
+
+
+def estimate_distinct(series):
+    """
+    Estimates the number of distinct non-null values in a Series.
+
+    Args:
+        series (pd.Series): The Series to analyze.
+
+    Returns:
+        int: Exact distinct count for short Series, otherwise a K-Minimum-Values
+        estimate (typically within a few percent).
+    """
+    values = series.dropna()
+    n = len(values)
+    if n <= EXACT_DISTINCT_LIMIT:
+        return int(values.nunique())
+
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    # Only hashes below a cutoff can be among the k smallest distinct values, so
+    # the unique() runs on a small fraction of the column.
+    fraction = min(1.0, 4.0 * KMV_SIZE / n)
+    cutoff = np.uint64(np.iinfo(np.uint64).max * fraction)
+    smallest = np.unique(hashes[hashes <= cutoff])
+    if len(smallest) < KMV_SIZE:
+        return int(len(np.unique(hashes)))
+    kth = float(smallest[KMV_SIZE - 1]) / float(np.iinfo(np.uint64).max)
+    return int(round((KMV_SIZE - 1) / kth))
+
+
+def _looks_unique(values, distinct):
+    # The distinct estimate only pre-selects candidates; uniqueness is then exact.
+    return len(values) > 1 and distinct >= 0.95 * len(values) and values.is_unique
+
+
+def infer_semantic_type(series, distinct=None):
+    """
+    Infers what a column represents beyond its storage dtype.
+
+    Args:
+        series (pd.Series): The Series to analyze.
+        distinct (int, optional): Distinct count if already known.
+
+    Returns:
+        str: One of 'empty', 'boolean', 'integer', 'float', 'datetime', 'identifier',
+        'categorical', 'email', 'url', 'phone', 'numeric text', 'datetime text',
+        'boolean text' or 'text'.
+    """
+    values = series.dropna()
+    if values.empty:
+        return 'empty'
+    if distinct is None:
+        distinct = estimate_distinct(values)
+
+    if pd.api.types.is_bool_dtype(series):
+        return 'boolean'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime'
+    if pd.api.types.is_numeric_dtype(series):
+        if pd.api.types.is_integer_dtype(series):
+            if _looks_unique(values, distinct):
+                return 'identifier'
+            return 'integer'
+        return 'float'
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return 'categorical'
+
+    sample = values.sample(min(len(values), SEMANTIC_SAMPLE_SIZE), random_state=0)
+    sample = sample.astype(str).str.strip()
+    if sample.str.lower().isin(BOOLEAN_STRINGS).mean() >= SEMANTIC_MATCH_RATIO \
+            and distinct <= 2:
+        return 'boolean text'
+    # '+' and 7 or more digits is an international phone number, not a number
+    numbers = sample.mask(sample.str.match(r'^\+\d{7,}$'))
+    if pd.to_numeric(numbers, errors='coerce').notna().mean() >= SEMANTIC_MATCH_RATIO:
+        return 'numeric text'
+    if pd.to_datetime(sample, errors='coerce', format='mixed').notna().mean() \
+            >= SEMANTIC_MATCH_RATIO:
+        return 'datetime text'
+    for semantic_type, pattern in SEMANTIC_PATTERNS.items():
+        if sample.str.match(pattern).mean() >= SEMANTIC_MATCH_RATIO:
+            return semantic_type
+    if _looks_unique(values, distinct):
+        return 'identifier'
+    if distinct <= max(20, len(values) * 0.05):
+        return 'categorical'
+    return 'text'
+
+
+def profile_column(series, top_k=5):
+    """
+    Builds the profile of a single column.
+
+    Args:
+        series (pd.Series): The column to profile.
+        top_k (int, optional): Number of most frequent values to report. Defaults to 5.
+
+    Returns:
+        dict: Profile with the keys 'name', 'dtype', 'count', 'null_count', 'null_pct',
+        'distinct', 'top_values' (list of (value, count) tuples), 'min', 'max',
+        'semantic_type' and 'memory_bytes'.
+    """
+    count = len(series)
+    null_count = int(series.isna().sum())
+    distinct = estimate_distinct(series)
+    top_values = list(series.value_counts(dropna=True).head(top_k).items())
+
+    col_min = col_max = None
+    if (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)) \
+            and not pd.api.types.is_bool_dtype(series) and null_count < count:
+        col_min, col_max = series.min(), series.max()
+
+    return {
+        'name': series.name,
+        'dtype': str(series.dtype),
+        'count': count,
+        'null_count': null_count,
+        'null_pct': (null_count / count) * 100 if count else 0.0,
+        'distinct': distinct,
+        'top_values': top_values,
+        'min': col_min,
+        'max': col_max,
+        'semantic_type': infer_semantic_type(series, distinct=distinct),
+        'memory_bytes': int(series.memory_usage(index=False, deep=True)),
+    }
+
+
+def profile_dataframe(df, top_k=5, max_workers=None, callback=None):
+    """
+    Profiles every column of a DataFrame in parallel.
+
+    Columns are processed in a thread pool: the heavy parts (hashing, value counts,
+    min/max) run in pandas/NumPy code that releases the GIL, and threads share the
+    frame without copying it into worker processes.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to profile.
+        top_k (int, optional): Number of most frequent values per column. Defaults to 5.
+        max_workers (int, optional): Number of threads. Defaults to the CPU count.
+        callback (callable, optional): Called with each column profile as soon as it
+            is finished. It runs in a worker thread, so GUI code must hand the
+            result over to the main thread itself.
+
+    Returns:
+        OrderedDict: Column profiles keyed by column name, in column order.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    profiles = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(profile_column, df.iloc[:, i], top_k): col
+                   for i, col in enumerate(df.columns)}
+        for future in as_completed(futures):
+            profile = future.result()
+            profiles[futures[future]] = profile
+            if callback is not None:
+                callback(profile)
+    return OrderedDict((col, profiles[col]) for col in df.columns)
+
+
+def format_profile(profile):
+    """
+    Formats a column profile as a single line of text.
+
+    Args:
+        profile (dict): A profile returned by profile_column.
+
+    Returns:
+        str: Human readable summary ending with a newline.
+    """
+    text = (f"- {profile['name']}: {profile['dtype']} ({profile['semantic_type']}), "
+            f"Missing: {profile['null_count']} ({profile['null_pct']:.2f}%), "
+            f"Distinct: ~{profile['distinct']}")
+    if profile['min'] is not None:
+        text += f", Min: {profile['min']}, Max: {profile['max']}"
+    if profile['top_values']:
+        top = ", ".join(f"{value} ({count})" for value, count in profile['top_values'])
+        text += f", Top: {top}"
+    text += f", Memory: {profile['memory_bytes'] / 1024:.1f} KB"
+    return text + "\n"
+
+
+class ProfileCache:
+    """Keeps the profiles of the most recently profiled data versions."""
+
+    def __init__(self, max_entries=4):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """Returns the cached profile for key, or None."""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, profiles):
+        """Stores profiles under key, evicting the least recently used entry."""
+        self._entries[key] = profiles
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached profiles."""
+        self._entries.clear()
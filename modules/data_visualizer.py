@@ -1,8 +1,18 @@
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import seaborn as sns
 
+from modules.data_analyzer import COMPACT_HEATMAP_COLUMNS, compact_correlation_matrix
+from modules.downsampler import downsample
 
-def create_histogram(df, column, title='Histogram', bins=10, color=None):
+# Above this many columns the coefficients no longer fit in the heatmap cells.
+HEATMAP_ANNOT_COLUMNS = 15
+
+
+def create_histogram(df, column, title='Histogram', bins=10, color=None,
+                     show=True):
     """
     Creates a histogram for a numerical column.
 
@@ -12,17 +22,23 @@ def create_histogram(df, column, title='Histogram', bins=10, color=None):
         title (str, optional): The plot title. Defaults to 'Histogram'.
         bins (int, optional): Number of histogram bins. Defaults to 10.
         color: Color of the bars.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
     """
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     sns.histplot(df[column], bins=bins, kde=True, color=color)
     plt.title(title)
     plt.xlabel(column)
     plt.ylabel('Frequency')
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 def create_scatter_plot(df, x_col, y_col, title='Scatter Plot', color=None,
-                        xlabel=None, ylabel=None):
+                        xlabel=None, ylabel=None, show=True):
     """
     Creates a scatter plot.
 
@@ -34,18 +50,24 @@ def create_scatter_plot(df, x_col, y_col, title='Scatter Plot', color=None,
         color: Color of the points.
         xlabel: Label for x-axis.
         ylabel: Label for y-axis.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
     """
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     sns.scatterplot(x=x_col, y=y_col, data=df, color=color)
     plt.title(title)
     plt.xlabel(xlabel or x_col)  # Use xlabel if provided, else use column name
     plt.ylabel(ylabel or y_col)  # Use ylabel if provided, else use column name
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 def create_bar_chart(df, x_col, y_col, title='Bar Chart', color=None,
-                     xlabel=None, ylabel=None):
+                     xlabel=None, ylabel=None, show=True):
     """
     Creates a bar chart.
 
@@ -57,17 +79,23 @@ def create_bar_chart(df, x_col, y_col, title='Bar Chart', color=None,
         color: Color of the bars.
         xlabel: Label for x-axis.
         ylabel: Label for y-axis.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
     """
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     sns.barplot(x=x_col, y=y_col, data=df, color=color)
     plt.title(title)
     plt.xlabel(xlabel or x_col)
     plt.ylabel(ylabel or y_col)
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 def create_box_plot(df, x_col, y_col, title='Box Plot', color=None,
-                    xlabel=None, ylabel=None):
+                    xlabel=None, ylabel=None, show=True):
     """
     Creates a box plot.
 
@@ -79,11 +107,134 @@ def create_box_plot(df, x_col, y_col, title='Box Plot', color=None,
         color: Color of the boxes.
         xlabel: Label for x-axis.
         ylabel: Label for y-axis.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
     """
 
-    plt.figure(figsize=(8, 6))
+    fig = plt.figure(figsize=(8, 6))
     sns.boxplot(x=x_col, y=y_col, data=df, color=color)
     plt.title(title)
     plt.xlabel(xlabel or x_col)
     plt.ylabel(ylabel or y_col)
-    plt.show()
+    if show:
+        plt.show()
+    return fig
+
+
+def create_correlation_heatmap(df, title='Correlation Heatmap', method='pearson',
+                               annot=True, cmap='coolwarm', max_columns=COMPACT_HEATMAP_COLUMNS,
+                               show=True):
+    """
+    Creates a heatmap of the correlation matrix of the numerical columns.
+
+    Wide data is drawn as a compact heatmap: the max_columns most strongly
+    correlated columns, clustered so that correlated groups form blocks (see
+    data_analyzer.compact_correlation_matrix).
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+        title (str, optional): The plot title. Defaults to 'Correlation Heatmap'.
+        method (str, optional): Correlation method ('pearson', 'kendall', 'spearman').
+            Defaults to 'pearson'; wide data needs 'pearson' or 'spearman'.
+        annot (bool, optional): Whether to write the coefficients in the cells.
+            Defaults to True; skipped above HEATMAP_ANNOT_COLUMNS columns.
+        cmap (str, optional): Colormap name. Defaults to 'coolwarm'.
+        max_columns (int, optional): Most columns to draw. Defaults to 40.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
+
+    Raises:
+        ValueError: If df has no numerical columns.
+    """
+    numeric = df.select_dtypes(include=['number'])
+    if numeric.columns.empty:
+        raise ValueError("No numerical columns to correlate")
+    if len(numeric.columns) > max_columns:
+        corr_matrix = compact_correlation_matrix(numeric, method=method, max_columns=max_columns)
+        title = f"{title} ({max_columns} of {len(numeric.columns)} columns, clustered)"
+    else:
+        corr_matrix = numeric.corr(method=method)
+    fig = plt.figure(figsize=(8, 6))
+    sns.heatmap(corr_matrix, annot=annot and len(corr_matrix) <= HEATMAP_ANNOT_COLUMNS,
+                cmap=cmap)
+    plt.title(title)
+    if show:
+        plt.show()
+    return fig
+
+
+def create_time_series_plot(df, x_col, y_col, title='Time Series', color=None,
+                            xlabel=None, ylabel=None, max_points=None,
+                            method='lttb', show=True):
+    """
+    Creates a line plot of a (possibly very long) time series.
+
+    Only about one point per horizontal pixel is drawn. The series is downsampled
+    with LTTB or min/max decimation, and re-decimated from the full data for the
+    visible range whenever the x-axis limits change (zoom, pan), so the plot stays
+    responsive on series with tens of millions of points.
+
+    Args:
+        df (pd.DataFrame): The DataFrame.
+        x_col (str): Time (or other ordered) column for the x-axis.
+        y_col (str): Column for the y-axis (numerical).
+        title (str, optional): The plot title. Defaults to 'Time Series'.
+        color: Color of the line.
+        xlabel: Label for x-axis.
+        ylabel: Label for y-axis.
+        max_points (int, optional): Number of points to draw. Defaults to the pixel
+            width of the axes.
+        method (str, optional): Downsampling method, 'lttb' or 'minmax'.
+            Defaults to 'lttb'.
+        show (bool, optional): Whether to call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The created figure.
+    """
+    data = df[[x_col, y_col]].dropna()
+    x = data[x_col]
+    if not pd.api.types.is_numeric_dtype(x) and not pd.api.types.is_datetime64_any_dtype(x):
+        x = pd.to_datetime(x)
+    is_datetime = pd.api.types.is_datetime64_any_dtype(x)
+    if is_datetime:
+        if x.dt.tz is not None:
+            x = x.dt.tz_localize(None)
+        x_values = mdates.date2num(x.to_numpy())
+    else:
+        x_values = x.to_numpy(dtype=float)
+    y_values = data[y_col].to_numpy(dtype=float)
+
+    if len(x_values) > 1 and (np.diff(x_values) < 0).any():
+        order = np.argsort(x_values, kind='stable')
+        x_values, y_values = x_values[order], y_values[order]
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+
+    def target_points():
+        return max_points or max(int(ax.bbox.width), 100)
+
+    line, = ax.plot(*downsample(x_values, y_values, target_points(), method),
+                    color=color)
+    if is_datetime:
+        ax.xaxis_date()
+        fig.autofmt_xdate()
+
+    def redecimate(axes):
+        lo, hi = axes.get_xlim()
+        start = max(np.searchsorted(x_values, lo) - 1, 0)
+        end = min(np.searchsorted(x_values, hi) + 1, len(x_values))
+        line.set_data(*downsample(x_values[start:end], y_values[start:end],
+                                  target_points(), method))
+
+    ax.callbacks.connect('xlim_changed', redecimate)
+
+    ax.set_title(title)
+    ax.set_xlabel(xlabel or x_col)
+    ax.set_ylabel(ylabel or y_col)
+    if show:
+        plt.show()
+    return fig
@@ -0,0 +1,307 @@
+import datetime
+import os
+import time
+from urllib.parse import unquote
+
+import pandas as pd
+
+from modules.data_cleaner import filter_data
+
+# Data file types of a dataset directory, by extension.
+DATASET_FORMATS = {'.parquet': 'parquet', '.csv': 'csv'}
+# Directory value Hive/Spark use for missing partition values.
+HIVE_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _typed_values(values):
+    # Partition values are strings in the path; use numbers when all of them are
+    present = [value for value in values if value is not None]
+    for cast in (int, float):
+        try:
+            typed = {value: cast(value) for value in present}
+        except ValueError:
+            continue
+        return [typed.get(value) for value in values]
+    return values
+
+
+def discover_dataset(path):
+    """
+    Finds the data files of a partitioned dataset.
+
+    Partition values are read from hive-style directory names such as
+    'date=2024-01-01/region=EU'. A partition column gets numeric values when all of
+    its values are numbers. Files and directories starting with '.' or '_'
+    (_SUCCESS, .crc, ...) are ignored.
+
+    Args:
+        path (str): The dataset's root directory, or a single Parquet/CSV file.
+
+    Returns:
+        dict: With the keys 'root', 'partition_columns' and 'files', a list of dicts
+        with the keys 'path', 'format' and 'partitions' (column -> value).
+
+    Raises:
+        ValueError: If there are no Parquet or CSV files.
+    """
+    files = []
+    if os.path.isfile(path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext in DATASET_FORMATS:
+            files.append({'path': path, 'format': DATASET_FORMATS[ext], 'partitions': {}})
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith(('.', '_')))
+        relative = os.path.relpath(dirpath, path)
+        partitions = {}
+        for part in relative.split(os.sep):
+            if '=' in part:
+                key, value = part.split('=', 1)
+                partitions[unquote(key)] = None if value == HIVE_NULL_PARTITION else unquote(value)
+        for name in sorted(filenames):
+            ext = os.path.splitext(name)[1].lower()
+            if name.startswith(('.', '_')) or ext not in DATASET_FORMATS:
+                continue
+            files.append({'path': os.path.join(dirpath, name), 'format': DATASET_FORMATS[ext],
+                          'partitions': dict(partitions)})
+    if not files:
+        raise ValueError(f"No Parquet or CSV files found in {path}")
+
+    partition_columns = list(dict.fromkeys(key for info in files for key in info['partitions']))
+    for key in partition_columns:
+        values = _typed_values([info['partitions'].get(key) for info in files])
+        for info, value in zip(files, values):
+            info['partitions'][key] = value
+    return {'root': path, 'partition_columns': partition_columns, 'files': files}
+
+
+def _coerce_value(value, like):
+    # Converts a filter value to the type of a partition value or statistic
+    if isinstance(value, (list, tuple)):
+        return [_coerce_value(item, like) for item in value]
+    try:
+        if isinstance(like, str):
+            return str(value)
+        if isinstance(like, datetime.datetime):
+            return pd.Timestamp(value)
+        if isinstance(like, datetime.date):
+            return pd.Timestamp(value).date()
+        if isinstance(like, (int, float)) and isinstance(value, str):
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+def may_match(low, high, condition, value, null_count=0):
+    """
+    Tells whether values in [low, high] can satisfy a filter_data condition.
+
+    Used to skip partitions, files and row groups from their statistics; when the
+    bounds cannot be compared with the value, the data is kept. Missing values
+    satisfy '!=' and 'not in' in filter_data, so data with nulls is always kept
+    for these conditions.
+
+    Args:
+        low: Smallest value of the column in the partition/file/row group.
+        high: Largest value.
+        condition (str): A filter_data condition ('==', '!=', '>', '<', '>=', '<=',
+            'in', 'not in').
+        value: The value to filter by; a list for 'in'/'not in'.
+        null_count (int, optional): Number of missing values in the data.
+            Defaults to 0.
+
+    Returns:
+        bool: False only if no row can match.
+
+    Raises:
+        ValueError: If an invalid condition is provided.
+    """
+    value = _coerce_value(value, low)
+    try:
+        if condition == '==':
+            return low <= value <= high
+        if condition == '!=':
+            return null_count > 0 or not (low == high == value)
+        if condition == '>':
+            return high > value
+        if condition == '<':
+            return low < value
+        if condition == '>=':
+            return high >= value
+        if condition == '<=':
+            return low <= value
+        if condition == 'in':
+            return any(low <= item <= high for item in value)
+        if condition == 'not in':
+            return null_count > 0 or not (low == high and low in value)
+    except TypeError:
+        return True
+    raise ValueError(f"Invalid condition: {condition}")
+
+
+def _column_statistics(metadata, row_group):
+    # Maps column names to (min, max, null count) of one Parquet row group, when
+    # recorded; an unknown null count is taken as nulls being present
+    bounds = {}
+    group = metadata.row_group(row_group)
+    for j in range(group.num_columns):
+        column = group.column(j)
+        stats = column.statistics
+        if stats is not None and stats.has_min_max:
+            null_count = stats.null_count if stats.has_null_count else 1
+            bounds[column.path_in_schema] = (stats.min, stats.max, null_count)
+    return bounds
+
+
+def _parquet_row_groups(parquet_file, filters):
+    metadata = parquet_file.metadata
+    selected = []
+    for i in range(metadata.num_row_groups):
+        bounds = _column_statistics(metadata, i)
+        if all(may_match(*bounds[f['column']][:2], f['condition'], f['value'],
+                         null_count=bounds[f['column']][2])
+               for f in filters if f['column'] in bounds):
+            selected.append(i)
+    return selected
+
+
+def iter_dataset_chunks(path, filters=None, usecols=None, stats=None):
+    """
+    Reads a partitioned dataset chunk by chunk, skipping data that cannot match.
+
+    Files whose partition values fail a filter are never opened, and Parquet row
+    groups whose min/max statistics exclude every match are never read. The
+    remaining rows are filtered exactly with data_cleaner.filter_data.
+
+    Args:
+        path (str): The dataset's root directory, or a single Parquet/CSV file.
+        filters (list of dict, optional): filter_data arguments, e.g.
+            [{'column': 'date', 'condition': '>=', 'value': '2024-01-01'}]; all
+            must hold.
+        usecols (list of str, optional): Only return these columns (data or
+            partition columns).
+        stats (dict, optional): Filled with 'files_total', 'files_read',
+            'row_groups_total', 'row_groups_read' and 'rows'.
+
+    Yields:
+        pd.DataFrame: One chunk per CSV file or Parquet row group, with a continuous
+        RangeIndex; partition columns are appended as regular columns.
+    """
+    dataset = discover_dataset(path)
+    partition_columns = dataset['partition_columns']
+    filters = [dict(f) for f in (filters or [])]
+    stats = stats if stats is not None else {}
+    stats.update(files_total=len(dataset['files']), files_read=0,
+                 row_groups_total=0, row_groups_read=0, rows=0)
+
+    # Compare partition columns with values of their own type
+    for f in filters:
+        if f['column'] in partition_columns:
+            sample = next((info['partitions'][f['column']] for info in dataset['files']
+                           if info['partitions'].get(f['column']) is not None), None)
+            f['value'] = _coerce_value(f['value'], sample)
+
+    read_cols = None
+    if usecols is not None:
+        needed = list(usecols) + [f['column'] for f in filters]
+        read_cols = [col for col in dict.fromkeys(needed) if col not in partition_columns]
+
+    def finish(chunk, info):
+        for key in partition_columns:
+            if usecols is None or key in usecols or any(f['column'] == key for f in filters):
+                chunk[key] = info['partitions'].get(key)
+        for f in filters:
+            chunk = filter_data(chunk, f['column'], f['condition'], f['value'])
+        if usecols is not None:
+            chunk = chunk[list(usecols)]
+        chunk.index = pd.RangeIndex(stats['rows'], stats['rows'] + len(chunk))
+        stats['rows'] += len(chunk)
+        return chunk
+
+    def partition_matches(value, f):
+        # A missing partition value (__HIVE_DEFAULT_PARTITION__) makes every row null
+        return may_match(value, value, f['condition'], f['value'], null_count=int(value is None))
+
+    for info in dataset['files']:
+        if not all(partition_matches(info['partitions'][f['column']], f)
+                   for f in filters if f['column'] in partition_columns):
+            continue
+
+        if info['format'] == 'csv':
+            from modules.data_loader import read_csv_fast
+
+            stats['files_read'] += 1
+            yield finish(read_csv_fast(info['path'], usecols=read_cols), info)
+            continue
+
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(info['path'])
+        stats['row_groups_total'] += parquet_file.metadata.num_row_groups
+        row_groups = _parquet_row_groups(parquet_file, filters)
+        if row_groups:
+            stats['files_read'] += 1
+        for i in row_groups:
+            table = parquet_file.read_row_group(i, columns=read_cols)
+            stats['row_groups_read'] += 1
+            yield finish(table.to_pandas(), info)
+
+
+def _empty_frame(path, usecols):
+    # Columns of the dataset when no row matched the filters
+    dataset = discover_dataset(path)
+    info = dataset['files'][0]
+    if info['format'] == 'csv':
+        # Same dialect (delimiter, header) as read_csv_fast for the data
+        from modules.data_loader import _csv_options
+
+        df = pd.read_csv(info['path'], nrows=0, **_csv_options(info['path'], sniff=True))
+    else:
+        import pyarrow.parquet as pq
+        df = pq.ParquetFile(info['path']).schema_arrow.empty_table().to_pandas()
+    for key in dataset['partition_columns']:
+        df[key] = pd.Series(dtype=object)
+    return df[list(usecols)] if usecols is not None else df
+
+
+def read_dataset(path, filters=None, usecols=None):
+    """
+    Reads a partitioned dataset with partition and statistics pruning.
+
+    Statistics about the skipped data are stored in df.attrs['dataset_stats'], see
+    iter_dataset_chunks, together with the elapsed 'seconds'.
+
+    Args:
+        path (str): The dataset's root directory, or a single Parquet/CSV file.
+        filters (list of dict, optional): See iter_dataset_chunks.
+        usecols (list of str, optional): Only return these columns.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+    """
+    start = time.perf_counter()
+    stats = {}
+    chunks = list(iter_dataset_chunks(path, filters=filters, usecols=usecols, stats=stats))
+    if chunks:
+        df = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
+    else:
+        df = _empty_frame(path, usecols)
+    stats['seconds'] = time.perf_counter() - start
+    df.attrs['dataset_stats'] = stats
+    return df
+
+
+def format_dataset_stats(stats):
+    """
+    Formats the statistics stored by read_dataset for display.
+
+    Args:
+        stats (dict): The df.attrs['dataset_stats'] dictionary.
+
+    Returns:
+        str: A one-line summary.
+    """
+    text = f"read {stats['files_read']}/{stats['files_total']} files"
+    if stats['row_groups_total']:
+        text += f", {stats['row_groups_read']}/{stats['row_groups_total']} row groups"
+    return text + f" in {stats['seconds']:.2f}s"
@@ -0,0 +1,105 @@
+import numpy as np
+
+
+def lttb_downsample(x, y, n_out):
+    """
+    Downsamples a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The points in between are split into
+    n_out - 2 buckets and from each bucket the point forming the largest triangle
+    with the previously selected point and the average of the next bucket is kept,
+    which preserves the visual shape of the line.
+
+    Args:
+        x (np.ndarray): Sorted x values as floats.
+        y (np.ndarray): y values as floats without NaNs, same length as x.
+        n_out (int): Number of points to return.
+
+    Returns:
+        np.ndarray: Indices of the selected points, in ascending order.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket edges for the n - 2 interior points.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        area = np.abs((x[prev] - avg_x) * (bucket_y - y[prev])
+                      - (x[prev] - bucket_x) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+    return selected
+
+
+def minmax_downsample(x, y, n_out):
+    """
+    Downsamples a series by keeping the minimum and maximum of each bucket.
+
+    Cheaper than LTTB and guarantees that every spike stays visible. The work is a
+    single vectorized pass over the data.
+
+    Args:
+        x (np.ndarray): Sorted x values as floats.
+        y (np.ndarray): y values as floats without NaNs, same length as x.
+        n_out (int): Approximate number of points to return (two per bucket).
+
+    Returns:
+        np.ndarray: Indices of the selected points, in ascending order.
+    """
+    n = len(x)
+    n_buckets = n_out // 2
+    if n_buckets < 1 or n <= n_out:
+        return np.arange(n)
+
+    bucket_size = n // n_buckets
+    usable = bucket_size * n_buckets
+    buckets = y[:usable].reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    mins = offsets + buckets.argmin(axis=1)
+    maxs = offsets + buckets.argmax(axis=1)
+    indices = np.concatenate([mins, maxs, np.arange(usable, n)])
+    return np.unique(np.concatenate([[0, n - 1], indices]))
+
+
+DOWNSAMPLERS = {
+    'lttb': lttb_downsample,
+    'minmax': minmax_downsample,
+}
+
+
+def downsample(x, y, n_out, method='lttb'):
+    """
+    Downsamples a series with the given method.
+
+    Args:
+        x (np.ndarray): Sorted x values as floats.
+        y (np.ndarray): y values as floats, same length as x.
+        n_out (int): Number of points to return.
+        method (str, optional): 'lttb' or 'minmax'. Defaults to 'lttb'.
+
+    Returns:
+        tuple of np.ndarray: The downsampled x and y values.
+
+    Raises:
+        ValueError: If an invalid method is provided.
+    """
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Invalid downsampling method: {method}")
+    indices = DOWNSAMPLERS[method](x, y, n_out)
+    return x[indices], y[indices]
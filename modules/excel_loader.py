@@ -0,0 +1,353 @@
+import hashlib
+import itertools
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Formats openpyxl can stream; legacy .xls files go through pd.read_excel.
+STREAMABLE_EXTENSIONS = ('.xlsx', '.xlsm')
+DEFAULT_CHUNK_SIZE = 100_000
+EXCEL_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'data_analysis_cache', 'excel')
+# Total size of the cache; the least recently used sheets beyond it are removed
+# whenever a sheet is added.
+EXCEL_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+
+def list_sheets(file_path):
+    """
+    Lists the worksheet names of a workbook without loading any cells.
+
+    Args:
+        file_path (str): Path to the .xlsx/.xlsm file.
+
+    Returns:
+        list of str: The sheet names in workbook order.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def parse_cell_range(cell_range):
+    """
+    Converts an Excel range such as 'B2:F1000' or 'B:F' to its boundaries.
+
+    Args:
+        cell_range (str): The range in A1 notation.
+
+    Returns:
+        tuple: (min_col, min_row, max_col, max_row), 1-based; open ends are None.
+
+    Raises:
+        ValueError: If the range is not valid A1 notation.
+    """
+    from openpyxl.utils import range_boundaries
+
+    try:
+        return range_boundaries(cell_range.strip().upper())
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid cell range: {cell_range}")
+
+
+def _header_names(row):
+    # Same naming as pandas for empty header cells
+    return [str(value) if value is not None else f"Unnamed: {i}"
+            for i, value in enumerate(row)]
+
+
+def iter_excel_chunks(file_path, sheet_name=None, cell_range=None, usecols=None,
+                      header=True, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Streams a worksheet as DataFrame chunks.
+
+    The workbook is opened in read-only mode, so rows are parsed from the sheet
+    XML as they are consumed and only one chunk is held in memory. Empty rows at
+    the end of the sheet are dropped, as pd.read_excel does.
+
+    Args:
+        file_path (str): Path to the .xlsx/.xlsm file.
+        sheet_name (str, optional): Worksheet to read. Defaults to the first sheet.
+        cell_range (str, optional): Only read this range, e.g. 'B2:F1000'. Its
+            first row is the header.
+        usecols (list of str, optional): Only keep these columns.
+        header (bool, optional): Whether the first row holds the column names.
+            Defaults to True.
+        chunk_size (int, optional): Rows per chunk. Defaults to 100000.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks with a continuous RangeIndex.
+
+    Raises:
+        ValueError: If the sheet does not exist or a column in usecols is missing.
+    """
+    from openpyxl import load_workbook
+
+    min_col = min_row = max_col = max_row = None
+    if cell_range:
+        min_col, min_row, max_col, max_row = parse_cell_range(cell_range)
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if sheet_name is None:
+            sheet = workbook.worksheets[0]
+        elif sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
+        else:
+            raise ValueError(f"Invalid sheet name: {sheet_name}")
+        if cell_range is None:
+            # The stored dimensions are often wrong in files written by other tools
+            sheet.reset_dimensions()
+
+        rows = sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col,
+                               max_col=max_col, values_only=True)
+        first = next(rows, None)
+        if first is None:
+            # Nothing to read: no rows, and only the requested columns
+            yield pd.DataFrame(columns=list(usecols) if usecols is not None else [])
+            return
+        if header:
+            columns = _header_names(first)
+            pending = []
+        else:
+            columns = list(range(len(first)))
+            pending = [first]
+        width = len(columns)
+
+        positions = list(range(width))
+        if usecols is not None:
+            missing = [col for col in usecols if col not in columns]
+            if missing:
+                raise ValueError(f"Columns not found in sheet: {missing}")
+            positions = [columns.index(col) for col in usecols]
+            columns = list(usecols)
+
+        def make_chunk(records, start):
+            chunk = pd.DataFrame.from_records(records, columns=columns)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            return chunk
+
+        buffer, empty_run, start = [], [], 0
+        for row in itertools.chain(pending, rows):
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            record = tuple(row[i] for i in positions)
+            if all(value is None for value in row[:width]):
+                # Held back until a non-empty row shows it is not trailing
+                empty_run.append(record)
+                continue
+            if empty_run:
+                buffer.extend(empty_run)
+                empty_run = []
+            buffer.append(record)
+            if len(buffer) >= chunk_size:
+                yield make_chunk(buffer, start)
+                start += len(buffer)
+                buffer = []
+        if buffer or start == 0:
+            yield make_chunk(buffer, start)
+    finally:
+        workbook.close()
+
+
+def excel_cache_path(file_path, sheet_name=None, cell_range=None, cache_dir=None):
+    """
+    Returns the cache file of a parsed sheet.
+
+    The key contains the file's path, size and modification time, so editing the
+    workbook invalidates its cache entries.
+
+    Args:
+        file_path (str): Path to the workbook.
+        sheet_name (str, optional): The parsed sheet.
+        cell_range (str, optional): The parsed range.
+        cache_dir (str, optional): Cache directory. Defaults to EXCEL_CACHE_DIR.
+
+    Returns:
+        str: Path of the Arrow IPC cache file (it may not exist yet).
+    """
+    stat = os.stat(file_path)
+    key = '|'.join(str(part) for part in (os.path.abspath(file_path), stat.st_size,
+                                          stat.st_mtime_ns, sheet_name, cell_range))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir or EXCEL_CACHE_DIR, f"{digest}.arrow")
+
+
+def read_excel_fast(file_path, sheet_name=None, cell_range=None, usecols=None,
+                    use_cache=True, cache_dir=None):
+    """
+    Reads a worksheet by streaming its rows, with a binary cache.
+
+    The streamed chunks are kept as Arrow tables, so memory peaks at about the
+    size of the sheet in Arrow plus one chunk. The parsed sheet (or range) is
+    stored as an uncompressed Arrow IPC file and returned memory-mapped with
+    Arrow-backed columns (see data_loader.load_arrow_ipc); opening the same
+    unchanged workbook again maps the file instead of parsing XML. usecols is
+    applied after the cache, so loading other columns later is also served from
+    it. The cache is limited to EXCEL_CACHE_MAX_BYTES.
+
+    Args:
+        file_path (str): Path to the .xlsx/.xlsm file.
+        sheet_name (str, optional): Worksheet to read. Defaults to the first sheet.
+        cell_range (str, optional): Only read this range, e.g. 'B2:F1000'.
+        usecols (list of str, optional): Only return these columns.
+        use_cache (bool, optional): Read from and write to the cache. Defaults to True.
+        cache_dir (str, optional): Cache directory. Defaults to EXCEL_CACHE_DIR.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame; without pyarrow, or when a column
+        mixes types Arrow cannot store, with NumPy dtypes and not cached.
+    """
+    from modules.data_loader import load_arrow_ipc
+
+    cache_path = None
+    if use_cache:
+        cache_path = excel_cache_path(file_path, sheet_name, cell_range, cache_dir)
+        if os.path.exists(cache_path):
+            # Mark the entry as recently used for the eviction
+            os.utime(cache_path)
+            df = load_arrow_ipc(cache_path)
+            return _select_columns(df, usecols)
+
+    sheet = _collect_chunks(iter_excel_chunks(file_path, sheet_name=sheet_name,
+                                              cell_range=cell_range))
+    if isinstance(sheet, pd.DataFrame):
+        df = sheet
+    elif cache_path is not None and _write_cache(sheet, cache_path):
+        df = load_arrow_ipc(cache_path)
+    else:
+        df = sheet.to_pandas(types_mapper=pd.ArrowDtype)
+    return _select_columns(df, usecols)
+
+
+def _select_columns(df, usecols):
+    # An empty sheet has no columns; it gives an empty frame with the requested ones
+    if usecols is None:
+        return df
+    if len(df.columns) == 0:
+        return pd.DataFrame(columns=list(usecols))
+    return df[list(usecols)]
+
+
+def _collect_chunks(chunks):
+    # One Arrow table of the streamed chunks, which is more compact than a list
+    # of DataFrames of Python objects; types that differ between chunks (an empty
+    # column, ints and floats) are promoted. A DataFrame when pyarrow is missing
+    # or a column mixes types Arrow cannot store.
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return pd.concat(list(chunks), ignore_index=True)
+
+    tables = []
+    for chunk in chunks:
+        try:
+            tables.append(pa.Table.from_pandas(chunk, preserve_index=False))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            frames = [table.to_pandas() for table in tables] + [chunk] + list(chunks)
+            return pd.concat(frames, ignore_index=True)
+    try:
+        return pa.concat_tables(tables, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+
+
+def _write_cache(table, cache_path):
+    # Writes the uncompressed Arrow IPC cache file; returns False if that failed
+    import pyarrow as pa
+
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    partial = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with pa.OSFile(partial, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(partial, cache_path)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(partial):
+            os.remove(partial)
+        return False
+    _evict_cache(cache_dir, keep=cache_path)
+    return True
+
+
+def _evict_cache(cache_dir, keep, max_bytes=None):
+    # Removes the least recently used cache files until the cache fits
+    max_bytes = EXCEL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if name.endswith('.arrow'):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # Removed by another process
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # Still memory-mapped (Windows); removed by a later write
+        total -= size
+
+
+def _read_sheet_job(args):
+    file_path, sheet_name, cell_range, use_cache, cache_dir = args
+    return sheet_name, read_excel_fast(file_path, sheet_name=sheet_name, cell_range=cell_range,
+                                       use_cache=use_cache, cache_dir=cache_dir)
+
+
+def read_excel_sheets(file_path, sheet_names=None, cell_range=None, use_cache=True,
+                      cache_dir=None, max_workers=None):
+    """
+    Reads several worksheets in parallel worker processes.
+
+    XML parsing is CPU-bound and holds the GIL, so every sheet is parsed in its
+    own process.
+
+    Args:
+        file_path (str): Path to the .xlsx/.xlsm file.
+        sheet_names (list of str, optional): Sheets to read. Defaults to all sheets.
+        cell_range (str, optional): Range to read from every sheet.
+        use_cache (bool, optional): See read_excel_fast. Defaults to True.
+        cache_dir (str, optional): See read_excel_fast.
+        max_workers (int, optional): Number of processes. Defaults to the number of
+            sheets, capped at the number of CPUs.
+
+    Returns:
+        dict: Maps each sheet name to its DataFrame, in the requested order.
+    """
+    if sheet_names is None:
+        sheet_names = list_sheets(file_path)
+    jobs = [(file_path, name, cell_range, use_cache, cache_dir) for name in sheet_names]
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    if len(jobs) <= 1 or max_workers <= 1:
+        return dict(map(_read_sheet_job, jobs))
+
+    # spawn: forking a process that runs a Tk main loop is unsafe
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        return dict(executor.map(_read_sheet_job, jobs))
+
+
+def clear_excel_cache(cache_dir=None):
+    """
+    Deletes all cached sheets.
+
+    Args:
+        cache_dir (str, optional): Cache directory. Defaults to EXCEL_CACHE_DIR.
+    """
+    shutil.rmtree(cache_dir or EXCEL_CACHE_DIR, ignore_errors=True)
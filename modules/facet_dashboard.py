@@ -0,0 +1,220 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+FACET_CHART_TYPES = ('histogram', 'box')
+# Below this many panels, starting worker processes costs more than it saves.
+PARALLEL_MIN_PANELS = 8
+
+
+def compute_facet_summaries(df, facet_col, value_col, bins=30, max_facets=50):
+    """
+    Computes the per-facet summaries of a small-multiple dashboard in one pass.
+
+    The facet column is factorized once; the histograms of all facets come from a
+    single bincount over (facet, bin) pairs with bin edges shared by all facets,
+    and the box-plot statistics from one group-by on the same codes. Panels are
+    then drawn from these summaries only, never from the raw rows.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to summarize.
+        facet_col (str): Category column; one panel per value.
+        value_col (str): Numerical column shown in every panel.
+        bins (int, optional): Number of histogram bins. Defaults to 30.
+        max_facets (int, optional): Keep only the most frequent facets. Defaults to 50.
+
+    Returns:
+        list of dict: One summary per facet, most frequent first, with the keys
+        'label', 'count', 'edges', 'hist' and 'box' (statistics for Axes.bxp).
+
+    Raises:
+        ValueError: If value_col is not numerical.
+    """
+    if not pd.api.types.is_numeric_dtype(df[value_col]):
+        raise ValueError(f"Column '{value_col}' is not numerical.")
+
+    codes, labels = pd.factorize(df[facet_col], sort=False)
+    values = df[value_col].to_numpy(dtype=float)
+    valid = (codes >= 0) & ~np.isnan(values)
+    codes, values = codes[valid], values[valid]
+    if len(values) == 0:
+        return []
+
+    counts = np.bincount(codes, minlength=len(labels))
+    keep = np.argsort(-counts, kind='stable')[:max_facets]
+    keep = keep[counts[keep] > 0]
+
+    edges = np.histogram_bin_edges(values, bins=bins)
+    bin_index = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, bins - 1)
+    hist = np.bincount(codes * bins + bin_index,
+                       minlength=len(labels) * bins).reshape(len(labels), bins)
+
+    grouped = pd.Series(values).groupby(codes)
+    stats = grouped.agg(['min', 'max', 'mean'])
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+
+    summaries = []
+    for code in keep:
+        q1, median, q3 = quartiles.loc[code, [0.25, 0.5, 0.75]]
+        low, high = stats.loc[code, 'min'], stats.loc[code, 'max']
+        iqr = q3 - q1
+        summaries.append({
+            'label': str(labels[code]),
+            'count': int(counts[code]),
+            'edges': edges,
+            'hist': hist[code],
+            # Whiskers at 1.5 IQR, clipped to the data range
+            'box': {'med': median, 'q1': q1, 'q3': q3, 'mean': stats.loc[code, 'mean'],
+                    'whislo': max(low, q1 - 1.5 * iqr), 'whishi': min(high, q3 + 1.5 * iqr),
+                    'fliers': [], 'label': ''},
+        })
+    return summaries
+
+
+def _render_panels(summaries, kind, value_col, limits, panel_size, dpi):
+    # Draws the panels on one reused Agg canvas; no pyplot, so it is safe in workers
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=panel_size, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    # Fixed margins instead of tight_layout, which dominates the cost of small panels
+    fig.subplots_adjust(left=0.17, right=0.96, bottom=0.2, top=0.87)
+    ax = fig.add_subplot()
+    images = []
+    for summary in summaries:
+        ax.clear()
+        if kind == 'histogram':
+            ax.stairs(summary['hist'], summary['edges'], fill=True, color='steelblue')
+            ax.set_xlim(limits['x'])
+            ax.set_ylim(0, limits['y'])
+            ax.set_xlabel(value_col, fontsize=8)
+        else:
+            ax.bxp([summary['box']], showmeans=True, showfliers=False)
+            ax.set_ylim(limits['y_box'])
+            ax.set_xticks([])
+            ax.set_ylabel(value_col, fontsize=8)
+        ax.set_title(f"{summary['label']} (n={summary['count']:,})", fontsize=9)
+        ax.tick_params(labelsize=7)
+        canvas.draw()
+        images.append(np.asarray(canvas.buffer_rgba()).copy())
+    return images
+
+
+def render_facet_panels(summaries, kind='histogram', value_col='', panel_size=(3.0, 2.2),
+                        dpi=100, max_workers=None):
+    """
+    Renders one image per facet, in parallel worker processes for many panels.
+
+    All panels share their axis limits so that they can be compared at a glance.
+
+    Args:
+        summaries (list of dict): Output of compute_facet_summaries.
+        kind (str, optional): 'histogram' or 'box'. Defaults to 'histogram'.
+        value_col (str, optional): Axis label.
+        panel_size (tuple, optional): Size of a panel in inches. Defaults to (3.0, 2.2).
+        dpi (int, optional): Resolution of the panels. Defaults to 100.
+        max_workers (int, optional): Number of processes. Defaults to the number of
+            CPUs; panels are rendered in-process when it is 1 or there are fewer
+            than PARALLEL_MIN_PANELS panels.
+
+    Returns:
+        list of np.ndarray: RGBA images of equal size, in the order of summaries.
+
+    Raises:
+        ValueError: If the chart type is invalid.
+    """
+    if kind not in FACET_CHART_TYPES:
+        raise ValueError(f"Invalid facet chart type: {kind}")
+    if not summaries:
+        return []
+
+    edges = summaries[0]['edges']
+    low = min(s['box']['whislo'] for s in summaries)
+    high = max(s['box']['whishi'] for s in summaries)
+    pad = (high - low) * 0.05 or 1.0
+    limits = {'x': (edges[0], edges[-1]),
+              'y': max(int(s['hist'].max()) for s in summaries) * 1.05 or 1,
+              'y_box': (low - pad, high + pad)}
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers <= 1 or len(summaries) < PARALLEL_MIN_PANELS:
+        return _render_panels(summaries, kind, value_col, limits, panel_size, dpi)
+
+    # One batch per worker amortizes the start-up of the spawned interpreters
+    size = math.ceil(len(summaries) / max_workers)
+    batches = [summaries[i:i + size] for i in range(0, len(summaries), size)]
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=len(batches), mp_context=context) as executor:
+        futures = [executor.submit(_render_panels, batch, kind, value_col, limits,
+                                   panel_size, dpi) for batch in batches]
+        return [image for future in futures for image in future.result()]
+
+
+def compose_panels(images, ncols=None):
+    """
+    Arranges equally sized panel images in a grid.
+
+    Args:
+        images (list of np.ndarray): RGBA panels.
+        ncols (int, optional): Panels per row. Defaults to a roughly square grid.
+
+    Returns:
+        np.ndarray: The RGBA grid image; unused cells are white.
+    """
+    height, width, channels = images[0].shape
+    ncols = ncols or math.ceil(math.sqrt(len(images)))
+    nrows = math.ceil(len(images) / ncols)
+    grid = np.full((nrows * height, ncols * width, channels), 255, dtype=np.uint8)
+    for i, image in enumerate(images):
+        row, col = divmod(i, ncols)
+        grid[row * height:(row + 1) * height, col * width:(col + 1) * width] = image
+    return grid
+
+
+def create_facet_dashboard(df, facet_col, value_col, kind='histogram', bins=30, max_facets=50,
+                           title=None, max_workers=None, show=True):
+    """
+    Creates a small-multiple dashboard with one panel per value of a category.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to plot.
+        facet_col (str): Category column to facet by.
+        value_col (str): Numerical column shown in every panel.
+        kind (str, optional): 'histogram' or 'box'. Defaults to 'histogram'.
+        bins (int, optional): Histogram bins. Defaults to 30.
+        max_facets (int, optional): Most frequent facets to show. Defaults to 50.
+        title (str, optional): Title of the dashboard.
+        max_workers (int, optional): See render_facet_panels.
+        show (bool, optional): Call plt.show(). Defaults to True.
+
+    Returns:
+        matplotlib.figure.Figure: The dashboard figure.
+
+    Raises:
+        ValueError: If there is nothing to plot.
+    """
+    import matplotlib.pyplot as plt
+
+    summaries = compute_facet_summaries(df, facet_col, value_col, bins=bins,
+                                        max_facets=max_facets)
+    if not summaries:
+        raise ValueError(f"No values to plot in column '{value_col}'.")
+    dpi = 100
+    images = render_facet_panels(summaries, kind=kind, value_col=value_col, dpi=dpi,
+                                 max_workers=max_workers)
+    grid = compose_panels(images)
+
+    # One image axes at the panels' native resolution
+    fig = plt.figure(figsize=(grid.shape[1] / dpi, grid.shape[0] / dpi + 0.6), dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, grid.shape[0] / (grid.shape[0] + 0.6 * dpi)])
+    ax.imshow(grid, interpolation='nearest')
+    ax.axis('off')
+    fig.suptitle(title or f"{value_col} by {facet_col}", fontsize=14)
+    if show:
+        plt.show()
+    return fig
@@ -0,0 +1,179 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+
+def current_memory_bytes():
+    """
+    Returns the resident memory of the current process.
+
+    Uses psutil when installed, otherwise /proc/self/statm (Linux).
+
+    Returns:
+        int or None: Resident set size in bytes, or None if it cannot be measured.
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+class PerformanceMonitor:
+    """
+    Records timing and memory spans of operations and optionally runs cProfile.
+
+    Spans can be nested and used from any thread; the most recent max_records
+    spans are kept in memory.
+    """
+
+    def __init__(self, max_records=500):
+        self.enabled = True
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiler = None
+
+    @contextmanager
+    def span(self, name, category='module'):
+        """
+        Times the enclosed block and records it.
+
+        Args:
+            name (str): Operation name, e.g. 'data_cleaner.filter_data'.
+            category (str, optional): Grouping such as 'module' or 'ui'.
+                Defaults to 'module'.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        memory_before = current_memory_bytes()
+        started_at = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            memory_after = current_memory_bytes()
+            self._local.depth = depth
+            memory_delta = None
+            if memory_before is not None and memory_after is not None:
+                memory_delta = memory_after - memory_before
+            record = {
+                'name': name,
+                'category': category,
+                'started_at': started_at,
+                'duration': duration,
+                'memory_delta': memory_delta,
+                'depth': depth,
+                'thread': threading.current_thread().name,
+                'error': error,
+            }
+            with self._lock:
+                self._records.append(record)
+
+    def timed(self, name=None, category='ui'):
+        """
+        Decorator recording a span for every call of the decorated function.
+
+        Args:
+            name (str, optional): Span name. Defaults to the function name.
+            category (str, optional): Span category. Defaults to 'ui'.
+        """
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_records(self):
+        """Returns a list of the recorded spans, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        """Removes all recorded spans."""
+        with self._lock:
+            self._records.clear()
+
+    def summary(self):
+        """
+        Aggregates the recorded spans by name.
+
+        Returns:
+            dict: Maps each span name to a dict with 'count', 'total', 'mean' and
+            'max' durations in seconds.
+        """
+        totals = {}
+        for record in self.get_records():
+            entry = totals.setdefault(record['name'], {'count': 0, 'total': 0.0, 'max': 0.0})
+            entry['count'] += 1
+            entry['total'] += record['duration']
+            entry['max'] = max(entry['max'], record['duration'])
+        for entry in totals.values():
+            entry['mean'] = entry['total'] / entry['count']
+        return totals
+
+    @property
+    def is_profiling(self):
+        return self._profiler is not None
+
+    def start_profiling(self):
+        """
+        Starts collecting a cProfile profile of the calling thread (the GUI thread).
+
+        Raises:
+            RuntimeError: If profiling is already running.
+        """
+        if self._profiler is not None:
+            raise RuntimeError("Profiling is already running.")
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profiling(self, file_path=None):
+        """
+        Stops profiling and optionally writes the profile to a file.
+
+        The file can be opened with pstats or tools such as snakeviz.
+
+        Args:
+            file_path (str, optional): Where to dump the raw profile data.
+
+        Returns:
+            pstats.Stats: The collected statistics.
+
+        Raises:
+            RuntimeError: If profiling is not running.
+        """
+        if self._profiler is None:
+            raise RuntimeError("Profiling is not running.")
+        profiler, self._profiler = self._profiler, None
+        profiler.disable()
+        if file_path:
+            profiler.dump_stats(file_path)
+        return pstats.Stats(profiler)
+
+
+# Shared monitor used by the application.
+monitor = PerformanceMonitor()
@@ -0,0 +1,253 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+SUPPORTED_FORMATS = ('png', 'svg', 'pdf')
+
+# Maps the chart type used in export specs to the data_visualizer function.
+CHART_FUNCTIONS = {
+    'histogram': 'create_histogram',
+    'scatter': 'create_scatter_plot',
+    'bar': 'create_bar_chart',
+    'box': 'create_box_plot',
+    'correlation': 'create_correlation_heatmap',
+}
+
+# Spec keys that name a column; the value '*' expands to every numeric column.
+COLUMN_KEYS = ('column', 'x_col', 'y_col')
+
+
+def _use_headless_backend():
+    """Switches matplotlib to the non-interactive Agg backend."""
+    matplotlib.use('Agg', force=True)
+
+
+def expand_chart_specs(df, charts):
+    """
+    Expands wildcard column references in chart specs.
+
+    A spec such as {'type': 'histogram', 'column': '*'} becomes one histogram per
+    numeric column; {'type': 'scatter', 'x_col': '*', 'y_col': '*'} becomes one
+    scatter plot per pair of distinct numeric columns. Like wildcards without
+    numeric columns, correlation charts are dropped when there are none.
+
+    Args:
+        df (pd.DataFrame): The DataFrame the charts will be drawn from.
+        charts (list of dict): Chart specs, each with a 'type' key and the keyword
+            arguments of the matching data_visualizer function.
+
+    Returns:
+        list of dict: The expanded chart specs.
+    """
+    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    expanded = []
+    for spec in charts:
+        if spec.get('type') == 'correlation' and not numeric_cols:
+            continue
+        wildcard_keys = [key for key in COLUMN_KEYS if spec.get(key) == '*']
+        if not wildcard_keys:
+            expanded.append(dict(spec))
+            continue
+        for combo in itertools.product(numeric_cols, repeat=len(wildcard_keys)):
+            if len(set(combo)) < len(combo):
+                continue
+            new_spec = dict(spec)
+            new_spec.update(zip(wildcard_keys, combo))
+            expanded.append(new_spec)
+    return expanded
+
+
+def render_chart(df, spec):
+    """
+    Renders a single chart spec to a matplotlib figure without displaying it.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to plot.
+        spec (dict): Chart spec with a 'type' key (see CHART_FUNCTIONS), an optional
+            'name' key and the keyword arguments of the visualizer function.
+
+    Returns:
+        matplotlib.figure.Figure: The rendered figure.
+
+    Raises:
+        ValueError: If the chart type is not supported.
+    """
+    # Imported here so that the backend can be chosen before pyplot is loaded.
+    from modules import data_visualizer
+
+    kwargs = dict(spec)
+    chart_type = kwargs.pop('type', None)
+    kwargs.pop('name', None)
+    if chart_type not in CHART_FUNCTIONS:
+        raise ValueError(f"Invalid chart type: {chart_type}")
+    func = getattr(data_visualizer, CHART_FUNCTIONS[chart_type])
+    return func(df, show=False, **kwargs)
+
+
+def _chart_name(index, spec):
+    if spec.get('name'):
+        return spec['name']
+    columns = [str(spec[key]) for key in COLUMN_KEYS if spec.get(key)]
+    return '_'.join([f"{index + 1:02d}", spec['type']] + columns)
+
+
+def export_report(df, charts, output_dir, name='report', formats=('png',), dpi=100):
+    """
+    Renders a set of charts for one dataset and writes them to disk.
+
+    PNG and SVG output produce one file per chart; PDF output produces a single
+    multi-page report with one chart per page.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to plot.
+        charts (list of dict): Chart specs (see render_chart and expand_chart_specs).
+        output_dir (str): Directory the files are written to. Created if missing.
+        name (str, optional): Prefix of the written files. Defaults to 'report'.
+        formats (iterable of str, optional): Any of 'png', 'svg', 'pdf'.
+            Defaults to ('png',).
+        dpi (int, optional): Resolution of raster output. Defaults to 100.
+
+    Returns:
+        list of str: Paths of the written files.
+
+    Raises:
+        ValueError: If an unsupported format is requested.
+    """
+    invalid = set(formats) - set(SUPPORTED_FORMATS)
+    if invalid:
+        raise ValueError(f"Invalid export format(s): {', '.join(sorted(invalid))}")
+
+    _use_headless_backend()
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    pdf_path = os.path.join(output_dir, f"{name}.pdf")
+    pdf = PdfPages(pdf_path) if 'pdf' in formats else None
+    try:
+        for i, spec in enumerate(expand_chart_specs(df, charts)):
+            fig = render_chart(df, spec)
+            try:
+                chart_name = _chart_name(i, spec)
+                for fmt in formats:
+                    if fmt == 'pdf':
+                        continue
+                    path = os.path.join(output_dir, f"{name}_{chart_name}.{fmt}")
+                    fig.savefig(path, format=fmt, dpi=dpi)
+                    written.append(path)
+                if pdf is not None:
+                    pdf.savefig(fig)
+            finally:
+                plt.close(fig)
+    finally:
+        if pdf is not None:
+            pdf.close()
+            written.append(pdf_path)
+    return written
+
+
+def _job_names(jobs):
+    """File prefixes of the jobs; names used more than once get the job number."""
+    names = [job.get('name', 'report') for job in jobs]
+    repeated = {name for name in names if names.count(name) > 1}
+    unique = [f"{name}_{i + 1}" if name in repeated else name for i, name in enumerate(names)]
+    if len(set(unique)) < len(unique):
+        raise ValueError("Job names must be unique")
+    return unique
+
+
+def _export_job(job, name, output_dir, formats, dpi):
+    """Worker entry point: loads the job's data if needed and exports its report."""
+    data = job['data']
+    if isinstance(data, str):
+        from modules.data_loader import read_data_file
+        data = read_data_file(data)
+    return export_report(data, job['charts'], output_dir,
+                         name=name, formats=formats, dpi=dpi)
+
+
+def export_reports(jobs, output_dir, formats=('png',), dpi=100, max_workers=None):
+    """
+    Exports reports for many datasets in parallel worker processes.
+
+    Each worker uses the non-interactive Agg backend, so this can run without a
+    display, e.g. from a scheduled nightly job.
+
+    Args:
+        jobs (list of dict): One entry per report with the keys
+            - 'name': Prefix of the written files. Defaults to 'report'; a name
+              used by several jobs gets the job's position appended ('report_2').
+            - 'data': A DataFrame or the path of a CSV/Excel file. Paths are read
+              inside the worker, which avoids sending large frames between processes.
+            - 'charts': List of chart specs.
+        output_dir (str): Directory the files are written to.
+        formats (iterable of str, optional): Any of 'png', 'svg', 'pdf'.
+            Defaults to ('png',).
+        dpi (int, optional): Resolution of raster output. Defaults to 100.
+        max_workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        dict: Maps each job name to the list of files written for it.
+
+    Raises:
+        ValueError: If the job names cannot be made unique.
+    """
+    formats = tuple(formats)
+    names = _job_names(jobs)
+    if len(jobs) <= 1 or max_workers == 1:
+        return {name: _export_job(job, name, output_dir, formats, dpi)
+                for job, name in zip(jobs, names)}
+
+    # Spawned workers start from a clean interpreter instead of inheriting the
+    # parent's GUI state (Tk, interactive backend).
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        futures = {name: executor.submit(_export_job, job, name, output_dir, formats, dpi)
+                   for job, name in zip(jobs, names)}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def export_reports_from_config(config_path):
+    """
+    Runs a batch export described by a JSON configuration file.
+
+    Example configuration::
+
+        {
+            "output_dir": "reports",
+            "formats": ["png", "pdf"],
+            "jobs": [
+                {"name": "sales", "data": "data/sales.csv",
+                 "charts": [{"type": "histogram", "column": "*"},
+                            {"type": "correlation"}]}
+            ]
+        }
+
+    Args:
+        config_path (str): Path to the JSON configuration file.
+
+    Returns:
+        dict: Maps each job name to the list of files written for it.
+    """
+    with open(config_path, encoding='utf-8') as f:
+        config = json.load(f)
+    return export_reports(config['jobs'], config.get('output_dir', '.'),
+                          formats=config.get('formats', ['png']),
+                          dpi=config.get('dpi', 100),
+                          max_workers=config.get('max_workers'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Export charts and reports without the GUI.")
+    parser.add_argument('config', help="Path to the JSON export configuration.")
+    args = parser.parse_args()
+    for job_name, paths in export_reports_from_config(args.config).items():
+        print(f"{job_name}: {len(paths)} file(s) written")
@@ -0,0 +1,333 @@
+import tkinter as tk
+from tkinter import ttk
+
+# The table is built with the main window, so numpy and pandas are only imported
+# once a result is shown to keep them off the startup path.
+FLOAT_FORMAT = '{:,.6g}'
+COLUMN_WIDTH = 110
+INDEX_WIDTH = 160
+# Fallback row height in pixels when the theme does not define one.
+ROW_HEIGHT = 20
+
+
+def format_label(label):
+    """
+    Formats a row or column label for display.
+
+    Args:
+        label: A label; tuples (MultiIndex) are joined with ' | '.
+
+    Returns:
+        str: The display text.
+    """
+    if isinstance(label, tuple):
+        return ' | '.join(format_label(part) for part in label)
+    return '' if label is None else str(label)
+
+
+def format_cells(frame, rows, columns, float_format=FLOAT_FORMAT):
+    """
+    Formats a block of a DataFrame as display strings.
+
+    Only the requested block is converted, so the cost depends on the visible part
+    of a result, not on its size.
+
+    Args:
+        frame (pd.DataFrame): The result to display.
+        rows (array-like of int): Row positions.
+        columns (array-like of int): Column positions.
+        float_format (str, optional): Format of floating-point values.
+
+    Returns:
+        list of list of str: One list of cell texts per row; missing values are empty.
+    """
+    import numpy as np
+    import pandas as pd
+
+    block = frame.iloc[np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)]
+    texts = []
+    for j in range(block.shape[1]):
+        column = block.iloc[:, j]
+        missing = column.isna().to_numpy()
+        if pd.api.types.is_float_dtype(column.dtype):
+            values = column.to_numpy(dtype=float, na_value=np.nan)
+            texts.append(['' if na else float_format.format(v) for v, na in zip(values, missing)])
+        else:
+            texts.append(['' if na else str(v) for v, na in zip(column.tolist(), missing)])
+    return [list(row) for row in zip(*texts)] if texts else [[] for _ in range(len(block))]
+
+
+def _sorted_positions(values, ascending):
+    import pandas as pd
+
+    series = pd.Series(values).reset_index(drop=True)
+    try:
+        ordered = series.sort_values(ascending=ascending, kind='stable', na_position='last')
+    except TypeError:
+        # Mixed types (e.g. the rows of describe(include='all')): compare as text
+        ordered = series.astype(str).where(series.notna()).sort_values(
+            ascending=ascending, kind='stable', na_position='last')
+    return ordered.index.to_numpy()
+
+
+def sort_order(frame, column=None, ascending=True):
+    """
+    Computes the row order that sorts a result by one column.
+
+    Args:
+        frame (pd.DataFrame): The result.
+        column (int, optional): Position of the column; None sorts by the row labels.
+        ascending (bool, optional): Sort direction. Defaults to True.
+
+    Returns:
+        np.ndarray: Row positions in sorted order; missing values come last and
+        ties keep their order.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if column is not None:
+        return _sorted_positions(frame.iloc[:, column], ascending)
+    positions = pd.Series(np.arange(len(frame)), index=frame.index)
+    try:
+        return positions.sort_index(ascending=ascending, kind='stable',
+                                    na_position='last').to_numpy()
+    except TypeError:
+        return _sorted_positions([format_label(label) for label in frame.index], ascending)
+
+
+def search_rows(frame, text):
+    """
+    Finds the rows of a result that contain a text.
+
+    Args:
+        frame (pd.DataFrame): The result.
+        text (str): Text to look for, case-insensitively, in the row labels and in
+            every cell.
+
+    Returns:
+        np.ndarray: Boolean mask of the matching rows.
+    """
+    import numpy as np
+    import pandas as pd
+
+    mask = np.zeros(len(frame), dtype=bool)
+    levels = [frame.index.get_level_values(i) for i in range(frame.index.nlevels)]
+    for values in levels + [frame.iloc[:, j] for j in range(frame.shape[1])]:
+        # Each distinct value is converted and matched once; missing values get -1
+        codes, uniques = pd.factorize(values)
+        if len(uniques) == 0:
+            continue
+        texts = pd.Series(np.asarray(uniques, dtype=object)).astype(str)
+        # Literal matching; the patterns typed by users are not regular expressions
+        found = np.append(texts.str.contains(text, case=False, regex=False).to_numpy(), False)
+        mask |= found[codes]
+    return mask
+
+
+class ResultTable(ttk.Frame):
+    """
+    Virtualized grid for analysis results.
+
+    The Treeview only ever holds the rows and columns that fit in the widget; the
+    scrollbars move a window over the DataFrame and only the cells in that window
+    are formatted. The row labels stay visible in the first column. Clicking a
+    heading sorts, and the search box filters, the rows of the underlying frame;
+    both only change the row order that the window is taken from.
+    """
+
+    def __init__(self, master, height=10, column_width=COLUMN_WIDTH, **kwargs):
+        super().__init__(master, **kwargs)
+        self.frame = None
+        self.column_width = column_width
+        self.page_rows = height
+        self.page_columns = 1
+        self.top = 0
+        self.left = 0
+        # (column position or None for the row labels, ascending) of the sort
+        self.sort = None
+        # Boolean mask of the rows matching the search, None without a search
+        self.matches = None
+        # Positions of the displayed rows in display order; None for all in order
+        self.order = None
+
+        self.tree = ttk.Treeview(self, height=height, show="tree headings",
+                                 selectmode="browse")
+        self.tree.column("#0", width=INDEX_WIDTH, stretch=False)
+        self.vscroll = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_yview)
+        self.hscroll = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.on_xview)
+        self.info_var = tk.StringVar()
+        self.search_var = tk.StringVar()
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vscroll.grid(row=0, column=1, sticky="ns")
+        self.hscroll.grid(row=1, column=0, sticky="ew")
+        footer = ttk.Frame(self)
+        footer.grid(row=2, column=0, columnspan=2, sticky="ew")
+        ttk.Label(footer, textvariable=self.info_var, anchor=tk.W).pack(
+            side=tk.LEFT, fill="x", expand=True)
+        ttk.Button(footer, text="Clear", command=self.clear_search).pack(side=tk.RIGHT)
+        ttk.Button(footer, text="Find", command=self.search).pack(side=tk.RIGHT)
+        search_entry = ttk.Entry(footer, textvariable=self.search_var, width=20)
+        search_entry.pack(side=tk.RIGHT, padx=5)
+        search_entry.bind("<Return>", lambda event: self.search())
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+        for sequence, rows in (("<Prior>", -1), ("<Next>", 1)):
+            self.tree.bind(sequence, lambda event, rows=rows: self.scroll_rows(rows * self.page_rows))
+
+    def show(self, frame):
+        # Displays a DataFrame (or Series) from its first row and column
+        import pandas as pd
+
+        if isinstance(frame, pd.Series):
+            frame = frame.to_frame()
+        self.frame = frame
+        self.top = self.left = 0
+        self.sort = self.matches = self.order = None
+        self.search_var.set("")
+        self.render()
+
+    def clear(self):
+        self.frame = None
+        self.sort = self.matches = self.order = None
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = []
+        self.tree.heading("#0", text="")
+        self.info_var.set("")
+
+    def row_count(self):
+        # Number of rows to scroll through (the matching rows while searching)
+        return len(self.order) if self.order is not None else len(self.frame)
+
+    def visible_rows(self):
+        # Positions in self.frame of the rows in the window
+        import numpy as np
+
+        if self.order is not None:
+            return self.order[self.top:self.top + self.page_rows]
+        return np.arange(self.top, min(self.top + self.page_rows, len(self.frame)))
+
+    def update_order(self):
+        # Row order from the sort, restricted to the search matches
+        if self.sort is not None:
+            order = sort_order(self.frame, *self.sort)
+            if self.matches is not None:
+                order = order[self.matches[order]]
+        elif self.matches is not None:
+            order = self.matches.nonzero()[0]
+        else:
+            order = None
+        self.order = order
+        self.top = 0
+        self.render()
+
+    def sort_by(self, column):
+        # Sorts by a column (None: row labels); a second click reverses the order
+        if self.frame is None:
+            return
+        ascending = not (self.sort is not None and self.sort == (column, True))
+        self.sort = (column, ascending)
+        self.update_order()
+
+    def search(self):
+        text = self.search_var.get().strip()
+        if self.frame is None:
+            return
+        self.matches = search_rows(self.frame, text) if text else None
+        self.update_order()
+
+    def clear_search(self):
+        self.search_var.set("")
+        self.search()
+
+    def heading_text(self, label, column):
+        if self.sort is not None and self.sort[0] == column:
+            arrow = '\u25b2' if self.sort[1] else '\u25bc'
+            return f"{label} {arrow}"
+        return label
+
+    def render(self):
+        if self.frame is None:
+            return
+        n_rows, n_columns = self.row_count(), self.frame.shape[1]
+        self.top = max(0, min(self.top, n_rows - self.page_rows))
+        self.left = max(0, min(self.left, n_columns - self.page_columns))
+        rows = self.visible_rows()
+        columns = range(self.left, min(self.left + self.page_columns, n_columns))
+
+        ids = [str(j) for j in columns]
+        self.tree["columns"] = ids
+        index_names = [name for name in self.frame.index.names if name is not None]
+        self.tree.heading("#0", text=self.heading_text(format_label(tuple(index_names)), None),
+                          command=lambda: self.sort_by(None))
+        for j, column_id in zip(columns, ids):
+            self.tree.heading(column_id,
+                              text=self.heading_text(format_label(self.frame.columns[j]), j),
+                              command=lambda j=j: self.sort_by(j))
+            self.tree.column(column_id, width=self.column_width, stretch=False, anchor=tk.E)
+
+        self.tree.delete(*self.tree.get_children())
+        labels = self.frame.index[rows] if len(rows) else []
+        for label, values in zip(labels, format_cells(self.frame, rows, columns)):
+            self.tree.insert("", "end", text=format_label(label), values=values)
+
+        self.vscroll.set(*self._fractions(self.top, len(rows), n_rows))
+        self.hscroll.set(*self._fractions(self.left, len(columns), n_columns))
+        matching = " matching" if self.matches is not None else ""
+        if n_rows and n_columns:
+            self.info_var.set(
+                f"Rows {self.top + 1:,}-{self.top + len(rows):,} of {n_rows:,}{matching}, "
+                f"columns {self.left + 1:,}-{self.left + len(columns):,} of {n_columns:,}")
+        else:
+            self.info_var.set(f"{n_rows:,}{matching} rows, {n_columns:,} columns")
+
+    @staticmethod
+    def _fractions(first, count, total):
+        if total == 0:
+            return 0.0, 1.0
+        return first / total, (first + count) / total
+
+    def scroll_rows(self, count):
+        self.top += count
+        self.render()
+        return "break"
+
+    def _scroll_command(self, args, position, page, total):
+        # New first position for a Scrollbar command ('moveto' or 'scroll')
+        if args[0] == "moveto":
+            return int(float(args[1]) * total)
+        step = int(args[1]) * (page if args[2] == "pages" else 1)
+        return position + step
+
+    def on_yview(self, *args):
+        if self.frame is not None:
+            self.top = self._scroll_command(args, self.top, self.page_rows, self.row_count())
+            self.render()
+
+    def on_xview(self, *args):
+        if self.frame is not None:
+            self.left = self._scroll_command(args, self.left, self.page_columns,
+                                             self.frame.shape[1])
+            self.render()
+
+    def on_wheel(self, event):
+        if self.frame is None:
+            return "break"
+        if event.num == 4 or event.delta > 0:
+            return self.scroll_rows(-3)
+        return self.scroll_rows(3)
+
+    def on_resize(self, event):
+        # Fit the window to the widget: as many rows and columns as are visible
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or ROW_HEIGHT)
+        header = row_height + 5
+        page_rows = max(1, (event.height - header) // row_height)
+        page_columns = max(1, (event.width - INDEX_WIDTH) // self.column_width)
+        if (page_rows, page_columns) != (self.page_rows, self.page_columns):
+            self.page_rows, self.page_columns = page_rows, page_columns
+            self.render()
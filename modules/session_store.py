@@ -0,0 +1,213 @@
+import json
+import numbers
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+SESSION_VERSION = 1
+MANIFEST_NAME = 'session.json'
+# Where the app saves the session when it is closed.
+DEFAULT_SESSION_DIR = os.path.join(os.path.expanduser('~'), '.data_analysis_app', 'last_session')
+SESSION_CHUNK_SIZE = 100_000
+
+
+def _is_default_index(index):
+    return isinstance(index, pd.RangeIndex)
+
+
+def _storable(df, preserve_index):
+    # Returns df (text columns with mixed types converted to strings, which
+    # Arrow cannot store otherwise) and its Arrow schema
+    import pyarrow as pa
+
+    try:
+        return df, pa.Schema.from_pandas(df, preserve_index=preserve_index)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    df = df.copy(deep=False)
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.Schema.from_pandas(df[[col]], preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df, pa.Schema.from_pandas(df, preserve_index=preserve_index)
+
+
+# Column label types that are restored from the manifest; others come back as text
+LABEL_TYPES = {'int': int, 'float': float, 'bool': bool, 'str': str}
+
+
+def _encode_label(label):
+    # [type, value] of a column label for the JSON manifest
+    if isinstance(label, (bool, np.bool_)):
+        return ['bool', bool(label)]
+    if isinstance(label, numbers.Integral):
+        return ['int', int(label)]
+    if isinstance(label, numbers.Real):
+        return ['float', float(label)]
+    return ['str', str(label)]
+
+
+def _write_frame(df, file_path, chunk_size):
+    # Writes df as an uncompressed Arrow IPC file, chunk by chunk so that only one
+    # chunk is converted at a time; returns the frame's manifest entry
+    import pyarrow as pa
+
+    # A RangeIndex is stored in the manifest; other indexes as Arrow columns
+    range_index = _is_default_index(df.index)
+    labels = None
+    if not all(isinstance(col, str) for col in df.columns):
+        # Arrow field names are strings: store the columns under their text (or
+        # position, if the texts collide) and keep the labels in the manifest
+        labels = [_encode_label(col) for col in df.columns]
+        names = [str(col) for col in df.columns]
+        if len(set(names)) < len(names):
+            names = [str(i) for i in range(len(names))]
+        df = df.set_axis(names, axis=1)
+    df, schema = _storable(df, preserve_index=not range_index)
+    with pa.OSFile(file_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            for start in range(0, max(len(df), 1), chunk_size):
+                chunk = df.iloc[start:start + chunk_size]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema,
+                                                        preserve_index=not range_index))
+    entry = {'file': os.path.basename(file_path), 'rows': len(df), 'columns': len(df.columns)}
+    if range_index:
+        entry['range_index'] = [df.index.start, df.index.stop, df.index.step]
+    if labels is not None:
+        entry['column_labels'] = labels
+    return entry
+
+
+def _read_frame(session_dir, entry, arrow_dtypes):
+    from modules.data_loader import load_arrow_ipc
+
+    df = load_arrow_ipc(os.path.join(session_dir, entry['file']), arrow_dtypes=arrow_dtypes)
+    if 'range_index' in entry:
+        df.index = pd.RangeIndex(*entry['range_index'])
+    elif isinstance(df.index.dtype, pd.ArrowDtype):
+        # Row labels are looked up often; keep them as a NumPy index
+        df.index = pd.Index(df.index.to_numpy(), name=df.index.name)
+    if 'column_labels' in entry:
+        df.columns = pd.Index([LABEL_TYPES[kind](value)
+                               for kind, value in entry['column_labels']])
+    return df
+
+
+def save_session(session_dir, df, cleaned_df=None, pipeline=None, state=None,
+                 chunk_size=SESSION_CHUNK_SIZE):
+    """
+    Saves the loaded and cleaned data with the cleaning recipe.
+
+    The frames are written as uncompressed Arrow IPC files, which load_session
+    memory-maps, so a large session resumes without parsing or copying. Every save
+    writes new file names and replaces the manifest last: a session that is still
+    memory-mapped from the same directory, or an interrupted save, never leaves a
+    broken session behind. Files of older saves are deleted when possible.
+
+    Args:
+        session_dir (str): Directory of the session; created if needed.
+        df (pd.DataFrame): The loaded data.
+        cleaned_df (pd.DataFrame, optional): The cleaned data; omit it when it is
+            the same as df (no cleaning steps).
+        pipeline (CleaningPipeline, optional): The cleaning steps applied to df.
+        state (dict, optional): JSON-serializable application state, e.g. the
+            source file and its load options.
+        chunk_size (int, optional): Rows converted at a time. Defaults to 100000.
+
+    Returns:
+        dict: 'bytes' written and elapsed 'seconds'.
+    """
+    start = time.perf_counter()
+    os.makedirs(session_dir, exist_ok=True)
+    token = f"{time.time_ns():x}"
+
+    frames = {'df': _write_frame(df, os.path.join(session_dir, f"df-{token}.arrow"),
+                                 chunk_size),
+              'cleaned_df': None}
+    if cleaned_df is not None:
+        frames['cleaned_df'] = _write_frame(
+            cleaned_df, os.path.join(session_dir, f"cleaned-{token}.arrow"), chunk_size)
+
+    manifest = {
+        'version': SESSION_VERSION,
+        'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'frames': frames,
+        'pipeline': pipeline.to_dict() if pipeline is not None else {'steps': []},
+        'state': state or {},
+    }
+    manifest_path = os.path.join(session_dir, MANIFEST_NAME)
+    partial = f"{manifest_path}.tmp"
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    os.replace(partial, manifest_path)
+
+    current = {entry['file'] for entry in frames.values() if entry is not None}
+    size = os.path.getsize(manifest_path)
+    for name in os.listdir(session_dir):
+        path = os.path.join(session_dir, name)
+        if name in current:
+            size += os.path.getsize(path)
+        elif name.endswith('.arrow'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Still memory-mapped (Windows); removed by a later save
+    return {'bytes': size, 'seconds': time.perf_counter() - start}
+
+
+def session_info(session_dir):
+    """
+    Reads the manifest of a saved session without loading any data.
+
+    Args:
+        session_dir (str): Directory of the session.
+
+    Returns:
+        dict: The manifest: 'saved_at', 'frames', 'pipeline' and 'state'.
+
+    Raises:
+        FileNotFoundError: If there is no session in session_dir.
+        ValueError: If the session was written by an incompatible version.
+    """
+    with open(os.path.join(session_dir, MANIFEST_NAME), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != SESSION_VERSION:
+        raise ValueError(f"Unsupported session version: {manifest.get('version')}")
+    return manifest
+
+
+def load_session(session_dir, arrow_dtypes=True):
+    """
+    Restores a session saved with save_session.
+
+    Args:
+        session_dir (str): Directory of the session.
+        arrow_dtypes (bool, optional): Memory-map the frames with Arrow-backed
+            columns, which is near-instant whatever the size. If False, columns
+            are converted back to their NumPy dtypes, which copies them.
+            Defaults to True.
+
+    Returns:
+        dict: 'df', 'cleaned_df', 'pipeline' (CleaningPipeline), 'state', and the
+        elapsed 'seconds'.
+
+    Raises:
+        FileNotFoundError: If there is no session in session_dir.
+        ValueError: If the session was written by an incompatible version.
+    """
+    from modules.cleaning_pipeline import CleaningPipeline
+
+    start = time.perf_counter()
+    manifest = session_info(session_dir)
+    frames = manifest['frames']
+    df = _read_frame(session_dir, frames['df'], arrow_dtypes)
+    if frames.get('cleaned_df') is not None:
+        cleaned_df = _read_frame(session_dir, frames['cleaned_df'], arrow_dtypes)
+    else:
+        cleaned_df = df.copy(deep=False)
+    return {'df': df, 'cleaned_df': cleaned_df,
+            'pipeline': CleaningPipeline.from_dict(manifest['pipeline']),
+            'state': manifest['state'], 'seconds': time.perf_counter() - start}
@@ -0,0 +1,297 @@
+import pandas as pd
+
+# pandas computes these with incremental add/remove updates (mean, sum, std, var,
+# count) or a monotonic deque (min, max), so a window pass is O(n) whatever the
+# window size; median uses a skiplist, O(n log w).
+WINDOW_FUNCTIONS = ['mean', 'sum', 'min', 'max', 'std', 'var', 'count', 'median']
+RESAMPLE_FUNCTIONS = WINDOW_FUNCTIONS + ['first', 'last']
+
+
+def _keys(by):
+    return [] if by is None else ([by] if isinstance(by, str) else list(by))
+
+
+def _is_time_window(window):
+    return isinstance(window, (str, pd.Timedelta))
+
+
+def parse_window(text):
+    """
+    Parses a window typed by the user.
+
+    Args:
+        text (str): A number of rows ('50') or a time span ('5min', '1h', '7D').
+
+    Returns:
+        int or str: The row count, or the time span.
+
+    Raises:
+        ValueError: If the text is neither.
+    """
+    text = text.strip()
+    if text.isdigit():
+        return int(text)
+    try:
+        pd.Timedelta(text)
+    except ValueError:
+        raise ValueError(f"Invalid window: {text}")
+    return text
+
+
+def _check_window(df, window, on):
+    if _is_time_window(window):
+        if on is None:
+            raise ValueError("Time-based windows need a datetime column ('on').")
+        if not df[on].is_monotonic_increasing:
+            raise ValueError(f"Column '{on}' must be sorted for time-based windows.")
+    elif int(window) < 1:
+        raise ValueError(f"Invalid window size: {window}")
+
+
+def _rolling_frame(df, columns, window, funcs, on, keys, min_periods):
+    # Runs the rolling functions on a frame with a RangeIndex and returns the
+    # results in row order
+    kwargs = {'min_periods': min_periods}
+    if _is_time_window(window):
+        # Time windows cover (t - window, t]
+        kwargs['on'] = on
+    if keys:
+        rolling = df.groupby(keys, sort=False).rolling(window, **kwargs)
+    else:
+        rolling = df.rolling(window, **kwargs)
+
+    results = {}
+    for func in funcs:
+        values = getattr(rolling, func)()
+        if keys:
+            # Grouped results come group by group; put them back in row order
+            values = values.droplevel(list(range(len(keys)))).reindex(df.index)
+        for col in columns:
+            results[f"{col}_{func}"] = values[col].to_numpy()
+    return pd.DataFrame(results)
+
+
+def rolling_stats(df, columns, window, funcs=('mean',), on=None, by=None, min_periods=None):
+    """
+    Computes rolling window statistics.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to analyze.
+        columns (str or list of str): Numerical columns to aggregate.
+        window (int or str): Number of rows (count-based), or a time span such as
+            '5min' or '1D' (time-based, needs on).
+        funcs (list of str, optional): Statistics from WINDOW_FUNCTIONS. Defaults to
+            ('mean',).
+        on (str, optional): Sorted datetime column for time-based windows.
+        by (str or list of str, optional): Compute separate windows per group.
+        min_periods (int, optional): Minimum observations in a window to produce a
+            value. Defaults to the window size (count-based) or 1 (time-based).
+
+    Returns:
+        pd.DataFrame: One column per column and statistic ('<column>_<func>'),
+        aligned to the rows of df.
+
+    Raises:
+        ValueError: If a statistic or the window is invalid.
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    invalid = [func for func in funcs if func not in WINDOW_FUNCTIONS]
+    if invalid:
+        raise ValueError(f"Invalid window function(s): {invalid}")
+    _check_window(df, window, on)
+
+    keys = _keys(by)
+    needed = list(dict.fromkeys(columns + keys + ([on] if on is not None else [])))
+    frame = df[needed].reset_index(drop=True)
+    result = _rolling_frame(frame, columns, window, funcs, on, keys, min_periods)
+    result.index = df.index
+    return result
+
+
+def rolling_correlation(df, x_col, y_col, window, on=None, by=None, min_periods=None):
+    """
+    Computes the rolling Pearson correlation of two columns.
+
+    The covariance is taken as (var(x + y) - var(x - y)) / 4 of the columns scaled
+    to unit variance, so only rolling variances are needed. pandas updates those
+    with deviations from the window mean (Welford), which stays accurate for
+    values far from zero and across level shifts, unlike E[xy] - E[x]E[y]. The
+    kernels are the O(n) ones of rolling_stats, also for grouped windows. Rows
+    where either value is missing are ignored.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to analyze.
+        x_col (str): First numerical column.
+        y_col (str): Second numerical column.
+        window (int or str): Number of rows or a time span, see rolling_stats.
+        on (str, optional): Sorted datetime column for time-based windows.
+        by (str or list of str, optional): Compute separate windows per group.
+        min_periods (int, optional): See rolling_stats.
+
+    Returns:
+        pd.Series: The correlation for every row of df.
+    """
+    _check_window(df, window, on)
+    keys = _keys(by)
+
+    x = pd.to_numeric(df[x_col]).to_numpy(dtype=float, copy=True)
+    y = pd.to_numeric(df[y_col]).to_numpy(dtype=float, copy=True)
+    missing = pd.isna(x) | pd.isna(y)
+    x[missing] = y[missing] = float('nan')
+    # Scaling keeps var(x + y) and var(x - y) from being dominated by one column
+    x = x / _scale(x)
+    y = y / _scale(y)
+
+    frame = pd.DataFrame({'x': x, 'y': y, 'sum': x + y, 'diff': x - y})
+    for col in keys + ([on] if on is not None else []):
+        frame[col] = df[col].to_numpy()
+    variances = _rolling_frame(frame, ['x', 'y', 'sum', 'diff'], window, ['var'], on, keys,
+                               min_periods)
+
+    var_x, var_y = variances['x_var'], variances['y_var']
+    cov = (variances['sum_var'] - variances['diff_var']) / 4
+    corr = (cov / (var_x * var_y) ** 0.5).where((var_x > 0) & (var_y > 0)).clip(-1, 1)
+    return pd.Series(corr.to_numpy(), index=df.index, name=f"{x_col}_{y_col}_corr")
+
+
+def _scale(values):
+    # Standard deviation of the non-missing values, 1 if there is no spread
+    std = pd.Series(values).std()
+    return std if std > 0 else 1.0
+
+
+def resample_time(df, on, freq, agg='mean', columns=None, by=None):
+    """
+    Aggregates rows into fixed time buckets.
+
+    Buckets are aligned to the Unix epoch (midnight for daily or shorter spans)
+    and only buckets that contain rows are returned.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to aggregate.
+        on (str): Datetime column.
+        freq (str): Bucket size such as '1min', '1h' or '1D'.
+        agg (str, optional): Aggregation from RESAMPLE_FUNCTIONS. Defaults to 'mean'.
+        columns (list of str, optional): Columns to aggregate. Defaults to all
+            numerical columns.
+        by (str or list of str, optional): Bucket each group separately.
+
+    Returns:
+        pd.DataFrame: Indexed by the group keys (if any) and the bucket start.
+
+    Raises:
+        ValueError: If the aggregation is invalid.
+    """
+    if agg not in RESAMPLE_FUNCTIONS:
+        raise ValueError(f"Invalid resample function: {agg}")
+    keys = _keys(by)
+    if columns is None:
+        columns = [col for col in df.select_dtypes(include=['number']).columns
+                   if col not in keys]
+    grouped = df.groupby(keys + [pd.Grouper(key=on, freq=freq, origin='epoch')])
+    result = grouped[list(columns)].agg(agg)
+    sizes = grouped.size()
+    return result.loc[sizes[sizes > 0].index]
+
+
+def _window_tail(frame, window, on, keys):
+    # Rows of frame that later rows can still have in their window
+    if _is_time_window(window):
+        last = frame[on].iloc[-1]
+        return frame[frame[on] > last - pd.Timedelta(window)]
+    size = int(window) - 1
+    if size <= 0:
+        return frame.iloc[:0]
+    if keys:
+        return frame.groupby(keys, sort=False).tail(size)
+    return frame.iloc[-size:]
+
+
+def _iter_windowed(chunks, window, on, by, compute):
+    keys = _keys(by)
+    tail = None
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        combined = chunk if tail is None or tail.empty else pd.concat([tail, chunk])
+        result = compute(combined)
+        yield result.iloc[len(combined) - len(chunk):]
+        tail = _window_tail(combined, window, on, keys)
+
+
+def iter_rolling_stats(chunks, columns, window, funcs=('mean',), on=None, by=None,
+                       min_periods=None):
+    """
+    Computes rolling statistics over a stream of chunks.
+
+    The rows that can still fall into a later window (window - 1 rows per group,
+    or the last time span) are carried over to the next chunk, so the results are
+    identical to rolling_stats on the whole data while memory stays bounded by the
+    chunk and window size.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive chunks, e.g. from
+            data_loader.iter_data_chunks; sorted by on for time-based windows.
+        columns, window, funcs, on, by, min_periods: See rolling_stats.
+
+    Yields:
+        pd.DataFrame: The statistics for the rows of each chunk.
+    """
+    return _iter_windowed(
+        chunks, window, on, by,
+        lambda df: rolling_stats(df, columns, window, funcs, on=on, by=by,
+                                 min_periods=min_periods))
+
+
+def iter_rolling_correlation(chunks, x_col, y_col, window, on=None, by=None, min_periods=None):
+    """
+    Computes a rolling correlation over a stream of chunks, see iter_rolling_stats.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive chunks.
+        x_col, y_col, window, on, by, min_periods: See rolling_correlation.
+
+    Yields:
+        pd.Series: The correlation for the rows of each chunk.
+    """
+    return _iter_windowed(
+        chunks, window, on, by,
+        lambda df: rolling_correlation(df, x_col, y_col, window, on=on, by=by,
+                                       min_periods=min_periods))
+
+
+def iter_resample(chunks, on, freq, agg='mean', columns=None, by=None):
+    """
+    Resamples a stream of chunks sorted by time.
+
+    Rows of the last, possibly incomplete bucket of a chunk are carried over to the
+    next one, so every bucket is emitted once and matches resample_time.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Consecutive chunks sorted by on.
+        on, freq, agg, columns, by: See resample_time. freq must be a fixed span
+            (e.g. '1h' or '1D', not month ends).
+
+    Yields:
+        pd.DataFrame: The completed buckets of each chunk.
+
+    Raises:
+        ValueError: If freq is not a fixed time span.
+    """
+    try:
+        pd.Timedelta(freq)
+    except ValueError:
+        raise ValueError(f"Streaming resampling needs a fixed frequency, got: {freq}")
+
+    carry = None
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        combined = chunk if carry is None or carry.empty else pd.concat([carry, chunk])
+        boundary = combined[on].iloc[-1].floor(freq)
+        done = combined[combined[on] < boundary]
+        carry = combined[combined[on] >= boundary]
+        if len(done):
+            yield resample_time(done, on, freq, agg=agg, columns=columns, by=by)
+    if carry is not None and len(carry):
+        yield resample_time(carry, on, freq, agg=agg, columns=columns, by=by)
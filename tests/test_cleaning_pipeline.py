@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from modules.cleaning_pipeline import CleaningPipeline
+from modules.data_cleaner import clean_missing_values
+
+
+def test_replay_with_a_column_loaded_later():
+    # The steps were applied to 'a' only; 'b' is joined afterwards and replayed
+    loaded = pd.DataFrame({'a': [1.0, 1.0, 2.0, 3.0, 4.0]})
+    pipeline = CleaningPipeline()
+    pipeline.add_step('remove_duplicates', subset=['a'], keep='first')
+    pipeline.add_step('clean_missing_values', method='drop', fill_value=None, columns=['a'])
+    pipeline.add_step('remove_outliers', columns=['a'], method='isolation_forest', factor=0.9)
+    cleaned = pipeline.apply(loaded)
+
+    widened = loaded.join(pd.DataFrame({'b': [1, 2, np.nan, 4, 1000]}))
+    assert pipeline.apply(widened).index.tolist() == cleaned.index.tolist()
+
+
+def test_clean_missing_values_columns():
+    df = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': [np.nan, 2.0, np.nan]})
+    assert clean_missing_values(df, 'drop', columns=['a']).index.tolist() == [0, 2]
+    filled = clean_missing_values(df, 'mean', columns=['a'])
+    assert filled['a'].tolist() == [1.0, 2.0, 3.0]
+    assert filled['b'].isna().sum() == 2
+    assert clean_missing_values(df, 'ffill', columns=['b'])['b'].tolist()[1:] == [2.0, 2.0]
+    assert clean_missing_values(df, 'constant', 0, columns=['b'])['a'].isna().sum() == 1
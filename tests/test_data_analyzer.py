@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data_analyzer import correlation_pairs
+
+
+@pytest.fixture
+def sparse_wide():
+    # Correlated columns with 10% missing values; a few rounded ones have ties
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(500, 1)) + rng.normal(size=(500, 40)) * 2
+    df = pd.DataFrame(values, columns=[f"c{i}" for i in range(40)])
+    df.iloc[:, :5] = df.iloc[:, :5].round(0)
+    return df.mask(rng.random(df.shape) < 0.1)
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+@pytest.mark.parametrize('block_size', [7, 256])
+def test_correlation_pairs_match_pairwise_corr(sparse_wide, method, block_size):
+    expected = sparse_wide.corr(method=method)
+    result = correlation_pairs(sparse_wide, method=method, top_k=3, block_size=block_size)
+
+    for row in result.itertuples():
+        assert row.correlation == pytest.approx(expected.loc[row.column_1, row.column_2],
+                                                abs=1e-12)
+    off_diagonal = expected.where(~np.eye(len(expected), dtype=bool)).abs()
+    for col, partners in result.groupby('column_1')['column_2']:
+        assert set(partners) == set(off_diagonal[col].nlargest(3).index)
+
+
+def test_correlation_pairs_threshold_spearman(sparse_wide):
+    expected = sparse_wide.corr(method='spearman').abs().to_numpy()
+    result = correlation_pairs(sparse_wide, method='spearman', threshold=0.1, block_size=16)
+    assert len(result) == ((expected >= 0.1).sum() - len(expected)) // 2
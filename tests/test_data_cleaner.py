@@ -0,0 +1,52 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from modules.data_cleaner import clip_outliers, outlier_bounds, outlier_bounds_from_chunks
+
+
+def test_clip_outliers_keeps_integer_dtypes():
+    df = pd.DataFrame({'a': [1, 2, 3, 4, 100], 'b': [1, 2, 3, 4, 5],
+                       'c': pd.array([1, 2, None, 4, 100], dtype='Int64')})
+    clipped = clip_outliers(df, bounds={'a': [0.5, 9.5], 'b': [0.5, 9.5], 'c': [-0.5, 9.5]})
+    assert clipped.dtypes.tolist() == df.dtypes.tolist()
+    assert clipped['a'].tolist() == [1, 2, 3, 4, 9]
+    assert clipped['c'].tolist()[-1] == 9
+    # Columns without outliers are not replaced
+    assert np.shares_memory(clipped['b'].to_numpy(), df['b'].to_numpy())
+
+
+def test_clip_outliers_integer_bounds_between_integers():
+    df = pd.DataFrame({'a': [1, 2, 3]})
+    assert clip_outliers(df, bounds={'a': [2.2, 2.8]})['a'].tolist() == [3, 3, 3]
+
+
+def test_outlier_bounds_skip_empty_columns():
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0, 50.0], 'empty': [np.nan] * 4})
+    for bounds in (outlier_bounds(df), outlier_bounds_from_chunks([df], method='zscore'),
+                   outlier_bounds_from_chunks([df])):
+        assert list(bounds) == ['a']
+        json.dumps(bounds, allow_nan=False)
+    assert clip_outliers(df)['empty'].isna().all()
+
+
+def test_convert_arrow_strings():
+    import pyarrow as pa
+
+    from modules.data_cleaner import convert_column_types, convert_series_type
+
+    text = pd.ArrowDtype(pa.large_string())
+    converted, failed = convert_series_type(pd.Series(['1', '2', 'x', None], dtype=text),
+                                            'numeric')
+    assert failed == 1
+    assert converted.isna().tolist() == [False, False, True, True]
+
+    df = pd.DataFrame({'name': pd.Series(['anna', 'bob', 'carl'], dtype=text),
+                       'num': pd.Series(['1', '2', '3'], dtype=text),
+                       'd': pd.Series(['2024-01-02', '2024-01-03', '2024-01-04'], dtype=text)})
+    result, report = convert_column_types(df, {col: 'auto' for col in df.columns})
+    assert report == {'name': 0, 'num': 0, 'd': 0}
+    assert result['name'].tolist() == ['anna', 'bob', 'carl']
+    assert result['num'].tolist() == [1, 2, 3]
+    assert pd.api.types.is_datetime64_any_dtype(result['d'])
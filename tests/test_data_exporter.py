@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from modules.data_exporter import export_chunks, export_dataframe, iter_frame_chunks
+
+
+@pytest.fixture
+def late_values():
+    # Column 'a' is empty in the first chunk of 3 rows and filled afterwards
+    return pd.DataFrame({'a': pd.Series([None, None, None, 'x', None, 'y'], dtype=object),
+                         'b': [1, 2, 3, 4, 5, 6]})
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_export_column_empty_in_first_chunk(tmp_path, late_values, suffix):
+    path = str(tmp_path / f"out{suffix}")
+    stats = export_dataframe(late_values, path, chunk_size=3)
+
+    read = pd.read_parquet if suffix == '.parquet' else pd.read_feather
+    result = read(path)
+    assert stats['rows'] == 6
+    assert result['a'].tolist()[3] == 'x'
+    assert result['a'].isna().sum() == 4
+    assert result['b'].tolist() == late_values['b'].tolist()
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_export_lazy_chunks_column_empty_in_first_chunk(tmp_path, late_values, suffix):
+    path = str(tmp_path / f"out{suffix}")
+    export_chunks(iter_frame_chunks(late_values, 3), path)
+
+    read = pd.read_parquet if suffix == '.parquet' else pd.read_feather
+    assert read(path)['a'].tolist()[5] == 'y'
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.csv.gz', '.xlsx', '.parquet', '.feather'])
+def test_export_empty_frame(tmp_path, suffix):
+    empty = pd.DataFrame({'a': pd.Series(dtype='int64'), 'b': pd.Series(dtype=object)})
+    path = str(tmp_path / f"out{suffix}")
+    stats = export_dataframe(empty, path)
+    assert stats['rows'] == 0
+    readers = {'.csv': pd.read_csv, '.csv.gz': pd.read_csv, '.xlsx': pd.read_excel,
+               '.parquet': pd.read_parquet, '.feather': pd.read_feather}
+    result = readers[suffix](path)
+    assert list(result.columns) == ['a', 'b']
+    assert len(result) == 0
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.feather'])
+def test_export_no_chunks(tmp_path, suffix):
+    path = str(tmp_path / f"out{suffix}")
+    assert export_chunks(iter([]), path)['rows'] == 0
+
+
+def test_export_pipeline_uses_load_options(tmp_path):
+    from modules.cleaning_pipeline import CleaningPipeline
+    from modules.data_exporter import export_pipeline
+
+    source = str(tmp_path / 'source.csv')
+    pd.DataFrame({'a': [1, 2, 3, 4], 'b': ['w', 'x', 'y', 'z'],
+                  'c': [0.5, 1.5, 2.5, 3.5]}).to_csv(source, index=False)
+    pipeline = CleaningPipeline()
+    pipeline.add_step('filter_data', column='a', condition='<', value=4)
+    path = str(tmp_path / 'out.csv')
+    export_pipeline(source, pipeline, path, usecols=['a', 'b'],
+                    filters=[{'column': 'c', 'condition': '>', 'value': 1}])
+    result = pd.read_csv(path)
+    assert list(result.columns) == ['a', 'b']
+    assert result['a'].tolist() == [2, 3]
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from modules.data_loader import read_csv_fast, sniff_csv
+
+
+@pytest.mark.parametrize('text, encoding', [
+    ("Zażółć gęślą jaźń, łódź", 'cp1250'),
+    ("Řeka teče přes město, čeština je těžká", 'cp1250'),
+    ("Crème brûlée à la française, où est-ce?", 'cp1252'),
+    ("El niño come piña en España", 'cp1252'),
+    ("Smørrebrød på ærø", 'cp1252'),
+    ("Größe über Äpfel", 'cp1252'),
+])
+def test_sniff_single_byte_encoding(tmp_path, text, encoding):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(f"name,value\n{text},1\n".encode(encoding))
+    assert sniff_csv(str(path))['encoding'] == encoding
+
+
+def test_pyarrow_dates_are_datetime64(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = tmp_path / 'dates.csv'
+    path.write_text("day,value\n2024-01-02,1\n2024-02-03,2\n,3\n")
+    df = read_csv_fast(str(path), engine='pyarrow')
+    assert pd.api.types.is_datetime64_dtype(df['day'])
+    assert df['day'].tolist()[:2] == [pd.Timestamp('2024-01-02'), pd.Timestamp('2024-02-03')]
+    assert df['day'].isna().tolist() == [False, False, True]
+
+
+@pytest.fixture
+def headerless(tmp_path):
+    path = tmp_path / 'headerless.csv'
+    path.write_text("1,a,2.5\n2,b,3.5\n3,c,4.5\n")
+    return str(path)
+
+
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_headerless_usecols_keep_positions(headerless, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    df = read_csv_fast(headerless, usecols=[2, 0], engine=engine)
+    assert df.columns.tolist() == [0, 2]
+    assert df[2].tolist() == [2.5, 3.5, 4.5]
+
+
+def test_headerless_load_paths(headerless):
+    from modules.data_loader import load_columns, read_data_file
+
+    assert load_columns(headerless, [1])[1].tolist() == ['a', 'b', 'c']
+    df = read_data_file(headerless, usecols=[0, 1],
+                        filters=[{'column': 2, 'condition': '>', 'value': 3}])
+    assert df.columns.tolist() == [0, 1]
+    assert df[0].tolist() == [2, 3]
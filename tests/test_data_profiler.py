@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+
+from modules.data_profiler import infer_semantic_type
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['2024-01-15', '2023-12-31', '2022-06-01', '2021-02-28'], 'datetime text'),
+    (['12345678901', '98765432109', '55512345678', '44123456789'], 'numeric text'),
+    (['3.14159265', '2.71828182', '1.41421356', '1.73205080'], 'numeric text'),
+    (['555-123-4567', '(555) 987-6543', '+1 555 222 3333', '555.444.5555'], 'phone'),
+    (['+441234567890', '+15551234567', '+33123456789', '+4930123456'], 'phone'),
+    (['a@example.com', 'b@example.org', 'c@test.net', 'd@mail.io'], 'email'),
+])
+def test_infer_semantic_type_of_text(values, expected):
+    assert infer_semantic_type(pd.Series(values, dtype=object)) == expected
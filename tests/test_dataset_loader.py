@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data_cleaner import filter_data
+from modules.dataset_loader import read_dataset
+
+
+@pytest.fixture
+def constant_groups(tmp_path):
+    # Row groups of 3 rows; the second one holds a single value besides missing ones
+    df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 5.0, np.nan, 5.0], 'y': range(6)})
+    path = tmp_path / 'data.parquet'
+    df.to_parquet(path, row_group_size=3, index=False)
+    return df, str(path)
+
+
+@pytest.mark.parametrize('condition, value', [('!=', 5), ('not in', [5])])
+def test_row_group_with_nulls_is_kept(constant_groups, condition, value):
+    df, path = constant_groups
+    expected = filter_data(df, 'x', condition, value)
+    result = read_dataset(path, filters=[{'column': 'x', 'condition': condition, 'value': value}])
+    assert result['y'].tolist() == expected['y'].tolist()
+    assert len(result) == 4
+
+
+def test_row_group_without_nulls_is_skipped(tmp_path):
+    df = pd.DataFrame({'x': [1.0, 2.0, 3.0, 5.0, 5.0, 5.0], 'y': range(6)})
+    path = tmp_path / 'data.parquet'
+    df.to_parquet(path, row_group_size=3, index=False)
+    result = read_dataset(str(path), filters=[{'column': 'x', 'condition': '!=', 'value': 5}])
+    assert result['y'].tolist() == [0, 1, 2]
+    assert result.attrs['dataset_stats']['row_groups_read'] == 1
+
+
+def test_null_partition_is_kept(tmp_path):
+    for region in ('EU', '__HIVE_DEFAULT_PARTITION__'):
+        folder = tmp_path / f'region={region}'
+        folder.mkdir()
+        pd.DataFrame({'y': [1, 2]}).to_parquet(folder / 'part.parquet', index=False)
+    result = read_dataset(str(tmp_path),
+                          filters=[{'column': 'region', 'condition': 'not in', 'value': ['EU']}])
+    assert len(result) == 2
+    assert result['region'].isna().all()
+
+
+@pytest.mark.parametrize('text, usecols', [
+    ('id;name;score\n1;anna;2.5\n2;ben;3.5\n', ['name', 'region']),
+    ('1;anna;2.5\n2;ben;3.5\n', [1, 'region']),
+])
+def test_pruned_csv_dataset_keeps_sniffed_columns(tmp_path, text, usecols):
+    folder = tmp_path / 'region=EU'
+    folder.mkdir()
+    (folder / 'part.csv').write_text(text)
+    kwargs = {'filters': [{'column': 'region', 'condition': '==', 'value': 'US'}]}
+    expected = list(read_dataset(str(tmp_path)).columns)
+
+    assert list(read_dataset(str(tmp_path), **kwargs).columns) == expected
+    result = read_dataset(str(tmp_path), usecols=usecols, **kwargs)
+    assert list(result.columns) == usecols and len(result) == 0
@@ -0,0 +1,65 @@
+import os
+
+import pandas as pd
+import pytest
+
+from modules import excel_loader
+from modules.excel_loader import (_collect_chunks, excel_cache_path, iter_excel_chunks,
+                                   read_excel_fast)
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = str(tmp_path / 'book.xlsx')
+    pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', None]}).to_excel(path, index=False)
+    return path
+
+
+def test_read_excel_fast_is_memory_mapped(tmp_path, workbook):
+    cache_dir = str(tmp_path / 'cache')
+    first = read_excel_fast(workbook, cache_dir=cache_dir)
+    assert os.path.exists(excel_cache_path(workbook, cache_dir=cache_dir))
+    cached = read_excel_fast(workbook, cache_dir=cache_dir)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in cached.dtypes)
+    pd.testing.assert_frame_equal(first, cached)
+    assert cached['a'].tolist() == [1, 2, 3]
+    assert read_excel_fast(workbook, use_cache=False)['b'].tolist()[:2] == ['x', 'y']
+
+
+def test_cache_evicts_least_recently_used(tmp_path, workbook, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    read_excel_fast(workbook, cache_dir=cache_dir)
+    monkeypatch.setattr(excel_loader, 'EXCEL_CACHE_MAX_BYTES', 0)
+    read_excel_fast(workbook, cell_range='A1:A3', cache_dir=cache_dir)
+    assert os.listdir(cache_dir) == [os.path.basename(
+        excel_cache_path(workbook, cell_range='A1:A3', cache_dir=cache_dir))]
+
+
+def test_collect_chunks_promotes_types():
+    chunks = [pd.DataFrame({'a': [1, 2], 'b': pd.Series([None, None], dtype=object)}),
+              pd.DataFrame({'a': [2.5, None], 'b': ['x', None]})]
+    table = _collect_chunks(iter(chunks))
+    assert str(table.schema.field('a').type) == 'double'
+    assert table.column('b').to_pylist() == [None, None, 'x', None]
+
+
+def test_collect_chunks_falls_back_to_pandas():
+    chunks = [pd.DataFrame({'a': [1, 2]}), pd.DataFrame({'a': pd.Series(['x', 3], dtype=object)})]
+    df = _collect_chunks(iter(chunks))
+    assert isinstance(df, pd.DataFrame)
+    assert df['a'].tolist() == [1, 2, 'x', 3]
+
+
+def test_empty_sheet_has_requested_columns(tmp_path):
+    path = str(tmp_path / 'empty.xlsx')
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'a': [1]}).to_excel(writer, sheet_name='data', index=False)
+        pd.DataFrame().to_excel(writer, sheet_name='empty', index=False)
+
+    chunks = list(iter_excel_chunks(path, sheet_name='empty', usecols=['a', 'b']))
+    assert [list(chunk.columns) for chunk in chunks] == [['a', 'b']]
+    assert len(chunks[0]) == 0
+    cache_dir = str(tmp_path / 'cache')
+    for _ in range(2):  # parsed, then from the cache
+        df = read_excel_fast(path, sheet_name='empty', usecols=['a'], cache_dir=cache_dir)
+        assert list(df.columns) == ['a'] and len(df) == 0
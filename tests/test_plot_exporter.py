@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+import pytest
+
+from modules.plot_exporter import export_report, export_reports
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [3.0, 1.0, 2.0]})
+
+
+def test_export_reports_unique_names(tmp_path, frame):
+    charts = [{'type': 'histogram', 'column': 'a'}]
+    jobs = [{'data': frame, 'charts': charts}, {'data': frame, 'charts': charts},
+            {'name': 'sales', 'data': frame, 'charts': charts}]
+    written = export_reports(jobs, str(tmp_path), max_workers=1)
+    assert list(written) == ['report_1', 'report_2', 'sales']
+    files = [path for paths in written.values() for path in paths]
+    assert len(set(files)) == 3
+    assert all(os.path.exists(path) for path in files)
+
+
+def test_export_reports_rejects_colliding_names(tmp_path, frame):
+    jobs = [{'name': 'report_2', 'data': frame, 'charts': []},
+            {'data': frame, 'charts': []}, {'data': frame, 'charts': []}]
+    with pytest.raises(ValueError):
+        export_reports(jobs, str(tmp_path), max_workers=1)
+
+
+def test_correlation_chart_without_numeric_columns(tmp_path):
+    text = pd.DataFrame({'name': ['x', 'y', 'z']})
+    assert export_report(text, [{'type': 'correlation'}], str(tmp_path)) == []
@@ -0,0 +1,19 @@
+import pandas as pd
+import pytest
+
+from modules.session_store import load_session, save_session
+
+
+@pytest.mark.parametrize('arrow_dtypes', [True, False])
+def test_session_keeps_column_labels(tmp_path, arrow_dtypes):
+    # Headerless CSVs are loaded with the column positions as labels
+    df = pd.DataFrame({0: [1, 2], 1: ['a', 'b'], 2: [0.5, None]})
+    mixed = pd.DataFrame([[1, 2, 3, 4]], columns=['name', 1, '1', 2.5])
+    save_session(str(tmp_path), df, cleaned_df=mixed)
+
+    session = load_session(str(tmp_path), arrow_dtypes=arrow_dtypes)
+    assert list(session['df'].columns) == [0, 1, 2]
+    assert session['df'][1].tolist() == ['a', 'b']
+    assert [(type(col), col) for col in session['cleaned_df'].columns] == \
+        [(str, 'name'), (int, 1), (str, '1'), (float, 2.5)]
+    assert session['cleaned_df'].iloc[0].tolist() == [1, 2, 3, 4]
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.window_analyzer import iter_rolling_correlation, rolling_correlation
+
+
+@pytest.fixture
+def level_shift():
+    # 1000 rows around 1e6, then 1000 rows around 5 with a tiny spread
+    rng = np.random.default_rng(0)
+    noise = np.r_[rng.normal(size=1000), rng.normal(scale=1e-3, size=1000)]
+    level = np.r_[np.full(1000, 1e6), np.full(1000, 5.0)]
+    x = level + noise
+    y = level + 0.5 * noise + np.r_[rng.normal(size=1000), rng.normal(scale=1e-3, size=1000)]
+    df = pd.DataFrame({'x': x, 'y': y, 'group': np.arange(2000) % 3,
+                       'time': pd.date_range('2024-01-01', periods=2000, freq='h')})
+    df.loc[[10, 1500], 'y'] = np.nan
+    return df
+
+
+def window_corr(x, y, window):
+    # Correlation of every full window, computed from scratch
+    result = np.full(len(x), np.nan)
+    for end in range(window, len(x) + 1):
+        a, b = x[end - window:end], y[end - window:end]
+        if not (np.isnan(a).any() or np.isnan(b).any()):
+            result[end - 1] = np.corrcoef(a, b)[0, 1]
+    return result
+
+
+def test_rolling_correlation_matches_pandas(level_shift):
+    expected = level_shift['x'].rolling(50).corr(level_shift['y'])
+    result = rolling_correlation(level_shift, 'x', 'y', 50)
+
+    np.testing.assert_array_equal(result.isna(), expected.isna())
+    # pandas' E[xy] - E[x]E[y] loses digits around 1e6; the exact values agree
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-3)
+    exact = window_corr(level_shift['x'].to_numpy(), level_shift['y'].to_numpy(), 50)
+    np.testing.assert_allclose(result.to_numpy(), exact, atol=1e-8)
+
+
+def test_rolling_correlation_groups_and_time_windows(level_shift):
+    result = rolling_correlation(level_shift, 'x', 'y', '2D', on='time', by='group')
+
+    for _, part in level_shift.groupby('group'):
+        indexed = part.set_index('time')
+        expected = indexed['x'].rolling('2D').corr(indexed['y']).clip(-1, 1)
+        np.testing.assert_allclose(result[part.index].to_numpy(), expected.to_numpy(),
+                                   atol=1e-3)
+
+
+def test_iter_rolling_correlation_matches_whole_frame(level_shift):
+    expected = rolling_correlation(level_shift, 'x', 'y', 50, by='group')
+    chunks = (level_shift.iloc[start:start + 300] for start in range(0, 2000, 300))
+    result = pd.concat(iter_rolling_correlation(chunks, 'x', 'y', 50, by='group'))
+
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-8)